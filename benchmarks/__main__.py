@@ -0,0 +1,46 @@
+"""Runs all benchmarks, optionally saving the results and comparing them to an earlier run.
+
+    python -m benchmarks [--quick] [--save results.json] [--compare baseline.json]
+"""
+
+import argparse
+import json
+import platform
+import sys
+
+from benchmarks import bench_client, bench_import, bench_memory, bench_models
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--quick", action="store_true", help="fewer iterations, for a rough picture")
+    parser.add_argument("--save", metavar="PATH", help="write the results as JSON")
+    parser.add_argument("--compare", metavar="PATH", help="show the change against results saved earlier")
+    args = parser.parse_args()
+
+    scale = 5 if args.quick else 1
+    results = {}
+    results.update(bench_import.run(runs=10 // scale))
+    results.update(bench_models.run(releases=100, pages=200 // scale))
+    results.update(bench_memory.run(releases=1000))
+    results.update(bench_client.run(calls=200 // scale))
+
+    baseline = {}
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)["results"]
+
+    for name, value in results.items():
+        line = f"{name:<50} {value:12.2f}"
+        if baseline.get(name):
+            line += f"  {(value - baseline[name]) / baseline[name]:+8.1%}"
+        print(line)
+
+    if args.save:
+        with open(args.save, "w") as f:
+            environment = {"python": sys.version.split()[0], "platform": platform.platform()}
+            json.dump({**environment, "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""Measures the client's throughput and CPU overhead per call against the local mock server.
+
+The server runs in a separate process, so the CPU time measured is the client's alone.
+
+    python -m benchmarks.bench_client [--calls 200] [--threads 8]
+"""
+
+import argparse
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, Iterator, Tuple
+
+from pyxrel import XREL
+from pyxrel.exceptions import CloudflareError, NotFoundError, RateLimitError
+
+
+def expect(error: type, fn: Callable[[], object]) -> Callable[[], None]:
+    def call() -> None:
+        try:
+            fn()
+        except error:
+            return
+        raise AssertionError(f"Expected {error.__name__}")
+
+    return call
+
+
+def scenarios(client: XREL) -> Dict[str, Callable[[], object]]:
+    return {
+        "release/latest": lambda: client.latest(per_page=100),
+        "release/info": lambda: client.release(dirname="Some.Movie.1.2023.German.DL.1080p.WEB.h264-GRP1"),
+        "p2p/releases": lambda: client.p2p_releases(per_page=100),
+        "ext_info/info": lambda: client.ext_info("1"),
+        "comments/get": lambda: client.release.comments("1"),
+        "search/releases": lambda: client.search("Some Movie", limit=25),
+        "error/429": expect(RateLimitError, lambda: client.call("bench/ratelimited")),
+        "error/404": expect(NotFoundError, lambda: client.call("bench/not_found")),
+        "error/cloudflare": expect(CloudflareError, lambda: client.call("bench/cloudflare")),
+    }
+
+
+@contextmanager
+def serve() -> Iterator[str]:
+    """Runs the mock server in a subprocess, yielding its host URL."""
+    process = subprocess.Popen(
+        [sys.executable, "-m", "benchmarks.server", "--port", "0"],
+        cwd=Path(__file__).resolve().parents[1],
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    try:
+        yield process.stdout.readline().strip()
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def measure(fn: Callable[[], object], calls: int) -> Tuple[float, float]:
+    """Returns the calls per second and the client CPU µs per call."""
+    for _ in range(min(calls, 10)):
+        fn()
+
+    wall, cpu = time.perf_counter(), time.process_time()
+    for _ in range(calls):
+        fn()
+    wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+
+    return calls / wall, cpu / calls * 1e6
+
+
+def run(calls: int = 200, threads: int = 8) -> Dict[str, float]:
+    """Returns requests per second and CPU µs per call, by scenario."""
+    results = {}
+    with serve() as host:
+        client = XREL(host)
+        for name, fn in scenarios(client).items():
+            rps, cpu = measure(fn, calls)
+            results[f"client.{name}.rps"] = rps
+            results[f"client.{name}.cpu_us"] = cpu
+
+        # Distinct dirnames, so concurrent requests aren't coalesced into one
+        with ThreadPoolExecutor(threads) as executor:
+            start = time.perf_counter()
+            list(executor.map(lambda i: client.release(dirname=f"Some.Release.{i}-GRP"), range(calls * 2)))
+            results[f"client.release/info.threads_{threads}.rps"] = calls * 2 / (time.perf_counter() - start)
+
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=200, help="calls per scenario")
+    parser.add_argument("--threads", type=int, default=8, help="threads for the concurrent scenario")
+    args = parser.parse_args()
+
+    results = run(args.calls, args.threads)
+    for name, value in results.items():
+        if name.endswith(".rps"):
+            cpu = results.get(name[:-4] + ".cpu_us")
+            print(f"{name[7:-4]:>30}: {value:8.0f} req/s" + (f"  {cpu:8.0f} µs CPU/call" if cpu else ""))
+
+
+if __name__ == "__main__":
+    main()
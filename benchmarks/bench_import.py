@@ -0,0 +1,72 @@
+"""Measures how long `import pyxrel` takes in a fresh interpreter.
+
+With `--max-ms`, exits with status 1 if `import pyxrel` takes longer, e.g. as a CI check. The package
+loads its modules on first use, so importing it must not pull in requests, pydantic or lxml; that is
+checked as well.
+
+    python -m benchmarks.bench_import [--runs 10] [--max-ms 50]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+from typing import Dict, List
+
+MODULES = ("pyxrel", "pyxrel.aio")
+
+SCRIPT = "import time; start = time.perf_counter(); import {module}; print(time.perf_counter() - start)"
+
+HEAVY = ("requests", "pydantic", "lxml", "aiohttp", "numpy")
+
+
+def eager_imports() -> List[str]:
+    """Returns the heavy dependencies loaded by a bare `import pyxrel`."""
+    script = f"import sys, pyxrel; print(' '.join(m for m in {HEAVY!r} if m in sys.modules))"
+    return subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True).stdout.split()
+
+
+def measure(module: str, runs: int) -> float:
+    """Returns the median import time of a module in seconds."""
+    times = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", SCRIPT.format(module=module)], capture_output=True, text=True, check=True
+        ).stdout
+        times.append(float(output))
+
+    return statistics.median(times)
+
+
+def run(runs: int = 10) -> Dict[str, float]:
+    """Returns the median import time in milliseconds, by module."""
+    results = {}
+    for module in MODULES:
+        try:
+            results[f"import.{module}.ms"] = measure(module, runs) * 1000
+        except subprocess.CalledProcessError:
+            pass  # e.g. pyxrel.aio without aiohttp installed
+
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10, help="interpreters to start per module")
+    parser.add_argument("--max-ms", type=float, help="fail if `import pyxrel` takes longer")
+    args = parser.parse_args()
+
+    results = run(args.runs)
+    for name, value in results.items():
+        print(f"{name[7:-3]:>10}: {value:8.2f} ms")
+
+    if args.max_ms is not None:
+        eager = eager_imports()
+        if eager:
+            sys.exit(f"`import pyxrel` loaded {', '.join(eager)}")
+        if results["import.pyxrel.ms"] > args.max_ms:
+            sys.exit(f"`import pyxrel` took {results['import.pyxrel.ms']:.2f} ms, more than {args.max_ms} ms")
+
+
+if __name__ == "__main__":
+    main()
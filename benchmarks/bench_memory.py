@@ -0,0 +1,52 @@
+"""Measures the memory a built `Releases` page keeps alive, per release and mode.
+
+    python -m benchmarks.bench_memory [--releases 1000]
+"""
+
+import argparse
+import gc
+import json
+import tracemalloc
+from typing import Dict
+
+from benchmarks.payloads import page
+from pyxrel.models import Releases
+from pyxrel.utils import build
+
+MODES = ("validate", "construct", "raw")
+
+
+def run(releases: int = 1000) -> Dict[str, float]:
+    """Returns the bytes retained per release, by mode."""
+    body = json.dumps(page(releases)).encode()
+    build(Releases, json.loads(body), "validate")  # warm up pydantic's caches outside the measurement
+
+    results = {}
+    for mode in MODES:
+        gc.collect()
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+
+        built = build(Releases, json.loads(body), mode)
+        gc.collect()
+        retained = tracemalloc.get_traced_memory()[0] - before
+
+        tracemalloc.stop()
+        del built
+
+        results[f"memory.{mode}.bytes_per_release"] = retained / releases
+
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--releases", type=int, default=1000, help="releases per page")
+    args = parser.parse_args()
+
+    for name, value in run(args.releases).items():
+        print(f"{name.split('.')[1]:>9}: {value / 1024:8.2f} KiB/release")
+
+
+if __name__ == "__main__":
+    main()
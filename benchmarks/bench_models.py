@@ -0,0 +1,49 @@
+"""Compares the model modes on large synthetic `Releases` pages.
+
+Each round decodes the JSON body and builds the page, like the client does for every response.
+
+    python -m benchmarks.bench_models [--releases 100] [--pages 200]
+"""
+
+import argparse
+import json
+import time
+from typing import Dict
+
+from benchmarks.payloads import page
+from pyxrel.models import Releases
+from pyxrel.utils import build
+
+MODES = ("validate", "construct", "raw")
+
+
+def run(releases: int = 100, pages: int = 200) -> Dict[str, float]:
+    """Returns the µs per release spent decoding and building, by mode."""
+    body = json.dumps(page(releases)).encode()
+    results = {}
+    for mode in MODES:
+        start = time.perf_counter()
+        for _ in range(pages):
+            build(Releases, json.loads(body), mode)
+        elapsed = time.perf_counter() - start
+
+        results[f"models.{mode}.us_per_release"] = elapsed / (pages * releases) * 1e6
+
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--releases", type=int, default=100, help="releases per page")
+    parser.add_argument("--pages", type=int, default=200, help="pages to build per mode")
+    args = parser.parse_args()
+
+    results = run(args.releases, args.pages)
+    baseline = results["models.validate.us_per_release"]
+    for mode in MODES:
+        per_release = results[f"models.{mode}.us_per_release"]
+        print(f"{mode:>9}: {per_release:8.2f} µs/release  ({baseline / per_release:5.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Synthetic API payloads shaped like real xREL.to responses."""
+
+
+def release(i: int) -> dict:
+    return {
+        "id": f"{i:013x}",
+        "dirname": f"Some.Movie.{i}.2023.German.DL.1080p.WEB.h264-GRP{i % 50}",
+        "link_href": f"https://www.xrel.to/movie-nfo/{i}/Some-Movie-{i}.html",
+        "time": 1700000000 - i * 60,
+        "group_name": f"GRP{i % 50}",
+        "size": {"number": 4000 + i, "unit": "MB"},
+        "video_type": "Web",
+        "audio_type": "AC3-Dubbed",
+        "num_ratings": i % 7,
+        "video_rating": 8.5,
+        "ext_info": {
+            "type": "movie",
+            "id": f"{i % 977:x}",
+            "title": f"Some Movie {i % 977}",
+            "link_href": f"https://www.xrel.to/movie/{i % 977}/Some-Movie.html",
+            "rating": 7.4,
+            "num_ratings": 12,
+            "uris": [f"imdb:tt{i:07d}"],
+        },
+        "comments": i % 3,
+        "flags": {"english": False, "fix_rls": False, "nuke_rls": i % 11 == 0, "top_rls": False},
+    }
+
+
+def release_p2p(i: int) -> dict:
+    return {
+        "id": f"{i:013x}",
+        "dirname": f"Some.Movie.{i}.2023.1080p.BluRay.x264-P2P{i % 20}",
+        "link_href": f"https://www.xrel.to/p2p/{i}-Some-Movie/nfo.html",
+        "category": {"meta_cat": "movies", "sub_cat": "hd", "id": "1"},
+        "main_lang": "en",
+        "pub_time": 1700000000 - i * 60,
+        "post_time": 1700000000 - i * 60 + 30,
+        "size_mb": 8000 + i,
+        "group": {"id": f"{i % 20:x}", "name": f"P2P{i % 20}"},
+        "num_ratings": i % 5,
+        "ext_info": release(i)["ext_info"],
+        "comments": i % 4,
+    }
+
+
+def comment(i: int) -> dict:
+    return {
+        "id": f"{i:x}",
+        "time": 1700000000 - i * 600,
+        "author": {"id": f"{i % 97:x}", "name": f"user{i % 97}"},
+        "link_href": f"https://www.xrel.to/comments/{i}.html",
+        "text": "Nice release, thanks! " * (1 + i % 4),
+        "text_preview_html": None,
+        "text_attachments": None,
+        "rating": {"video": 8, "audio": 7},
+        "votes": {"positive": i % 5, "negative": i % 2},
+        "edits": {"count": i % 2, "last": 1700000000 - i * 300},
+    }
+
+
+def ext_info(i: int) -> dict:
+    return {
+        "type": "movie",
+        "id": f"{i:x}",
+        "title": f"Some Movie {i}",
+        "link_href": f"https://www.xrel.to/movie/{i}/Some-Movie.html",
+        "genre": "Drama",
+        "alt_title": None,
+        "cover_url": f"https://www.xrel.to/cover/{i}.jpg",
+        "uris": [f"imdb:tt{i:07d}", f"tmdb:movie:{i}"],
+        "rating": 7.4,
+        "num_ratings": 12,
+        "release_dates": [{"type": "cinema", "date": "2023-05-01"}],
+        "externals": [
+            {"source": {"id": 1, "name": "IMDb"}, "link_url": f"https://www.imdb.com/title/tt{i:07d}/", "plot": "..."}
+        ],
+    }
+
+
+def paged(items: list, total_pages: int = 100) -> dict:
+    return {
+        "total_count": len(items) * total_pages,
+        "pagination": {"current_page": 1, "per_page": len(items), "total_pages": total_pages},
+        "list": items,
+    }
+
+
+def page(per_page: int) -> dict:
+    return paged([release(i) for i in range(per_page)])
+
+
+def page_p2p(per_page: int) -> dict:
+    return paged([release_p2p(i) for i in range(per_page)])
+
+
+def comments(per_page: int) -> dict:
+    return paged([comment(i) for i in range(per_page)], 3)
+
+
+def search(limit: int) -> dict:
+    return {"total": limit, "results": [release(i) for i in range(limit)], "p2p_results": []}
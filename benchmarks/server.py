@@ -0,0 +1,118 @@
+"""A local stand-in for the xREL.to API, serving synthetic payloads from `benchmarks.payloads`.
+
+Besides the regular endpoints, `bench/ratelimited`, `bench/not_found` and `bench/cloudflare` answer
+like the API does when rate limited, for unknown methods (nginx 404 page) and behind a Cloudflare challenge.
+Release lookups of `MISSING_ID` answer like they do for an unknown release.
+
+    python -m benchmarks.server [--port 8080]
+"""
+
+import argparse
+import json
+import socket
+import threading
+import time
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from benchmarks import payloads
+
+CLOUDFLARE = b"<!DOCTYPE html><html><head><title>Just a moment...</title></head><body>Checking...</body></html>"
+NOT_FOUND = b"<html><head><title>404 Not Found</title></head><body><center>nginx</center></body></html>"
+MISSING_ID = "0000000000"
+
+
+def rate_limit(remaining: int) -> Dict[str, str]:
+    """Returns rate limit headers for a window resetting a minute from now, like the API sends."""
+    return {"X-RateLimit-Remaining": str(remaining), "X-RateLimit-Reset": str(int(time.time()) + 60)}
+
+
+@lru_cache(maxsize=None)
+def body(endpoint: str, size: int) -> bytes:
+    """Returns the encoded payload of an endpoint, built once per size."""
+    if endpoint in ("release/latest", "release/browse_category", "release/ext_info"):
+        return json.dumps(payloads.page(size)).encode()
+    if endpoint == "p2p/releases":
+        return json.dumps(payloads.page_p2p(size)).encode()
+    if endpoint == "release/info":
+        return json.dumps(payloads.release(1)).encode()
+    if endpoint == "p2p/rls_info":
+        return json.dumps(payloads.release_p2p(1)).encode()
+    if endpoint == "ext_info/info":
+        return json.dumps(payloads.ext_info(1)).encode()
+    if endpoint == "comments/get":
+        return json.dumps(payloads.comments(size)).encode()
+    if endpoint == "search/releases":
+        return json.dumps(payloads.search(size)).encode()
+
+    raise KeyError(endpoint)
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self) -> None:
+        super().setup()
+        # Headers and body are written separately, Nagle's algorithm would delay the body by ~40 ms
+        self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def log_message(self, *args) -> None:
+        pass
+
+    def respond(self, status: int, content: bytes, content_type: str, headers: Optional[Dict[str, str]] = None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(content)))
+        for name, value in (headers or rate_limit(900)).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(content)
+
+    def do_GET(self) -> None:
+        url = urlsplit(self.path)
+        params = {key: values[0] for key, values in parse_qs(url.query).items()}
+        endpoint = url.path.split("v2/", 1)[-1].strip("/").rsplit(".", 1)[0]
+        size = int(params.get("per_page") or params.get("limit") or 25)
+
+        if endpoint == "bench/ratelimited":
+            return self.respond(429, b'{"error": "rate_limit_exceeded"}', "application/json", rate_limit(0))
+        if endpoint == "bench/cloudflare":
+            return self.respond(403, CLOUDFLARE, "text/html; charset=UTF-8")
+        if endpoint in ("release/info", "p2p/rls_info") and params.get("id") == MISSING_ID:
+            error = {"error": "id_not_found", "error_description": "Release not found."}
+            return self.respond(404, json.dumps(error).encode(), "application/json")
+
+        try:
+            content = body(endpoint, size)
+        except KeyError:
+            return self.respond(404, NOT_FOUND, "text/html")
+
+        self.respond(200, content, "application/json")
+
+
+def start(port: int = 0) -> Tuple[ThreadingHTTPServer, str]:
+    """Serves the API on a background thread, returning the server and its host URL."""
+    server = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=8080, help="0 picks a free port")
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", args.port), Handler)
+    server.daemon_threads = True
+    print(f"http://127.0.0.1:{server.server_address[1]}/", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
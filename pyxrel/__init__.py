@@ -1,11 +1,68 @@
-from .api import XREL
-from .oauth2 import OAuth2
-from .session import Session
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .api import XREL
+    from .cache import Cache, MemoryCache, SQLiteCache
+    from .hosts import HostPool
+    from .metadata import MetadataRegistry
+    from .metrics import Metrics
+    from .oauth2 import FileTokenStore, OAuth2, SQLiteTokenStore
+    from .ratelimit import RateLimiter
+    from .retry import RetryPolicy
+    from .session import Session
+
+# Names are imported from their modules on first access, so `import pyxrel` stays cheap
+_EXPORTS = {
+    "XREL": "api",
+    "Cache": "cache",
+    "FileTokenStore": "oauth2",
+    "HostPool": "hosts",
+    "MemoryCache": "cache",
+    "MetadataRegistry": "metadata",
+    "Metrics": "metrics",
+    "OAuth2": "oauth2",
+    "RateLimiter": "ratelimit",
+    "RetryPolicy": "retry",
+    "Session": "session",
+    "SQLiteCache": "cache",
+    "SQLiteTokenStore": "oauth2",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *_EXPORTS})
 
 
 def new(host: str = "https://api.xrel.to/", client_id: str = None, client_secret: str = None, **request_kwargs):
     """Creates a new xREL client."""
+    from .api import XREL
+
     return XREL(host, client_id, client_secret, **request_kwargs)
 
 
-__all__ = ("XREL", "OAuth2", "Session")
+__all__ = (
+    "XREL",
+    "Cache",
+    "FileTokenStore",
+    "HostPool",
+    "MemoryCache",
+    "MetadataRegistry",
+    "Metrics",
+    "OAuth2",
+    "RateLimiter",
+    "RetryPolicy",
+    "Session",
+    "SQLiteCache",
+    "SQLiteTokenStore",
+)
@@ -0,0 +1,31 @@
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .api import AsyncXREL
+    from .oauth2 import AsyncOAuth2
+    from .session import AsyncSession
+
+# Names are imported from their modules on first access, like in `pyxrel`
+_EXPORTS = {
+    "AsyncXREL": "api",
+    "AsyncOAuth2": "oauth2",
+    "AsyncSession": "session",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *_EXPORTS})
+
+
+__all__ = ("AsyncXREL", "AsyncOAuth2", "AsyncSession")
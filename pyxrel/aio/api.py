@@ -0,0 +1,249 @@
+import asyncio
+from functools import partial
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Optional, Type, Union, Literal
+
+from pyxrel.aio.session import AsyncSession
+from pyxrel.aio.oauth2 import AsyncOAuth2
+from pyxrel.aio.resources import AsyncCalendar, AsyncRelease, AsyncSearch, AsyncExtInfo
+from pyxrel.aio.pagination import paginate
+from pyxrel.aio.utils import call as _call
+from pyxrel.models import (
+    Categories,
+    CategoriesP2P,
+    Filters,
+    Release as ReleaseScene,
+    ReleaseP2P,
+    Releases,
+    ReleasesP2P,
+)
+from pyxrel.mirror import Mirror
+from pyxrel.oauth2 import TokenStore
+from pyxrel.session import Session
+from pyxrel.types import ExtInfoType, ModelMode, ReleaseType, SearchSource
+from pyxrel.utils import M, build, get_rls_type
+
+if TYPE_CHECKING:
+    from lxml import etree as ElementTree
+
+    from pyxrel.metadata import MetadataRegistry
+
+
+class AsyncXREL:
+    """Asyncio client for interacting with the xREL.to API.
+
+    Mirrors `XREL`, but every request method is a coroutine.
+    """
+
+    def __init__(
+        self,
+        host: str = "https://api.xrel.to/",
+        client_id: Optional[str] = None,
+        client_secret: Optional[str] = None,
+        mode: ModelMode = "validate",
+        mirror: Optional[Mirror] = None,
+        search_source: Optional[SearchSource] = None,
+        token_store: Optional[TokenStore] = None,
+        metadata: Optional["MetadataRegistry"] = None,
+        **request_kwargs,  # Keyword arguments for aiohttp.ClientSession.request
+    ) -> None:
+        self.session = AsyncSession(host, **request_kwargs)
+        self.oauth2 = (
+            AsyncOAuth2(client_id, client_secret, self.session, token_store) if client_id and client_secret else None
+        )
+
+        self.mode = mode
+        self.mirror = mirror
+        self.metadata = metadata
+        if metadata is not None and metadata.session is None:
+            metadata.session = Session(self.session.host)
+
+        self.calendar = AsyncCalendar(self.session, mode, mirror)
+        self.ext_info = AsyncExtInfo(self.session, mode, mirror)
+        self.release = AsyncRelease(self.session, self.oauth2, mode, mirror)
+        self.search = AsyncSearch(self.session, mode, mirror, search_source)
+
+    async def __aenter__(self) -> "AsyncXREL":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Closes the underlying session."""
+        await self.session.close()
+
+    async def latest(
+        self,
+        archive: Optional[str] = None,
+        per_page: int = 25,
+        page: int = 1,
+        filter: Optional[str] = None,
+        mode: Optional[ModelMode] = None,
+    ) -> Releases:
+        """Retrieves the latest releases from the xREL API."""
+        filter = await self._check("filter", filter)
+        return self._build(
+            Releases,
+            await self.call(
+                "/release/latest",
+                params={
+                    "archive": archive,
+                    "per_page": per_page,
+                    "page": page,
+                    "filter": filter,
+                },
+            ),
+            mode,
+        )
+
+    async def scene_releases(
+        self,
+        per_page: int = 25,
+        page: int = 1,
+        category_name: Optional[str] = None,
+        ext_info_type: Optional[ExtInfoType] = None,
+        mode: Optional[ModelMode] = None,
+    ) -> Releases:
+        """Retrieves scene releases based on the provided filters."""
+        category_name = await self._check("category_name", category_name)
+        return self._build(
+            Releases,
+            await self.call(
+                "release/browse_category",
+                params={
+                    "per_page": per_page,
+                    "page": page,
+                    "category_name": category_name,
+                    "ext_info_type": ext_info_type,
+                },
+            ),
+            mode,
+        )
+
+    async def p2p_releases(
+        self,
+        per_page: int = 25,
+        page: int = 1,
+        category_id: Optional[str] = None,
+        group_id: Optional[str] = None,
+        ext_info_id: Optional[str] = None,
+        mode: Optional[ModelMode] = None,
+    ) -> ReleasesP2P:
+        """Retrieve P2P/non-scene releases.
+
+        Only one of `category_id`, `group_id` or `ext_info_id` can be provided at a time.
+        """
+        if sum(arg is not None for arg in (category_id, group_id, ext_info_id)) > 1:
+            raise ValueError("Only one of 'category_id', 'group_id', or 'ext_info_id' can be provided at a time.")
+
+        category_id = await self._check("category_id", category_id)
+        return self._build(
+            ReleasesP2P,
+            await self.call(
+                "/p2p/releases",
+                params={
+                    "per_page": per_page,
+                    "page": page,
+                    "category_id": category_id,
+                    "group_id": group_id,
+                    "ext_info_id": ext_info_id,
+                },
+            ),
+            mode,
+        )
+
+    def iter_latest(
+        self,
+        archive: Optional[str] = None,
+        per_page: int = 25,
+        page: int = 1,
+        filter: Optional[str] = None,
+        max_workers: int = 4,
+        max_pages: Optional[int] = None,
+        mode: Optional[ModelMode] = None,
+    ) -> AsyncIterator[ReleaseScene]:
+        """Iterates over the latest releases across all pages, prefetching up to `max_workers` pages concurrently."""
+        fetch = partial(self.latest, archive, per_page, filter=filter, mode=mode)
+        return paginate(lambda page: fetch(page=page), page, max_workers, max_pages)
+
+    def iter_scene_releases(
+        self,
+        per_page: int = 25,
+        page: int = 1,
+        category_name: Optional[str] = None,
+        ext_info_type: Optional[ExtInfoType] = None,
+        max_workers: int = 4,
+        max_pages: Optional[int] = None,
+        mode: Optional[ModelMode] = None,
+    ) -> AsyncIterator[ReleaseScene]:
+        """Iterates over scene releases across all pages, prefetching up to `max_workers` pages concurrently."""
+        fetch = partial(
+            self.scene_releases, per_page, category_name=category_name, ext_info_type=ext_info_type, mode=mode
+        )
+        return paginate(lambda page: fetch(page=page), page, max_workers, max_pages)
+
+    def iter_p2p_releases(
+        self,
+        per_page: int = 25,
+        page: int = 1,
+        category_id: Optional[str] = None,
+        group_id: Optional[str] = None,
+        ext_info_id: Optional[str] = None,
+        max_workers: int = 4,
+        max_pages: Optional[int] = None,
+        mode: Optional[ModelMode] = None,
+    ) -> AsyncIterator[ReleaseP2P]:
+        """Iterates over P2P releases across all pages, prefetching up to `max_workers` pages concurrently."""
+        fetch = partial(
+            self.p2p_releases,
+            per_page,
+            category_id=category_id,
+            group_id=group_id,
+            ext_info_id=ext_info_id,
+            mode=mode,
+        )
+        return paginate(lambda page: fetch(page=page), page, max_workers, max_pages)
+
+    async def categories(
+        self, type: ReleaseType = "scene", mode: Optional[ModelMode] = None
+    ) -> Union[Categories, CategoriesP2P]:
+        """Retrieves a list of release categories, from the metadata registry if there is one."""
+        if self.metadata is not None:
+            response = await self._run(self.metadata.categories, type)
+        else:
+            response = await self.call(f"/{get_rls_type(type, True)}/categories")
+        return self._build(Categories if type == "scene" else CategoriesP2P, {"list": response}, mode)
+
+    async def filters(self, mode: Optional[ModelMode] = None) -> Filters:
+        """Retrieves a list of filters for the search endpoint, from the metadata registry if there is one."""
+        if self.metadata is not None:
+            response = await self._run(self.metadata.filters)
+        else:
+            response = await self.call("release/filters")
+        return self._build(Filters, {"filters": response}, mode)
+
+    async def _check(self, argument: str, value: Any) -> Any:
+        """Checks and resolves an argument with the metadata registry, if there is one."""
+        if value is None or self.metadata is None:
+            return value
+
+        return await self._run(getattr(self.metadata, argument), value)
+
+    @staticmethod
+    async def _run(fn: Callable, *args) -> Any:
+        """Runs a registry lookup in a thread, as it may have to fetch or refresh the metadata."""
+        return await asyncio.get_running_loop().run_in_executor(None, fn, *args)
+
+    def _build(self, model: Type[M], data: dict, mode: Optional[ModelMode] = None) -> M:
+        """Turns response data into a model, using the client's mode unless overridden (see `build`)."""
+        return build(model, data, mode or self.mode, self.mirror, self.session.metrics)
+
+    async def call(
+        self,
+        resource: str,
+        format: Optional[Union[str, Literal[False]]] = "json",
+        scope: Optional[str] = None,
+        **kwargs,
+    ) -> Union[dict, "ElementTree.Element", bytes]:
+        """Makes a request to the xREL.to API."""
+        return await _call(self.session, resource, format, scope, self.oauth2, **kwargs)
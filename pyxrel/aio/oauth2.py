@@ -0,0 +1,76 @@
+import asyncio
+from typing import Dict, Optional
+
+from pyxrel.aio.session import AsyncSession
+from pyxrel.constants import SCOPES
+from pyxrel.exceptions import UnknownScopeError
+from pyxrel.oauth2 import OAuth2, TokenStore
+
+
+class AsyncOAuth2(OAuth2):
+    """Manages OAuth2 authentication and access tokens on an asyncio session.
+
+    Shares its token store, and the refresh-ahead behaviour, with `OAuth2`.
+    """
+
+    def __init__(
+        self,
+        client_id: str,
+        client_secret: str,
+        session: Optional[AsyncSession] = None,
+        store: Optional[TokenStore] = None,
+        refresh_ahead: float = 60,
+        **kwargs,
+    ) -> None:
+        super().__init__(client_id, client_secret, session or AsyncSession(**kwargs), store, refresh_ahead)
+
+        self._async_locks: Dict[str, asyncio.Lock] = {}
+        self._refreshes = set()
+
+    async def get_access_token(self, scope: str) -> str:
+        """Retrieves an access token for the given scope."""
+        if scope not in SCOPES:
+            raise UnknownScopeError(scope)
+
+        cache_key = self._cache_key(scope)
+
+        data = self.store.get(cache_key)
+        if data and not self._is_expired(data):
+            if self._needs_refresh(data) and cache_key not in self._refreshes:
+                self._refreshes.add(cache_key)
+                task = asyncio.ensure_future(self._refresh(scope, cache_key))
+                task.add_done_callback(lambda _: self._refreshes.discard(cache_key))
+            return data["access_token"]
+
+        async with self._async_locks.setdefault(cache_key, asyncio.Lock()):
+            data = self.store.get(cache_key)  # another task may have fetched it meanwhile
+            if not data or self._is_expired(data):
+                data = await self._fetch(scope, cache_key)
+
+        return data["access_token"]
+
+    async def _fetch(self, scope: str, cache_key: str) -> dict:
+        """Requests a new access token and stores it."""
+        response = await self.session.post(
+            "oauth2/token",
+            data={
+                "client_id": self.client_id,
+                "client_secret": self.client_secret,
+                "grant_type": "client_credentials",
+                "scope": scope,
+            },
+        )
+        data = self._token_data(response.json())
+        self.store.set(cache_key, data)
+
+        return data
+
+    async def _refresh(self, scope: str, cache_key: str) -> None:
+        """Replaces a token that is about to expire."""
+        try:
+            async with self._async_locks.setdefault(cache_key, asyncio.Lock()):
+                data = self.store.get(cache_key)
+                if not data or self._needs_refresh(data):
+                    await self._fetch(scope, cache_key)
+        except Exception:
+            pass  # the token is still valid, the next call tries again
@@ -0,0 +1,38 @@
+import asyncio
+from collections import deque
+from itertools import islice
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional
+
+from pyxrel.pagination import items, last_page
+
+
+async def paginate(
+    fetch_page: Callable[[int], Awaitable[Any]],
+    page: int = 1,
+    max_workers: int = 4,
+    max_pages: Optional[int] = None,
+) -> AsyncIterator[Any]:
+    """Yields the items of every page, starting at `page`.
+
+    Async counterpart of `pyxrel.pagination.paginate`: up to `max_workers` following pages are
+    requested concurrently, and at most that many are held ahead of the consumer.
+    """
+    first = await fetch_page(page)
+    for item in items(first):
+        yield item
+
+    pages = iter(range(page + 1, last_page(first, page, max_pages) + 1))
+    pending = deque(asyncio.ensure_future(fetch_page(number)) for number in islice(pages, max(max_workers, 1)))
+    try:
+        while pending:
+            result = await pending.popleft()
+
+            number = next(pages, None)
+            if number is not None:
+                pending.append(asyncio.ensure_future(fetch_page(number)))
+
+            for item in items(result):
+                yield item
+    finally:
+        for task in pending:
+            task.cancel()
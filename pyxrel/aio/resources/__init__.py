@@ -0,0 +1,33 @@
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .calendar import AsyncCalendar
+    from .release import AsyncRelease
+    from .search import AsyncSearch
+    from .extinfo import AsyncExtInfo
+
+# Resources (and the models they use) are imported on first access, like in `pyxrel.resources`
+_EXPORTS = {
+    "AsyncCalendar": "calendar",
+    "AsyncRelease": "release",
+    "AsyncSearch": "search",
+    "AsyncExtInfo": "extinfo",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *_EXPORTS})
+
+
+__all__ = ("AsyncCalendar", "AsyncRelease", "AsyncSearch", "AsyncExtInfo")
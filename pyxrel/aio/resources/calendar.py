@@ -0,0 +1,54 @@
+import time
+from typing import Dict, Iterable, Optional, Tuple
+
+from pyxrel.aio.session import AsyncSession
+from pyxrel.aio.resources.resource import AsyncResource
+from pyxrel.aio.utils import call, gather
+from pyxrel.constants import CACHE_TTLS
+from pyxrel.resources.calendar import UpcomingByCountry, merge_upcoming
+from pyxrel.models import Upcoming
+from pyxrel.mirror import Mirror
+from pyxrel.types import ModelMode
+
+
+class AsyncCalendar(AsyncResource):
+    """Fetches upcoming movies and their releases from the xREL API."""
+
+    def __init__(
+        self, session: Optional[AsyncSession] = None, mode: ModelMode = "validate", mirror: Optional[Mirror] = None
+    ) -> None:
+        super().__init__(session, mode=mode, mirror=mirror)
+        self._merged: Dict[tuple, Tuple[float, UpcomingByCountry]] = {}
+
+    async def upcoming(self, country: str = "de", mode: Optional[ModelMode] = None) -> Upcoming:
+        """Retrieves a list of upcoming movies for a specific country."""
+        response = await call(self.session, "/calendar/upcoming", params={"country": country})
+        return self._build(Upcoming, {"list": response}, mode)
+
+    async def upcoming_many(
+        self,
+        countries: Iterable[str],
+        max_workers: int = 8,
+        ttl: Optional[float] = CACHE_TTLS["calendar/upcoming"],
+        mode: Optional[ModelMode] = None,
+    ) -> UpcomingByCountry:
+        """Retrieves the upcoming movies of several countries at once, merged by Ext Info.
+
+        See `Calendar.upcoming_many`.
+        """
+        countries = list(dict.fromkeys(countries))
+        key = (tuple(sorted(countries)), mode or self.mode)
+        cached = self._merged.get(key)
+        if cached and cached[0] > time.time():
+            return cached[1]
+
+        calendars = await gather(lambda country: self.upcoming(country, mode), countries, max_workers)
+        calendars = list(zip(countries, calendars))
+        upcoming, by_id = merge_upcoming(calendars, mode or self.mode)
+        errors = {country: calendar for country, calendar in calendars if isinstance(calendar, Exception)}
+        result = UpcomingByCountry(upcoming, by_id, errors)
+
+        if ttl and not errors:
+            self._merged[key] = (time.time() + ttl, result)
+
+        return result
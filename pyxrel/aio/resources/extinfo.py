@@ -0,0 +1,72 @@
+from typing import Any, AsyncIterator, Iterable, Optional, Tuple, Union
+
+from pyxrel.aio.session import AsyncSession
+from pyxrel.aio.resources.resource import AsyncResource
+from pyxrel.aio.pagination import paginate
+from pyxrel.aio.utils import call, gather
+from pyxrel.models import MediaList, ExtInfoInfo, Release, Releases
+from pyxrel.mirror import Mirror
+from pyxrel.resources.extinfo import Enrichment, ext_info_ids
+from pyxrel.types import ModelMode
+
+
+class AsyncExtInfo(AsyncResource):
+    """Performs requests for extended information on releases."""
+
+    def __init__(
+        self, session: Optional[AsyncSession] = None, mode: ModelMode = "validate", mirror: Optional[Mirror] = None
+    ) -> None:
+        super().__init__(session, mode=mode, mirror=mirror)
+
+    async def __call__(self, id: str, mode: Optional[ModelMode] = None) -> ExtInfoInfo:
+        """Retrieves information about an Ext Info."""
+        return self._build(ExtInfoInfo, await call(self.session, "/ext_info/info", params={"id": id}), mode)
+
+    async def media(self, id: str, mode: Optional[ModelMode] = None) -> MediaList:
+        """Retrieves media associated with a given Ext Info."""
+        return self._build(MediaList, {"list": await call(self.session, "/ext_info/media", params={"id": id})}, mode)
+
+    async def enrich(
+        self,
+        releases: Iterable[Any],
+        with_media: bool = False,
+        max_workers: int = 8,
+        mode: Optional[ModelMode] = None,
+    ) -> Enrichment:
+        """Retrieves the Ext Infos of many releases at once, and optionally their media.
+
+        See `ExtInfo.enrich`.
+        """
+        ids = ext_info_ids(releases)
+        jobs = [("info", id) for id in ids] + ([("media", id) for id in ids] if with_media else [])
+
+        async def fetch(job: Tuple[str, str]) -> Union[ExtInfoInfo, MediaList]:
+            kind, id = job
+            return await (self(id, mode) if kind == "info" else self.media(id, mode))
+
+        results = await gather(fetch, jobs, max_workers)
+        return Enrichment(dict(zip(ids, results)), dict(zip(ids, results[len(ids) :])))
+
+    async def releases(self, id: str, pre_page: int = 25, page: int = 1, mode: Optional[ModelMode] = None) -> Releases:
+        """Retrieves all releases associated with a given Ext Info."""
+        return self._build(
+            Releases,
+            await call(
+                self.session,
+                "/release/ext_info",
+                params={"id": id, "per_page": pre_page, "page": page},
+            ),
+            mode,
+        )
+
+    def iter_releases(
+        self,
+        id: str,
+        per_page: int = 25,
+        page: int = 1,
+        max_workers: int = 4,
+        max_pages: Optional[int] = None,
+        mode: Optional[ModelMode] = None,
+    ) -> AsyncIterator[Release]:
+        """Iterates over all releases associated with a given Ext Info, prefetching pages concurrently."""
+        return paginate(lambda page: self.releases(id, per_page, page, mode), page, max_workers, max_pages)
@@ -0,0 +1,107 @@
+from typing import AsyncIterator, Iterable, List, Optional, Union
+
+from pyxrel.aio.session import AsyncSession
+from pyxrel.aio.oauth2 import AsyncOAuth2
+from pyxrel.aio.resources.resource import AsyncResource
+from pyxrel.aio.pagination import paginate
+from pyxrel.aio.utils import call, gather
+from pyxrel.models import Release as ReleaseScene, ReleaseP2P, Comment, Comments
+from pyxrel.utils import get_rls_type, is_release_id
+from pyxrel.exceptions import NotFoundError
+from pyxrel.mirror import Mirror
+from pyxrel.types import ModelMode, ReleaseType
+
+
+class AsyncRelease(AsyncResource):
+    """Interacts with release-related resources on the XREL API."""
+
+    def __init__(
+        self,
+        session: Optional[AsyncSession] = None,
+        oauth2: Optional[AsyncOAuth2] = None,
+        mode: ModelMode = "validate",
+        mirror: Optional[Mirror] = None,
+    ) -> None:
+        super().__init__(session, oauth2, mode, mirror)
+
+    async def __call__(
+        self,
+        dirname: Optional[str] = None,
+        id: Optional[str] = None,
+        type: ReleaseType = "scene",
+        mode: Optional[ModelMode] = None,
+    ) -> Union[ReleaseScene, ReleaseP2P]:
+        """Retrieves information about a single release."""
+        if dirname is not None and id is not None:
+            raise ValueError("Only one of `dirname` or `id` can be provided at a time.")
+
+        params = {"dirname": dirname} if dirname else {"id": id}
+
+        endpoint = "/release/info" if type == "scene" else "/p2p/rls_info"
+
+        resp = await call(self.session, endpoint, params=params)
+
+        return self._build(ReleaseScene if type == "scene" else ReleaseP2P, resp, mode)
+
+    async def many(
+        self,
+        releases: Iterable[str],
+        type: ReleaseType = "scene",
+        max_workers: int = 8,
+        mode: Optional[ModelMode] = None,
+    ) -> List[Union[ReleaseScene, ReleaseP2P, Exception]]:
+        """Retrieves information about many releases at once.
+
+        `releases` may mix dirnames and API release ids. Duplicates are looked up once, up to `max_workers`
+        lookups run concurrently (paced by the session's rate limiter, if any). Results are returned in input
+        order, with the raised exception in place of a release for failed lookups.
+        """
+        releases = list(releases)
+        unique = list(dict.fromkeys(releases))
+
+        async def lookup(release: str) -> Union[ReleaseScene, ReleaseP2P]:
+            if is_release_id(release):
+                return await self(id=release, type=type, mode=mode)
+            return await self(dirname=release, type=type, mode=mode)
+
+        results = dict(zip(unique, await gather(lookup, unique, max_workers)))
+        return [results[release] for release in releases]
+
+    async def nfo(self, id: str, type: ReleaseType = "scene") -> bytes:
+        """Returns an image of a NFO file for a given API release id."""
+        return await call(
+            session=self.session,
+            resource=f"/nfo/{get_rls_type(type)}",
+            format=False,
+            scope="viewnfo",
+            oauth2=self.oauth2,
+            params={"id": id},
+        )
+
+    async def comments(
+        self, id: str, type: ReleaseType = "scene", page: int = 1, mode: Optional[ModelMode] = None
+    ) -> Comments:
+        """Returns comments for a given API release id."""
+        try:
+            response = await call(
+                session=self.session,
+                resource="/comments/get",
+                format="json",
+                params={"id": id, "type": get_rls_type(type), "page": page},
+            )
+        except NotFoundError:
+            response = {"total_count": 0, "list": []}
+
+        return self._build(Comments, response, mode)
+
+    def iter_comments(
+        self,
+        id: str,
+        type: ReleaseType = "scene",
+        page: int = 1,
+        max_workers: int = 4,
+        max_pages: Optional[int] = None,
+        mode: Optional[ModelMode] = None,
+    ) -> AsyncIterator[Comment]:
+        """Iterates over all comments for a given API release id, prefetching pages concurrently."""
+        return paginate(lambda page: self.comments(id, type, page, mode), page, max_workers, max_pages)
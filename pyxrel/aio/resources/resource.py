@@ -0,0 +1,31 @@
+from abc import ABC
+from typing import Optional, Type
+
+from pyxrel.aio.session import AsyncSession
+from pyxrel.aio.oauth2 import AsyncOAuth2
+from pyxrel.mirror import Mirror
+from pyxrel.types import ModelMode
+from pyxrel.utils import M, build
+
+
+class AsyncResource(ABC):
+    """Base class for asyncio resources interacting with the xREL API."""
+
+    def __init__(
+        self,
+        session: Optional[AsyncSession] = None,
+        oauth2: Optional[AsyncOAuth2] = None,
+        mode: ModelMode = "validate",
+        mirror: Optional[Mirror] = None,
+    ):
+        if not session:
+            session = AsyncSession()
+
+        self.session = session
+        self.oauth2 = oauth2
+        self.mode = mode
+        self.mirror = mirror
+
+    def _build(self, model: Type[M], data: dict, mode: Optional[ModelMode] = None) -> M:
+        """Turns response data into a model, using the resource's mode unless overridden (see `build`)."""
+        return build(model, data, mode or self.mode, self.mirror, self.session.metrics)
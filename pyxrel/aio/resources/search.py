@@ -0,0 +1,140 @@
+from typing import AsyncIterator, Dict, Iterable, List, Optional, Tuple, Union
+
+from pyxrel.aio.session import AsyncSession
+from pyxrel.aio.resources.resource import AsyncResource
+from pyxrel.aio.utils import as_completed, call
+from pyxrel.resources.search import BatchSearchResult, group_queries, merge_results
+from pyxrel.utils import build
+from pyxrel.models import SearchResult, SearchExtInfo
+from pyxrel.mirror import Mirror
+from pyxrel.types import ModelMode, ReleaseType, ExtInfoType, SearchSource
+
+
+class AsyncSearch(AsyncResource):
+    """Performs search queries for Scene and P2P releases.
+
+    With a mirror, queries are answered locally depending on `source`: `local` never asks the API,
+    `local-first` (the default with a mirror) only asks it when the mirror has no results.
+    """
+
+    def __init__(
+        self,
+        session: Optional[AsyncSession] = None,
+        mode: ModelMode = "validate",
+        mirror: Optional[Mirror] = None,
+        source: Optional[SearchSource] = None,
+    ) -> None:
+        super().__init__(session, mode=mode, mirror=mirror)
+        self.source = source or ("local-first" if mirror else "remote")
+
+    def _local(self, source: Optional[SearchSource]) -> Optional[SearchSource]:
+        """Returns the effective source if the mirror should be searched, `None` otherwise."""
+        source = source or self.source
+        if source == "remote":
+            return None
+        if self.mirror is None:
+            raise ValueError(f"Searching with source {source!r} requires a mirror.")
+
+        return source
+
+    async def __call__(
+        self,
+        query: str,
+        limit: int = 25,
+        include: List[ReleaseType] = None,
+        mode: Optional[ModelMode] = None,
+        source: Optional[SearchSource] = None,
+    ) -> SearchResult:
+        """Searches for releases based on the provided query and filters."""
+        if include is None:
+            include = ["scene", "p2p"]
+        if not include:
+            raise ValueError("At least one of 'scene' or 'p2p' must be included.")
+
+        params = {
+            "q": query,
+            "scene": 0,
+            "p2p": 0,
+            "limit": limit,
+        }
+
+        params.update({key: 1 for key in include})
+
+        local = self._local(source)
+        if local:
+            result = self.mirror.search(query, limit, include)
+            if local == "local" or result["total"]:
+                return build(SearchResult, result, mode or self.mode)
+
+        return self._build(SearchResult, await call(self.session, "/search/releases", params=params), mode)
+
+    async def many(
+        self,
+        queries: Iterable[str],
+        limit: int = 25,
+        include: List[ReleaseType] = None,
+        max_workers: int = 8,
+        mode: Optional[ModelMode] = None,
+        source: Optional[SearchSource] = None,
+    ) -> BatchSearchResult:
+        """Searches for releases with many queries at once, merging the results. See `Search.many`."""
+        groups = group_queries(queries)
+        pairs = self.iter_many(groups, limit, include, max_workers, mode, source)
+        results = {query: result async for query, result in pairs}
+
+        return merge_results(groups, ((query, results[query]) for query in groups))
+
+    def iter_many(
+        self,
+        queries: Iterable[str],
+        limit: int = 25,
+        include: List[ReleaseType] = None,
+        max_workers: int = 8,
+        mode: Optional[ModelMode] = None,
+        source: Optional[SearchSource] = None,
+    ) -> AsyncIterator[Tuple[str, Union[SearchResult, Exception]]]:
+        """Like `many`, but yields `(normalized query, result)` pairs as the searches complete."""
+        return as_completed(
+            lambda query: self(query, limit, include, mode, source), group_queries(queries), max_workers
+        )
+
+    async def ext_info(
+        self,
+        query: str,
+        limit: int = 25,
+        type: Optional[ExtInfoType] = None,
+        mode: Optional[ModelMode] = None,
+        source: Optional[SearchSource] = None,
+    ) -> SearchExtInfo:
+        """Searches for Ext Info based on the provided query."""
+        local = self._local(source)
+        if local:
+            result = self.mirror.search_ext_info(query, limit, type)
+            if local == "local" or result["total"]:
+                return build(SearchExtInfo, result, mode or self.mode)
+
+        return self._build(
+            SearchExtInfo,
+            await call(self.session, "/search/ext_info", params={"q": query, "limit": limit, "type": type}),
+            mode,
+        )
+
+    async def ext_info_many(
+        self,
+        queries: Iterable[str],
+        limit: int = 25,
+        type: Optional[ExtInfoType] = None,
+        max_workers: int = 8,
+        mode: Optional[ModelMode] = None,
+        source: Optional[SearchSource] = None,
+    ) -> Dict[str, Union[SearchExtInfo, Exception]]:
+        """Searches for Ext Info with many queries at once. See `Search.ext_info_many`."""
+        groups = group_queries(queries)
+        results = {
+            query: result
+            async for query, result in as_completed(
+                lambda query: self.ext_info(query, limit, type, mode, source), groups, max_workers
+            )
+        }
+
+        return {query: results[normalized] for normalized, originals in groups.items() for query in originals}
@@ -0,0 +1,249 @@
+import asyncio
+import time
+from urllib.parse import urlencode
+from typing import Any, Dict, Optional, Literal
+
+import aiohttp
+import requests
+
+from pyxrel.cache import Cache
+from pyxrel.decoder import decode
+from pyxrel.exceptions import parse_error
+from pyxrel.hosts import HostPool
+from pyxrel.metrics import Metrics
+from pyxrel.ratelimit import RateLimiter
+from pyxrel.retry import RetryPolicy
+from pyxrel.singleflight import request_key
+from pyxrel.aio.singleflight import AsyncSingleFlight
+
+
+class Response:
+    """A fully read aiohttp response, shaped like `requests.Response` for `parse_error`."""
+
+    def __init__(self, url: str, status_code: int, headers: Any, content: bytes) -> None:
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        return decode(self)
+
+
+class AsyncSession:
+    """An asyncio session for interactions with the xREL.to API."""
+
+    def __init__(
+        self,
+        host: Optional[Literal["https://api.xrel.to/", "https://xrel-api.nfos.to/"]] = "https://api.xrel.to/",
+        limit: int = 100,
+        rate_limiter: Optional[RateLimiter] = None,
+        cache: Optional[Cache] = None,
+        coalesce: bool = True,
+        host_pool: Optional[HostPool] = None,
+        retry: Optional[RetryPolicy] = None,
+        metrics: Optional[Metrics] = None,
+        **kwargs,
+    ) -> None:
+        self.headers = {
+            "User-Agent": "Dalvik/2.1.0 (Linux; U; Android 14; SM-S911B Build/UP1A.231005.007)",
+        }
+
+        self.host = host_pool.hosts[0] if host_pool else host
+        self.host_pool = host_pool
+        self.retry = retry
+        self.metrics = metrics
+        self.limit = limit
+        self.rate_limiter = rate_limiter
+        self.cache = cache
+        self.singleflight = AsyncSingleFlight() if coalesce else None
+        self.extra = kwargs
+
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._refreshes = set()
+
+    async def __aenter__(self) -> "AsyncSession":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """The underlying aiohttp session, created on first use inside the running event loop."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                headers=self.headers,
+                connector=aiohttp.TCPConnector(limit=self.limit),
+            )
+
+        return self._session
+
+    async def close(self) -> None:
+        """Closes the underlying aiohttp session."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        **kwargs,
+    ) -> Response:
+        """Sends an HTTP request to the xREL.to API.
+
+        Mirrors `Session.request`: handles host prefixing, default headers and error parsing. Concurrent
+        identical GET requests share one underlying request unless the session was created with `coalesce=False`.
+        """
+        if not url.startswith(self.host):
+            url = requests.compat.urljoin(self.host, "v2/" + url)
+
+        if self.metrics is not None:
+            self.metrics.enter(Cache.endpoint(url))
+
+        if headers is None:
+            headers = {}
+
+        if method == "POST":
+            headers.update(
+                {
+                    "Content-Type": "application/x-www-form-urlencoded",
+                }
+            )
+
+        extra = dict(self.extra)
+        headers.update(extra.pop("headers", {}))
+        kwargs.update(extra)
+
+        # aiohttp refuses `None` values, requests silently drops them
+        for key in ("params", "data"):
+            if isinstance(kwargs.get(key), dict):
+                kwargs[key] = {k: v for k, v in kwargs[key].items() if v is not None}
+
+        if self.singleflight and method == "GET":
+            key = request_key(url, kwargs.get("params"), headers)
+            return await self.singleflight.do(key, lambda: self._fetch(method, url, headers, kwargs))
+
+        return await self._fetch(method, url, headers, kwargs)
+
+    async def _fetch(self, method: str, url: str, headers: Dict[str, str], kwargs: dict) -> Response:
+        """Gets a response from the cache or the API, raising the API error if any.
+
+        Failed attempts are retried as the retry policy allows.
+        """
+        if self.retry is None:
+            response = await self._get(method, url, headers, kwargs)
+            self._parse_error(response)
+
+            return response
+
+        started, attempt = self.retry.clock(), 0
+        while True:
+            try:
+                response = await self._get(method, url, headers, kwargs)
+            except Exception as exc:
+                delay = self.retry.delay(method, url, attempt, started, exception=exc)
+                if delay is None:
+                    raise
+            else:
+                delay = self.retry.delay(method, url, attempt, started, response=response)
+                if delay is None:
+                    self._parse_error(response)  # outside the `try`, the attempt was already counted
+
+                    return response
+
+            attempt += 1
+            if self.metrics is not None:
+                self.metrics.count("retries")
+            await asyncio.sleep(delay)
+
+    def _parse_error(self, response: Response) -> None:
+        """Raises the API error of a response, if any."""
+        if self.metrics is not None:
+            self.metrics.measure("parse_error", parse_error, response)
+        else:
+            parse_error(response)  # will raise an exception if applicable
+
+    async def _get(self, method: str, url: str, headers: Dict[str, str], kwargs: dict) -> Response:
+        """Gets a response from the cache or the API."""
+        ttl = self.cache.ttl(url) if self.cache and method == "GET" else None
+        if ttl:
+            return await self._cached(url, ttl, headers, kwargs)
+
+        return await self._send(method, url, headers, kwargs)
+
+    async def _send(self, method: str, url: str, headers: Dict[str, str], kwargs: dict) -> Response:
+        """Sends a request over the wire, failing over across the hosts of the host pool if any."""
+        if self.host_pool is None or not url.startswith(self.host):
+            return await self._send_to(method, url, headers, kwargs)
+
+        path = url[len(self.host) :]
+        return await self.host_pool.asend(
+            lambda host: self._send_to(method, host + path, headers, kwargs),
+            hedge=method == "GET",
+        )
+
+    async def _send_to(self, method: str, url: str, headers: Dict[str, str], kwargs: dict) -> Response:
+        """Sends a request to one host, paced by the rate limiter."""
+        if self.rate_limiter:
+            delay = self.rate_limiter.reserve()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+        start = time.perf_counter()
+        async with self.session.request(method, url, headers=headers, **kwargs) as resp:
+            response = Response(str(resp.url), resp.status, resp.headers, await resp.read())
+
+        if self.metrics is not None:
+            self.metrics.response(response, time.perf_counter() - start)
+            data = kwargs.get("data")
+            if data:
+                self.metrics.count("bytes_out", len(urlencode(data) if isinstance(data, dict) else data))
+
+        if self.rate_limiter:
+            self.rate_limiter.update(response.headers)
+
+        return response
+
+    async def _cached(self, url: str, ttl: float, headers: Dict[str, str], kwargs: dict) -> Response:
+        """Serves a GET request from the cache, sending and storing it on a miss."""
+        key = self.cache.key(url, kwargs.get("params"))
+
+        entry, fresh = self.cache.lookup(key)
+        if self.metrics is not None:
+            self.metrics.count("cache.miss" if entry is None else "cache.hit" if fresh else "cache.stale_hit")
+
+        if entry is not None:
+            if not fresh and self.cache.begin_refresh(key):
+                task = asyncio.ensure_future(self._refresh(key, url, ttl, headers, kwargs))
+                self._refreshes.add(task)
+                task.add_done_callback(self._refreshes.discard)
+
+            return Response(url, entry.status, requests.structures.CaseInsensitiveDict(entry.headers), entry.content)
+
+        response = await self._send("GET", url, headers, kwargs)
+        self.cache.store(key, ttl, response.status_code, response.headers, response.content)
+
+        return response
+
+    async def _refresh(self, key: str, url: str, ttl: float, headers: Dict[str, str], kwargs: dict) -> None:
+        """Replaces a stale cache entry in the background."""
+        try:
+            response = await self._send("GET", url, headers, kwargs)
+            self.cache.store(key, ttl, response.status_code, response.headers, response.content)
+        except aiohttp.ClientError:
+            pass  # keep serving the stale entry, the next lookup tries again
+        finally:
+            self.cache.end_refresh(key)
+
+    async def get(self, url: str, **kwargs) -> Response:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs) -> Response:
+        return await self.request("POST", url, **kwargs)
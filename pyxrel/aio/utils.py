@@ -0,0 +1,94 @@
+import asyncio
+from functools import partial
+from typing import TYPE_CHECKING, AsyncIterator, Awaitable, Callable, Iterable, List, Optional, Tuple, TypeVar, Union
+
+from pyxrel.aio.session import AsyncSession
+from pyxrel.decoder import decode as decode_json
+from pyxrel.aio.oauth2 import AsyncOAuth2
+
+if TYPE_CHECKING:
+    from lxml import etree as ElementTree
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+async def gather(
+    fn: Callable[[T], Awaitable[R]], items: Iterable[T], max_workers: int = 8
+) -> List[Union[R, Exception]]:
+    """Awaits `fn` for every item, with at most `max_workers` running at once.
+
+    Returns the results in input order, with the raised exception in place of a result for failed items.
+    """
+    semaphore = asyncio.Semaphore(max(max_workers, 1))
+
+    async def run(item: T) -> Union[R, Exception]:
+        async with semaphore:
+            try:
+                return await fn(item)
+            except Exception as e:
+                return e
+
+    return list(await asyncio.gather(*(run(item) for item in items)))
+
+
+async def as_completed(
+    fn: Callable[[T], Awaitable[R]], items: Iterable[T], max_workers: int = 8
+) -> AsyncIterator[Tuple[T, Union[R, Exception]]]:
+    """Awaits `fn` for every item like `gather`, but yields `(item, result)` pairs as they complete.
+
+    Pending items are cancelled when the iterator is closed early.
+    """
+    semaphore = asyncio.Semaphore(max(max_workers, 1))
+
+    async def run(item: T) -> Tuple[T, Union[R, Exception]]:
+        async with semaphore:
+            try:
+                return item, await fn(item)
+            except Exception as e:
+                return item, e
+
+    tasks = [asyncio.ensure_future(run(item)) for item in items]
+    try:
+        for task in asyncio.as_completed(tasks):
+            yield await task
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+async def call(
+    session: AsyncSession,
+    resource: str,
+    format: Optional[str] = "json",
+    scope: Optional[str] = None,
+    oauth2: AsyncOAuth2 = None,
+    **kwargs,
+) -> Union[dict, "ElementTree.Element", bytes]:
+    """Makes a request to the xREL.to API."""
+    if scope:
+        if not oauth2:
+            raise ValueError("No OAuth2 instance provided.")
+
+        kwargs["headers"] = {
+            **kwargs.get("headers", {}),
+            "Authorization": f"Bearer {await oauth2.get_access_token(scope)}",
+        }
+
+    resource += f".{format}" if format else ".json"
+
+    resp = await session.get(resource, **kwargs)
+
+    if format == "json":
+        decode = partial(decode_json, resp)
+    elif format == "xml":
+        from lxml import etree as ElementTree  # XML is rarely used, don't load lxml up front
+
+        decode = partial(ElementTree.fromstring, resp.content)
+    else:
+        return resp.content
+
+    if session.metrics is not None:
+        return session.metrics.measure("decode", decode)
+
+    return decode()
@@ -1,12 +1,29 @@
-from typing import Optional, Union, Literal
-from lxml import etree as ElementTree
+from functools import partial
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, Optional, Type, Union, Literal
 
 from pyxrel.session import Session
-from pyxrel.oauth2 import OAuth2
+from pyxrel.oauth2 import OAuth2, TokenStore
 from pyxrel.resources import Calendar, Release, Search, ExtInfo
-from pyxrel.utils import get_rls_type, call as _call
-from pyxrel.models import Categories, CategoriesP2P, Releases, ReleasesP2P, Filters
-from pyxrel.types import ExtInfoType, ReleaseType
+from pyxrel.utils import M, build, get_rls_type, call as _call, stream as _stream
+from pyxrel.models import (
+    Categories,
+    CategoriesP2P,
+    Filters,
+    Release as ReleaseScene,
+    ReleaseP2P,
+    Releases,
+    ReleasesP2P,
+)
+from pyxrel.pagination import paginate
+from pyxrel.mirror import Mirror
+from pyxrel.types import ExtInfoType, ModelMode, ReleaseType, SearchSource
+
+if TYPE_CHECKING:
+    from lxml import etree as ElementTree
+
+    from pyxrel.comments import CommentSync
+    from pyxrel.follow import Follower
+    from pyxrel.metadata import MetadataRegistry
 
 
 class XREL:
@@ -17,22 +34,42 @@ class XREL:
         host: str = "https://api.xrel.to/",
         client_id: Optional[str] = None,
         client_secret: Optional[str] = None,
+        mode: ModelMode = "validate",
+        mirror: Optional[Mirror] = None,
+        search_source: Optional[SearchSource] = None,
+        token_store: Optional[TokenStore] = None,
+        metadata: Optional["MetadataRegistry"] = None,
         **request_kwargs,  # Keyword arguments for requests.Session.request
     ) -> None:
         self.session = Session(host, **request_kwargs)
-        self.oauth2 = OAuth2(client_id, client_secret, self.session) if client_id and client_secret else None
+        self.oauth2 = (
+            OAuth2(client_id, client_secret, self.session, token_store) if client_id and client_secret else None
+        )
+
+        self.mode = mode
+        self.mirror = mirror
+        self.metadata = metadata
+        if metadata is not None and metadata.session is None:
+            metadata.session = self.session
 
-        self.calendar = Calendar(self.session)
-        self.ext_info = ExtInfo(self.session)
-        self.release = Release(self.session, self.oauth2)
-        self.search = Search(self.session)
+        self.calendar = Calendar(self.session, mode, mirror)
+        self.ext_info = ExtInfo(self.session, mode, mirror)
+        self.release = Release(self.session, self.oauth2, mode, mirror)
+        self.search = Search(self.session, mode, mirror, search_source)
 
     def latest(
-        self, archive: Optional[str] = None, per_page: int = 25, page: int = 1, filter: Optional[str] = None
+        self,
+        archive: Optional[str] = None,
+        per_page: int = 25,
+        page: int = 1,
+        filter: Optional[str] = None,
+        mode: Optional[ModelMode] = None,
     ) -> Releases:
         """Retrieves the latest releases from the xREL API."""
-        return Releases(
-            **self.call(
+        filter = self._check("filter", filter)
+        return self._build(
+            Releases,
+            self.call(
                 "/release/latest",
                 params={
                     "archive": archive,
@@ -40,7 +77,8 @@ class XREL:
                     "page": page,
                     "filter": filter,
                 },
-            )
+            ),
+            mode,
         )
 
     def scene_releases(
@@ -49,10 +87,13 @@ class XREL:
         page: int = 1,
         category_name: Optional[str] = None,
         ext_info_type: Optional[ExtInfoType] = None,
+        mode: Optional[ModelMode] = None,
     ) -> Releases:
         """Retrieves scene releases based on the provided filters."""
-        return Releases(
-            **self.call(
+        category_name = self._check("category_name", category_name)
+        return self._build(
+            Releases,
+            self.call(
                 "release/browse_category",
                 params={
                     "per_page": per_page,
@@ -60,7 +101,8 @@ class XREL:
                     "category_name": category_name,
                     "ext_info_type": ext_info_type,
                 },
-            )
+            ),
+            mode,
         )
 
     def p2p_releases(
@@ -70,6 +112,7 @@ class XREL:
         category_id: Optional[str] = None,
         group_id: Optional[str] = None,
         ext_info_id: Optional[str] = None,
+        mode: Optional[ModelMode] = None,
     ) -> ReleasesP2P:
         """Retrieve P2P/non-scene releases.
 
@@ -84,8 +127,10 @@ class XREL:
         if sum(arg is not None for arg in (category_id, group_id, ext_info_id)) > 1:
             raise ValueError("Only one of 'category_id', 'group_id', or 'ext_info_id' can be provided at a time.")
 
-        return ReleasesP2P(
-            **self.call(
+        category_id = self._check("category_id", category_id)
+        return self._build(
+            ReleasesP2P,
+            self.call(
                 "/p2p/releases",
                 params={
                     "per_page": per_page,
@@ -94,17 +139,168 @@ class XREL:
                     "group_id": group_id,
                     "ext_info_id": ext_info_id,
                 },
-            )
+            ),
+            mode,
+        )
+
+    def iter_latest(
+        self,
+        archive: Optional[str] = None,
+        per_page: int = 25,
+        page: int = 1,
+        filter: Optional[str] = None,
+        max_workers: int = 4,
+        max_pages: Optional[int] = None,
+        mode: Optional[ModelMode] = None,
+    ) -> Iterator[ReleaseScene]:
+        """Iterates over the latest releases across all pages, prefetching up to `max_workers` pages in parallel."""
+        fetch = partial(self.latest, archive, per_page, filter=filter, mode=mode)
+        return paginate(lambda page: fetch(page=page), page, max_workers, max_pages)
+
+    def iter_scene_releases(
+        self,
+        per_page: int = 25,
+        page: int = 1,
+        category_name: Optional[str] = None,
+        ext_info_type: Optional[ExtInfoType] = None,
+        max_workers: int = 4,
+        max_pages: Optional[int] = None,
+        mode: Optional[ModelMode] = None,
+    ) -> Iterator[ReleaseScene]:
+        """Iterates over scene releases across all pages, prefetching up to `max_workers` pages in parallel."""
+        fetch = partial(
+            self.scene_releases, per_page, category_name=category_name, ext_info_type=ext_info_type, mode=mode
+        )
+        return paginate(lambda page: fetch(page=page), page, max_workers, max_pages)
+
+    def iter_p2p_releases(
+        self,
+        per_page: int = 25,
+        page: int = 1,
+        category_id: Optional[str] = None,
+        group_id: Optional[str] = None,
+        ext_info_id: Optional[str] = None,
+        max_workers: int = 4,
+        max_pages: Optional[int] = None,
+        mode: Optional[ModelMode] = None,
+    ) -> Iterator[ReleaseP2P]:
+        """Iterates over P2P releases across all pages, prefetching up to `max_workers` pages in parallel."""
+        fetch = partial(
+            self.p2p_releases,
+            per_page,
+            category_id=category_id,
+            group_id=group_id,
+            ext_info_id=ext_info_id,
+            mode=mode,
+        )
+        return paginate(lambda page: fetch(page=page), page, max_workers, max_pages)
+
+    def stream_latest(
+        self,
+        archive: Optional[str] = None,
+        per_page: int = 100,
+        page: int = 1,
+        filter: Optional[str] = None,
+        mode: Optional[ModelMode] = None,
+    ) -> Iterator[ReleaseScene]:
+        """Streams one page of the latest releases, yielding each release as soon as it has been downloaded.
+
+        Uses the XML format and parses it incrementally, so memory use does not grow with `per_page`.
+        XML values are strings, use the `validate` mode to get them converted.
+        """
+        filter = self._check("filter", filter)
+        items = _stream(
+            self.session,
+            "/release/latest",
+            params={"archive": archive, "per_page": per_page, "page": page, "filter": filter},
         )
+        return (self._build(ReleaseScene, item, mode) for item in items)
+
+    def stream_p2p_releases(
+        self,
+        per_page: int = 100,
+        page: int = 1,
+        category_id: Optional[str] = None,
+        group_id: Optional[str] = None,
+        ext_info_id: Optional[str] = None,
+        mode: Optional[ModelMode] = None,
+    ) -> Iterator[ReleaseP2P]:
+        """Streams one page of P2P releases like `stream_latest`, see `p2p_releases` for the filters."""
+        if sum(arg is not None for arg in (category_id, group_id, ext_info_id)) > 1:
+            raise ValueError("Only one of 'category_id', 'group_id', or 'ext_info_id' can be provided at a time.")
+
+        category_id = self._check("category_id", category_id)
+        items = _stream(
+            self.session,
+            "/p2p/releases",
+            params={
+                "per_page": per_page,
+                "page": page,
+                "category_id": category_id,
+                "group_id": group_id,
+                "ext_info_id": ext_info_id,
+            },
+        )
+        return (self._build(ReleaseP2P, item, mode) for item in items)
+
+    def follow(self, filter: Optional[str] = None, archive: Optional[str] = None, **kwargs) -> "Follower":
+        """Follows the latest releases, see `Follower` for the options.
+
+        >>> for release in client.follow():
+        ...     print(release.dirname)
+        """
+        from pyxrel.follow import Follower
+
+        return Follower(self, filter, archive, **kwargs)
+
+    def comment_sync(self, state: Optional[str] = None, **kwargs) -> "CommentSync":
+        """Tracks the comments of many releases, see `CommentSync` for the options.
+
+        >>> sync = client.comment_sync("comments.json")
+        >>> for id, delta in sync.poll(ids).items():
+        ...     print(id, len(delta.new), len(delta.edited))
+        """
+        from pyxrel.comments import CommentSync
+
+        return CommentSync(self.release, state, **kwargs)
+
+    def crawl_archive(
+        self,
+        months: Iterable[str],
+        sink: Callable[[str, int, Releases], Any],
+        state: Optional[str] = None,
+        **kwargs,
+    ) -> None:
+        """Crawls the release archive of the given months (`YYYY-MM`), see `ArchiveCrawler` for the options."""
+        from pyxrel.crawler import ArchiveCrawler
+
+        ArchiveCrawler(self, months, sink, state, **kwargs).run()
+
+    def categories(
+        self, type: ReleaseType = "scene", mode: Optional[ModelMode] = None
+    ) -> Union[Categories, CategoriesP2P]:
+        """Retrieves a list of release categories, from the metadata registry if there is one."""
+        if self.metadata is not None:
+            response = self.metadata.categories(type)
+        else:
+            response = self.call(f"/{get_rls_type(type, True)}/categories")
+        return self._build(Categories if type == "scene" else CategoriesP2P, {"list": response}, mode)
+
+    def filters(self, mode: Optional[ModelMode] = None) -> Filters:
+        """Retrieves a list of filters for the search endpoint, from the metadata registry if there is one."""
+        response = self.metadata.filters() if self.metadata is not None else self.call("release/filters")
+        return self._build(Filters, {"filters": response}, mode)
+
+    def _check(self, argument: str, value: Any) -> Any:
+        """Checks and resolves an argument with the metadata registry, if there is one."""
+        if value is None or self.metadata is None:
+            return value
 
-    def categories(self, type: ReleaseType = "scene") -> Union[Categories, CategoriesP2P]:
-        """Retrieves a list of release categories."""
-        response = self.call(f"/{get_rls_type(type, True)}/categories")
-        return Categories(list=response) if type == "scene" else CategoriesP2P(list=response)
+        return getattr(self.metadata, argument)(value)
 
-    def filters(self) -> Filters:
-        """Retrieves a list of filters for the search endpoint."""
-        return Filters(filters=self.call("release/filters"))
+    def _build(self, model: Type[M], data: dict, mode: Optional[ModelMode] = None) -> M:
+        """Turns response data into a model, using the client's mode unless overridden (see `build`)."""
+        return build(model, data, mode or self.mode, self.mirror, self.session.metrics)
 
     def call(
         self,
@@ -112,6 +308,6 @@ class XREL:
         format: Optional[Union[str, Literal[False]]] = "json",
         scope: Optional[str] = None,
         **kwargs,
-    ) -> Union[dict, ElementTree.Element, bytes]:
+    ) -> Union[dict, "ElementTree.Element", bytes]:
         """Makes a request to the xREL.to API."""
         return _call(self.session, resource, format, scope, self.oauth2, **kwargs)
@@ -0,0 +1,207 @@
+import json
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Dict, NamedTuple, Optional, Tuple
+from urllib.parse import urlencode, urlsplit
+
+from pyxrel.constants import CACHE_TTLS
+
+
+class CacheEntry(NamedTuple):
+    """A stored HTTP response."""
+
+    status: int
+    headers: Dict[str, str]
+    content: bytes
+    expires_at: float
+
+
+class Cache(ABC):
+    """Base class for HTTP response caches used by `Session`.
+
+    Responses are keyed on the endpoint and its normalized params, and kept for the TTL configured for
+    their endpoint (see `pyxrel.constants.CACHE_TTLS`). Not-found responses are cached as well, for at most
+    `negative_ttl` seconds, so the matching exception is raised again without a request.
+
+    With `stale_ttl`, expired entries are still served for that many seconds while the session refreshes
+    them in the background (stale-while-revalidate).
+    """
+
+    def __init__(
+        self,
+        ttls: Optional[Dict[str, float]] = None,
+        negative_ttl: float = 5 * 60,
+        stale_ttl: float = 0,
+    ) -> None:
+        self.ttls = {**CACHE_TTLS, **(ttls or {})}
+        self.negative_ttl = negative_ttl
+        self.stale_ttl = stale_ttl
+
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+
+        self._refreshing = set()
+        self._lock = threading.Lock()
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Returns the stored entry for a key, expired or not."""
+
+    @abstractmethod
+    def set(self, key: str, entry: CacheEntry) -> None:
+        """Stores an entry."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Removes every entry."""
+
+    @staticmethod
+    def path(url: str) -> str:
+        """Returns the path of an API URL including the format, e.g. `release/info.json`."""
+        return urlsplit(url).path.split("v2/", 1)[-1].strip("/")
+
+    @staticmethod
+    def endpoint(url: str) -> str:
+        """Returns the endpoint of an API URL, e.g. `release/info`."""
+        path = Cache.path(url)
+        return path.rsplit(".", 1)[0] if "." in path else path
+
+    @staticmethod
+    def key(url: str, params: Optional[dict] = None) -> str:
+        """Returns the cache key for a request.
+
+        The key keeps the format, so JSON and XML responses of an endpoint are stored apart.
+        """
+        items = sorted((str(k), str(v)) for k, v in (params or {}).items() if v is not None)
+        return f"{Cache.path(url)}?{urlencode(items)}"
+
+    def ttl(self, url: str) -> Optional[float]:
+        """Returns the TTL for the endpoint of an URL, or `None` if it should not be cached."""
+        return self.ttls.get(self.endpoint(url))
+
+    def lookup(self, key: str) -> Tuple[Optional[CacheEntry], bool]:
+        """Returns a usable entry for a key and whether it is still fresh."""
+        entry = self.get(key)
+        now = time.time()
+
+        with self._lock:
+            if entry is None or entry.expires_at + self.stale_ttl <= now:
+                self.misses += 1
+                return None, False
+
+            if entry.expires_at > now:
+                self.hits += 1
+                return entry, True
+
+            self.stale_hits += 1
+            return entry, False
+
+    def store(self, key: str, ttl: float, status: int, headers: Dict[str, str], content: bytes) -> None:
+        """Stores a response if it is cacheable."""
+        if status == 404:
+            ttl = min(ttl, self.negative_ttl)
+        elif status != 200:
+            return
+
+        self.set(key, CacheEntry(status, dict(headers), content, time.time() + ttl))
+
+    def begin_refresh(self, key: str) -> bool:
+        """Marks a stale key as being refreshed, returns `False` if a refresh is already running."""
+        with self._lock:
+            if key in self._refreshing:
+                return False
+
+            self._refreshing.add(key)
+            return True
+
+    def end_refresh(self, key: str) -> None:
+        with self._lock:
+            self._refreshing.discard(key)
+
+    def stats(self) -> Dict[str, int]:
+        """Returns the hit/miss counters."""
+        return {"hits": self.hits, "stale_hits": self.stale_hits, "misses": self.misses}
+
+
+class MemoryCache(Cache):
+    """An in-process LRU cache holding at most `max_size` responses."""
+
+    def __init__(self, max_size: int = 1024, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+
+            return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class SQLiteCache(Cache):
+    """An on-disk cache that can be shared between processes."""
+
+    def __init__(self, path: str, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.path = path
+        self._local = threading.local()
+
+        with self._connection as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(key TEXT PRIMARY KEY, status INTEGER, headers TEXT, content BLOB, expires_at REAL)"
+            )
+
+    @property
+    def _connection(self) -> sqlite3.Connection:
+        """One connection per thread, sqlite3 connections can't be shared between threads."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+
+        return conn
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        row = self._connection.execute(
+            "SELECT status, headers, content, expires_at FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        status, headers, content, expires_at = row
+        return CacheEntry(status, json.loads(headers), content, expires_at)
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        with self._connection as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                (key, entry.status, json.dumps(entry.headers), entry.content, entry.expires_at),
+            )
+
+    def clear(self) -> None:
+        with self._connection as conn:
+            conn.execute("DELETE FROM responses")
+
+    def purge(self) -> None:
+        """Removes entries that are too old to be served, even stale."""
+        with self._connection as conn:
+            conn.execute("DELETE FROM responses WHERE expires_at + ? <= ?", (self.stale_ttl, time.time()))
@@ -0,0 +1,198 @@
+import json
+import os
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, NamedTuple, Optional, Union
+
+from pyxrel.models import Comment
+from pyxrel.pagination import items
+from pyxrel.types import ModelMode, ReleaseType
+from pyxrel.utils import gather
+
+if TYPE_CHECKING:
+    from pyxrel.resources import Release
+
+
+def _value(item: Any, name: str) -> Any:
+    """Reads a field of a model or a raw dict."""
+    if item is None:
+        return None
+    return item.get(name) if isinstance(item, dict) else getattr(item, name, None)
+
+
+def _int(value: Any) -> int:
+    return int(value) if value is not None else 0
+
+
+class CommentDelta(NamedTuple):
+    """The changes to the comments of a release since the previous sync."""
+
+    id: str
+    new: List[Comment]
+    edited: List[Comment]
+    total_count: int
+
+
+class CommentSync:
+    """Keeps the comment threads of many releases in sync, fetching only the pages that changed.
+
+    For every release, the newest comment (`time` and `id`) and the latest edit (`edits.last`) seen are
+    kept as a watermark, optionally persisted to the JSON `state` file. A sync reads the thread from its
+    newest end and stops at the first page reaching back past the watermark. With `edit_window`, it reads
+    on until comments are older than that many seconds, to pick up edits of recent comments. A thread
+    that did not change therefore costs a single request (two for long threads listed oldest-first).
+
+    The first sync of a release reports all of its comments as new. Releases are synced concurrently by up
+    to `max_workers` threads, paced by the session's rate limiter, if any. The pages of one thread are read
+    one after another.
+    """
+
+    def __init__(
+        self,
+        release: "Release",
+        state: Optional[str] = None,
+        type: ReleaseType = "scene",
+        edit_window: float = 0,
+        max_workers: int = 8,
+        max_pages: Optional[int] = None,
+        mode: Optional[ModelMode] = None,
+    ) -> None:
+        self.release = release
+        self.state = state
+        self.type = type
+        self.edit_window = edit_window
+        self.max_workers = max_workers
+        self.max_pages = max_pages
+        self.mode = mode
+
+        self.watermarks: Dict[str, dict] = self._load()
+        self._lock = threading.Lock()
+
+    def _load(self) -> Dict[str, dict]:
+        """Reads the state file, if any."""
+        if not self.state or not os.path.exists(self.state):
+            return {}
+
+        with open(self.state, "r", encoding="utf-8") as f:
+            data = json.load(f)
+
+        if data.get("type") != self.type:
+            raise ValueError("The state file was written by a sync of a different release `type`.")
+
+        return data["releases"]
+
+    def save(self) -> None:
+        """Writes the state file atomically."""
+        if not self.state:
+            return
+
+        with self._lock:
+            data = {"type": self.type, "releases": dict(self.watermarks)}
+
+        tmp = f"{self.state}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp, self.state)
+
+    def poll(self, ids: Iterable[str]) -> Dict[str, Union[CommentDelta, Exception]]:
+        """Syncs the comments of the given releases and saves the state.
+
+        Returns the delta of every release, or the raised exception for failed ones.
+        """
+        ids = list(dict.fromkeys(ids))
+        deltas = dict(zip(ids, gather(self.poll_one, ids, self.max_workers)))
+        self.save()
+
+        return deltas
+
+    def poll_one(self, id: str) -> CommentDelta:
+        """Syncs the comments of one release, without saving the state."""
+        with self._lock:
+            watermark = self.watermarks.get(id)
+
+        last_time = watermark["time"] if watermark else None
+        last_ids = set(watermark["ids"]) if watermark else set()
+        last_edit = watermark["edit"] if watermark else 0
+
+        # Comments older than this can neither be new nor (still) be edited
+        cutoff = last_time if last_time is not None else -1
+        if watermark and self.edit_window:
+            cutoff = min(cutoff, time.time() - self.edit_window)
+
+        new: List[Comment] = []
+        edited: List[Comment] = []
+        newest, newest_ids, newest_edit = last_time, set(last_ids), last_edit
+
+        pages = self._pages(id, cutoff)
+        first = next(pages)
+        for comments in (first, *pages):
+            for comment in items(comments):
+                comment_id, comment_time = _value(comment, "id"), _int(_value(comment, "time"))
+                edit = _int(_value(_value(comment, "edits"), "last"))
+
+                if last_time is None or comment_time > last_time or (
+                    comment_time == last_time and comment_id not in last_ids
+                ):
+                    new.append(comment)
+                elif edit > last_edit:
+                    edited.append(comment)
+
+                if newest is None or comment_time > newest:
+                    newest, newest_ids = comment_time, {comment_id}
+                elif comment_time == newest:
+                    newest_ids.add(comment_id)
+                newest_edit = max(newest_edit, edit)
+
+        total_count = _int(_value(first, "total_count"))
+        with self._lock:
+            self.watermarks[id] = {
+                "time": newest,
+                "ids": sorted(newest_ids),
+                "edit": newest_edit,
+                "total_count": total_count,
+            }
+
+        new.sort(key=lambda comment: _int(_value(comment, "time")))
+        return CommentDelta(id, new, edited, total_count)
+
+    def _pages(self, id: str, cutoff: float):
+        """Yields the comment pages of a release from the newest end until one reaches the cutoff.
+
+        The first page tells the order of the thread, unless all of its comments share one `time`, then the
+        last page does. If it is oldest-first, the walk continues from the last page backwards. Pages are
+        fetched one after another, as each one decides whether the next is needed.
+        """
+        first = self.release.comments(id, self.type, 1, self.mode)
+        yield first
+
+        pagination = _value(first, "pagination")
+        total_pages = _int(_value(pagination, "total_pages")) or 1
+        comments = items(first)
+        if total_pages <= 1 or not comments:
+            return
+
+        fetched = {}
+        first_time, last_time = _int(_value(comments[0], "time")), _int(_value(comments[-1], "time"))
+        if first_time == last_time:
+            fetched[total_pages] = self.release.comments(id, self.type, total_pages, self.mode)
+            oldest_first = any(_int(_value(comment, "time")) > last_time for comment in items(fetched[total_pages]))
+        else:
+            oldest_first = first_time < last_time
+
+        if oldest_first:
+            order = range(total_pages, 1, -1)
+        else:
+            if last_time <= cutoff:
+                return
+            order = range(2, total_pages + 1)
+
+        for count, page in enumerate(order, 2):
+            if self.max_pages is not None and count > self.max_pages:
+                return
+
+            comments = fetched[page] if page in fetched else self.release.comments(id, self.type, page, self.mode)
+            yield comments
+
+            page_items = items(comments)
+            if not page_items or min(_int(_value(comment, "time")) for comment in page_items) <= cutoff:
+                return
@@ -10,3 +10,27 @@ TYPE_MAP = {
     "scene": "release",
     "p2p": "p2p_rls",
 }
+
+# Default time-to-live (in seconds) of cached responses per endpoint. Endpoints not listed are never cached.
+CACHE_TTLS = {
+    "release/categories": 24 * 60 * 60,
+    "p2p/categories": 24 * 60 * 60,
+    "release/filters": 24 * 60 * 60,
+    "release/info": 60 * 60,
+    "p2p/rls_info": 60 * 60,
+    "ext_info/info": 60 * 60,
+    "ext_info/media": 60 * 60,
+    "calendar/upcoming": 60 * 60,
+    "search/releases": 10 * 60,
+    "search/ext_info": 10 * 60,
+    "comments/get": 5 * 60,
+    "release/ext_info": 5 * 60,
+    "release/browse_category": 5 * 60,
+    "p2p/releases": 5 * 60,
+    "release/latest": 30,
+}
+
+HOSTS = (
+    "https://api.xrel.to/",
+    "https://xrel-api.nfos.to/",
+)
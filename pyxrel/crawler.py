@@ -0,0 +1,165 @@
+import json
+import os
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from pyxrel.models import Releases
+from pyxrel.pagination import last_page
+
+if TYPE_CHECKING:
+    from pyxrel.api import XREL
+
+Unit = Tuple[str, int]  # (month, page)
+
+
+def month_range(start: str, end: str) -> List[str]:
+    """Returns the months from `start` to `end` (inclusive), both as `YYYY-MM`."""
+    year, month = map(int, start.split("-"))
+    end_year, end_month = map(int, end.split("-"))
+
+    months = []
+    while (year, month) <= (end_year, end_month):
+        months.append(f"{year:04d}-{month:02d}")
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+
+    return months
+
+
+class ArchiveCrawler:
+    """Crawls `latest(archive=...)` for many months in parallel, and can resume after an interruption.
+
+    The work is split into (month, page) units, fetched by up to `max_workers` threads (paced by the
+    session's rate limiter, if any). Every finished page is handed to `sink(month, page, releases)` on the
+    calling thread. Progress is checkpointed to the `state` file every `checkpoint_every` pages or
+    `checkpoint_interval` seconds, whichever comes first, and when the crawl stops. A crawl restarted with
+    the same state file only fetches the pages that were not checkpointed yet. Pages that reached the sink
+    after the last checkpoint reach it again if the process dies.
+    """
+
+    def __init__(
+        self,
+        client: "XREL",
+        months: Iterable[str],
+        sink: Callable[[str, int, Releases], Any],
+        state: Optional[str] = None,
+        per_page: int = 100,
+        filter: Optional[str] = None,
+        max_workers: int = 4,
+        checkpoint_every: int = 100,
+        checkpoint_interval: float = 10,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.client = client
+        self.months = list(months)
+        self.sink = sink
+        self.state = state
+        self.per_page = per_page
+        self.filter = filter
+        self.max_workers = max_workers
+        self.checkpoint_every = checkpoint_every
+        self.checkpoint_interval = checkpoint_interval
+        self.clock = clock
+
+        self.progress: Dict[str, dict] = self._load()
+
+    def _load(self) -> Dict[str, dict]:
+        """Reads the checkpoint file, if any."""
+        if not self.state or not os.path.exists(self.state):
+            return {}
+
+        with open(self.state, "r", encoding="utf-8") as f:
+            data = json.load(f)
+
+        if data.get("per_page") != self.per_page or data.get("filter") != self.filter:
+            raise ValueError("The state file was written by a crawl with a different `per_page` or `filter`.")
+
+        return {
+            month: {"total_pages": progress["total_pages"], "done": set(progress["done"])}
+            for month, progress in data["months"].items()
+        }
+
+    def _save(self) -> None:
+        """Writes the checkpoint file atomically."""
+        if not self.state:
+            return
+
+        data = {
+            "per_page": self.per_page,
+            "filter": self.filter,
+            "months": {
+                month: {"total_pages": progress["total_pages"], "done": sorted(progress["done"])}
+                for month, progress in self.progress.items()
+            },
+        }
+
+        tmp = f"{self.state}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp, self.state)
+
+    def pending(self) -> List[Unit]:
+        """Returns the units known to be left. Months that were never started only list their first page."""
+        units = []
+        for month in self.months:
+            progress = self.progress.get(month)
+            if progress is None:
+                units.append((month, 1))
+            else:
+                pages = range(1, progress["total_pages"] + 1)
+                units.extend((month, page) for page in pages if page not in progress["done"])
+
+        return units
+
+    @property
+    def finished(self) -> bool:
+        return all(month in self.progress for month in self.months) and not self.pending()
+
+    def _fetch(self, unit: Unit) -> Releases:
+        month, page = unit
+        return self.client.latest(archive=month, per_page=self.per_page, page=page, filter=self.filter)
+
+    def run(self) -> None:
+        """Crawls every pending unit. Raises the first error after checkpointing the finished units."""
+        queue = deque(self.pending())
+        in_flight: Dict[Future, Unit] = {}
+        error: Optional[BaseException] = None
+
+        unsaved, saved_at = 0, self.clock()
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="pyxrel-crawl") as executor:
+                while queue or in_flight:
+                    while queue and error is None and len(in_flight) < self.max_workers * 2:
+                        unit = queue.popleft()
+                        in_flight[executor.submit(self._fetch, unit)] = unit
+
+                    if not in_flight:
+                        break
+
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        month, page = in_flight.pop(future)
+                        try:
+                            releases = future.result()
+                        except Exception as e:
+                            error = error or e
+                            continue
+
+                        progress = self.progress.get(month)
+                        if progress is None:
+                            progress = self.progress[month] = {"total_pages": last_page(releases), "done": set()}
+                            queue.extend((month, p) for p in range(2, progress["total_pages"] + 1))
+
+                        self.sink(month, page, releases)
+
+                        progress["done"].add(page)
+                        unsaved += 1
+                        if unsaved >= self.checkpoint_every or self.clock() - saved_at >= self.checkpoint_interval:
+                            self._save()
+                            unsaved, saved_at = 0, self.clock()
+        finally:
+            self._save()
+
+        if error is not None:
+            raise error
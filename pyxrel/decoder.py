@@ -0,0 +1,51 @@
+import json
+from typing import Any, Callable, Optional
+
+Loads = Callable[[bytes], Any]
+
+
+def _default() -> Loads:
+    """Picks the fastest JSON decoder installed: orjson, msgspec or the standard library."""
+    try:
+        import orjson
+
+        return orjson.loads
+    except ImportError:
+        pass
+
+    try:
+        import msgspec
+
+        return msgspec.json.Decoder().decode
+    except ImportError:
+        pass
+
+    return json.loads
+
+
+_loads: Loads = _default()
+
+
+def set_decoder(loads: Optional[Loads] = None) -> None:
+    """Replaces the JSON decoder used for API responses, or restores the default with `None`.
+
+    The decoder takes the raw body as bytes and must raise a `ValueError` for invalid JSON.
+    """
+    global _loads
+    _loads = loads or _default()
+
+
+def loads(content: bytes) -> Any:
+    """Decodes a JSON body with the configured decoder."""
+    return _loads(content)
+
+
+def decode(response: Any) -> Any:
+    """Returns the decoded JSON body of a response, decoding it only on the first call."""
+    try:
+        return response._pyxrel_json
+    except AttributeError:
+        pass
+
+    response._pyxrel_json = _loads(response.content)
+    return response._pyxrel_json
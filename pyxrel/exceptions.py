@@ -1,10 +1,9 @@
-import json
 from datetime import datetime
 
 import requests
-from lxml import etree as ElementTree
 
 from pyxrel.constants import SCOPES
+from pyxrel.decoder import decode
 
 
 class XrelToError(Exception):
@@ -126,49 +125,51 @@ class CloudflareError(XrelToError):
 
 
 def parse_error(response: requests.Response):
-    """Parses an error response (if any) and raises the appropriate exception."""
-    error_mapping = {
-        500: InternalServerError("An internal server error occurred."),
-        429: RateLimitError(response) if response.status_code == 429 else None,  # bad code :/ FIXME
-        403: CloudflareError if "Just a moment..." in response.text.lower() else None,
-        401: NotFoundError("The requested method does not exist.") if "nginx" in response.text.lower() else None,
-        404: (
-            NotFoundError("The requested resource was not found.")
-            if response.headers.get("Content-Type").startswith("text/html")
-            else None
-        ),
-    }
-
-    exception = error_mapping.get(response.status_code)
-    if exception:
-        raise exception
-
-    content_type = response.headers.get("Content-Type")
-    try:
-        if content_type.startswith("application/json"):
-            try:
-                response = response.json()
-            except json.decoder.JSONDecodeError:
-                # Can't parse the response as JSON even though it's marked as such. This is
-                # likely due to a faulty API response at oauth2/token. Already reported to
-                # @Doakes on 2024-02-25. So, TODO: remove/ replace after it gets fixed.
-                raise XrelToError(f"An unknown error occurred: {response.text}")
-        elif content_type.startswith("text/xml"):
-            response = {child.tag: child.text for child in ElementTree.fromstring(response.content)}
-        else:
-            return  # Probably an image + no HTTP error -> no error to raise
-
-        if isinstance(response, dict):
-            code = response.get("error")
-            message = response.get("error_description")
-            if code:
-                exc_class = _ERROR_MAP.get(code)
-                if exc_class:
-                    raise exc_class(message)
-
-                raise XrelToError(f"An unknown error occurred: {message}")
-    except json.decoder.JSONDecodeError:
-        raise XrelToError(f"An unknown error occurred: {response.text}")
+    """Parses an error response (if any) and raises the appropriate exception.
+
+    Successful responses are returned from right away, without looking at the body.
+    """
+    status = response.status_code
+    if 200 <= status < 300:
+        return
+
+    content_type = response.headers.get("Content-Type") or ""
+
+    if status == 500:
+        raise InternalServerError("An internal server error occurred.")
+    if status == 429:
+        raise RateLimitError(response)
+    if status == 403 and "just a moment..." in response.text.lower():
+        raise CloudflareError
+    if status == 401 and "nginx" in response.text.lower():
+        raise NotFoundError("The requested method does not exist.")
+    if status == 404 and content_type.startswith("text/html"):
+        raise NotFoundError("The requested resource was not found.")
+
+    if content_type.startswith("application/json"):
+        try:
+            data = decode(response)
+        except ValueError:
+            # Can't parse the response as JSON even though it's marked as such. This is
+            # likely due to a faulty API response at oauth2/token. Already reported to
+            # @Doakes on 2024-02-25. So, TODO: remove/ replace after it gets fixed.
+            raise XrelToError(f"An unknown error occurred: {response.text}")
+    elif content_type.startswith("text/xml"):
+        from lxml import etree as ElementTree
+
+        data = {child.tag: child.text for child in ElementTree.fromstring(response.content)}
+    else:
+        return  # Probably an image + no HTTP error -> no error to raise
+
+    if isinstance(data, dict):
+        code = data.get("error")
+        message = data.get("error_description")
+        if code:
+            exc_class = _ERROR_MAP.get(code)
+            if exc_class:
+                raise exc_class(message)
+
+            raise XrelToError(f"An unknown error occurred: {message}")
 
 
 _ERROR_MAP = {
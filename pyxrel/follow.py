@@ -0,0 +1,141 @@
+import threading
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, List, Optional
+
+from pyxrel.models import Release
+from pyxrel.pagination import items
+
+if TYPE_CHECKING:
+    from pyxrel.api import XREL
+
+
+def _value(release: Any, name: str) -> Any:
+    """Reads a field of a release, either a model or a raw dict."""
+    return release[name] if isinstance(release, dict) else getattr(release, name)
+
+
+class Follower:
+    """Follows `release/latest`, yielding every release once.
+
+    The watermark is the newest release time seen plus the ids of the last `remember` releases. Each
+    poll walks back only as many pages as needed to reach it (at most `max_pages`). The poll interval
+    adapts to the observed release rate, aiming for about `target` new releases per poll, and never
+    polls faster than the session's rate limiter budget allows.
+    """
+
+    def __init__(
+        self,
+        client: "XREL",
+        filter: Optional[str] = None,
+        archive: Optional[str] = None,
+        per_page: int = 25,
+        since: Optional[int] = None,
+        seen: Iterable[str] = (),
+        target: Optional[int] = None,
+        min_interval: float = 5,
+        max_interval: float = 300,
+        max_pages: int = 10,
+        remember: int = 1000,
+    ) -> None:
+        self.client = client
+        self.filter = filter
+        self.archive = archive
+        self.per_page = per_page
+        self.target = target or max(per_page // 2, 1)
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.max_pages = max_pages
+
+        self.since = since
+        self._seen = deque(maxlen=remember)
+        self._seen_ids = set()
+        for id in seen:
+            self._remember(id)
+
+        self.interval = min_interval
+        self.rate: Optional[float] = None  # releases per second
+        self._last_poll: Optional[float] = None
+        self._stop = threading.Event()
+
+    @property
+    def seen(self) -> List[str]:
+        """Ids of the most recently seen releases, to resume a follower with."""
+        return list(self._seen)
+
+    def _remember(self, id: str) -> None:
+        if len(self._seen) == self._seen.maxlen:
+            self._seen_ids.discard(self._seen[0])
+        self._seen.append(id)
+        self._seen_ids.add(id)
+
+    def _is_new(self, release: Any) -> bool:
+        return _value(release, "id") not in self._seen_ids and (
+            self.since is None or _value(release, "time") >= self.since
+        )
+
+    def poll(self) -> List[Release]:
+        """Fetches the releases published since the last poll, oldest first."""
+        new, pages = [], 0
+        polled = set()
+        for page in range(1, self.max_pages + 1):
+            response = self.client.latest(self.archive, self.per_page, page, self.filter)
+            pages += 1
+
+            releases = items(response)
+            fresh = [release for release in releases if self._is_new(release)]
+
+            # Releases published meanwhile push the ones already read onto the next page
+            for release in fresh:
+                id = _value(release, "id")
+                if id not in polled:
+                    polled.add(id)
+                    new.append(release)
+
+            total_pages = _value(_value(response, "pagination"), "total_pages")
+            if self.since is None or len(fresh) < len(releases) or page >= total_pages:
+                break  # caught up with the watermark (or there is none yet)
+
+        new.reverse()
+        for release in new:
+            self._remember(_value(release, "id"))
+            self.since = max(self.since or 0, _value(release, "time"))
+
+        self._adapt(len(new), pages)
+
+        return new
+
+    def _adapt(self, count: int, pages: int) -> None:
+        """Adjusts the poll interval to the release rate and the rate limit budget."""
+        now = time.time()
+        if self._last_poll is not None:
+            rate = count / max(now - self._last_poll, 1e-3)
+            self.rate = rate if self.rate is None else 0.7 * self.rate + 0.3 * rate
+        self._last_poll = now
+
+        if self.rate:
+            interval = self.target / self.rate
+        else:
+            interval = self.interval * 1.5
+
+        limiter = self.client.session.rate_limiter
+        if limiter and limiter.remaining is not None and limiter.reset is not None:
+            budget = limiter.remaining - limiter.margin
+            interval = max(interval, (limiter.reset - now) / max(budget, 1) * pages)
+
+        self.interval = min(max(interval, self.min_interval), self.max_interval)
+
+    def __iter__(self) -> Iterator[Release]:
+        """Polls until `stop` is called, yielding new releases as they appear."""
+        while not self._stop.is_set():
+            yield from self.poll()
+            self._stop.wait(self.interval)
+
+    def run(self, callback: Callable[[Release], Any]) -> None:
+        """Polls until `stop` is called, passing every new release to `callback`."""
+        for release in self:
+            callback(release)
+
+    def stop(self) -> None:
+        """Stops following after the current poll."""
+        self._stop.set()
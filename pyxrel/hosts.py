@@ -0,0 +1,228 @@
+import contextvars
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+from pyxrel.constants import HOSTS
+
+
+def is_failure(response: Any) -> bool:
+    """Checks if a response calls for another host: a server error or a Cloudflare challenge."""
+    if response.status_code >= 500:
+        return True
+
+    return response.status_code == 403 and "just a moment..." in response.text.lower()
+
+
+def _succeeded(outcome: Any) -> bool:
+    """Checks if a finished future or task holds a response that needs no other host."""
+    return outcome.exception() is None and not is_failure(outcome.result())
+
+
+def _completed(fn: Callable, *args) -> Future:
+    """Calls `fn` on the calling thread, returning its outcome as a finished future."""
+    future = Future()
+    try:
+        future.set_result(fn(*args))
+    except Exception as e:
+        future.set_exception(e)
+
+    return future
+
+
+async def _acompleted(awaitable: Awaitable[Any]) -> Any:
+    """Async counterpart of `_completed`."""
+    import asyncio  # only needed by the asyncio client, keep it out of `import pyxrel`
+
+    future = asyncio.get_running_loop().create_future()
+    try:
+        future.set_result(await awaitable)
+    except Exception as e:
+        future.set_exception(e)
+
+    return future
+
+
+class HostStats:
+    """Latency and error history of one host."""
+
+    def __init__(self, window: int = 100) -> None:
+        self.latencies = deque(maxlen=window)
+        self.error_rate = 0.0
+        self.failed_at = 0.0
+
+    def record(self, latency: float, ok: bool) -> None:
+        self.latencies.append(latency)
+        self.error_rate = 0.8 * self.error_rate + (0.0 if ok else 0.2)
+        if not ok:
+            self.failed_at = time.monotonic()
+
+    def percentile(self, percentile: float) -> Optional[float]:
+        """Returns a latency percentile, or `None` without enough samples."""
+        if len(self.latencies) < 10:
+            return None
+
+        ordered = sorted(self.latencies)
+        return ordered[min(int(len(ordered) * percentile / 100), len(ordered) - 1)]
+
+
+class HostPool:
+    """Spreads requests over several API hosts, preferring the healthiest.
+
+    Hosts are ranked by recent failures (a host that failed within `cooldown` seconds goes last), error
+    rate and median latency. A request failing with a connection error, a 5xx or a Cloudflare challenge is
+    retried on the next host. With `hedge_percentile`, a GET that takes longer than that latency percentile
+    of its host gets a duplicate sent to the next host, and the first response wins.
+    """
+
+    def __init__(
+        self,
+        hosts: Iterable[str] = HOSTS,
+        hedge_percentile: Optional[float] = None,
+        cooldown: float = 30,
+        window: int = 100,
+    ) -> None:
+        self.hosts = list(hosts)
+        if not self.hosts:
+            raise ValueError("At least one host must be provided.")
+
+        self.hedge_percentile = hedge_percentile
+        self.cooldown = cooldown
+        self.stats: Dict[str, HostStats] = {host: HostStats(window) for host in self.hosts}
+
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def order(self) -> List[str]:
+        """Returns the hosts, healthiest first."""
+        now = time.monotonic()
+        with self._lock:
+
+            def score(host: str) -> tuple:
+                stats = self.stats[host]
+                median = stats.percentile(50)
+                return (now - stats.failed_at < self.cooldown, stats.error_rate, median or 0.0)
+
+            return sorted(self.hosts, key=score)
+
+    def record(self, host: str, latency: float, ok: bool) -> None:
+        with self._lock:
+            self.stats[host].record(latency, ok)
+
+    def hedge_delay(self, host: str) -> Optional[float]:
+        """Returns how long to wait for a host before hedging, or `None` to not hedge."""
+        if self.hedge_percentile is None or len(self.hosts) < 2:
+            return None
+
+        with self._lock:
+            return self.stats[host].percentile(self.hedge_percentile)
+
+    def _timed(self, send: Callable[[str], Any], host: str) -> Any:
+        start = time.monotonic()
+        try:
+            response = send(host)
+        except Exception:
+            self.record(host, time.monotonic() - start, False)
+            raise
+
+        self.record(host, time.monotonic() - start, not is_failure(response))
+        return response
+
+    def send(self, send: Callable[[str], Any], hedge: bool = False) -> Any:
+        """Sends a request with `send(host)`, failing over (and hedging) across the hosts.
+
+        Every host is tried at most once: after a hedge, failing over skips the backup host as well.
+        """
+        hosts = self.order()
+        index = 0
+        while True:
+            if hedge and index < len(hosts) - 1:
+                outcome, tried = self._hedged(send, hosts[index], hosts[index + 1])
+            else:
+                outcome, tried = _completed(self._timed, send, hosts[index]), 1
+
+            index += tried
+            if _succeeded(outcome) or index >= len(hosts):
+                return outcome.result()
+
+    def _hedged(self, send: Callable[[str], Any], host: str, backup: str) -> Tuple[Future, int]:
+        """Sends a request to `host`, and to `backup` too if `host` is slow to answer.
+
+        Returns the outcome of the first successful request (or of the last failed one) and how many hosts
+        were tried.
+        """
+        delay = self.hedge_delay(host)
+        if delay is None:
+            return _completed(self._timed, send, host), 1
+
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(thread_name_prefix="pyxrel-hedge")
+
+        # run in copies of the caller's context, so e.g. metrics are recorded for the caller's endpoint
+        primary = self._executor.submit(contextvars.copy_context().run, self._timed, send, host)
+        done, _ = wait([primary], timeout=delay)
+        if done:
+            return primary, 1
+
+        pending = {primary, self._executor.submit(contextvars.copy_context().run, self._timed, send, backup)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:  # both may have finished, look at each before settling for a failure
+                if _succeeded(future):
+                    return future, 2
+                failed = future
+
+        return failed, 2
+
+    async def asend(self, send: Callable[[str], Awaitable[Any]], hedge: bool = False) -> Any:
+        """Async counterpart of `send`."""
+        hosts = self.order()
+        index = 0
+        while True:
+            if hedge and index < len(hosts) - 1:
+                outcome, tried = await self._ahedged(send, hosts[index], hosts[index + 1])
+            else:
+                outcome, tried = await _acompleted(self._atimed(send, hosts[index])), 1
+
+            index += tried
+            if _succeeded(outcome) or index >= len(hosts):
+                return outcome.result()
+
+    async def _atimed(self, send: Callable[[str], Awaitable[Any]], host: str) -> Any:
+        start = time.monotonic()
+        try:
+            response = await send(host)
+        except Exception:
+            self.record(host, time.monotonic() - start, False)
+            raise
+
+        self.record(host, time.monotonic() - start, not is_failure(response))
+        return response
+
+    async def _ahedged(self, send: Callable[[str], Awaitable[Any]], host: str, backup: str) -> Tuple[Any, int]:
+        """Async counterpart of `_hedged`, returning a finished task."""
+        import asyncio  # only needed by the asyncio client, keep it out of `import pyxrel`
+
+        delay = self.hedge_delay(host)
+        if delay is None:
+            return await _acompleted(self._atimed(send, host)), 1
+
+        primary = asyncio.ensure_future(self._atimed(send, host))
+        done, _ = await asyncio.wait([primary], timeout=delay)
+        if done:
+            return primary, 1
+
+        pending = {primary, asyncio.ensure_future(self._atimed(send, backup))}
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if _succeeded(task):
+                    for other in pending:
+                        other.cancel()
+                    return task, 2
+                failed = task
+
+        return failed, 2
@@ -0,0 +1,160 @@
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional, Union
+
+from pyxrel.exceptions import InvalidArgumentError
+from pyxrel.session import Session
+from pyxrel.types import ReleaseType
+from pyxrel.utils import call, gather
+
+# Response data kept in a snapshot, by endpoint
+_RESOURCES = {
+    "categories": "release/categories",
+    "p2p_categories": "p2p/categories",
+    "filters": "release/filters",
+}
+
+
+class MetadataRegistry:
+    """Keeps the release categories and filters, which hardly ever change, and checks arguments against them.
+
+    The metadata is read from the JSON snapshot at `path`, if any, and only fetched when there is none. Once
+    a snapshot is older than `ttl` seconds it is still used, but refreshed in the background. An argument
+    that is not in the snapshot raises `InvalidArgumentError` without a request, unless the snapshot is older
+    than `miss_refresh` seconds, in which case it is refreshed first in case the value was added since.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        ttl: float = 7 * 24 * 3600,
+        miss_refresh: float = 3600,
+        session: Optional[Session] = None,
+    ) -> None:
+        self.path = path
+        self.ttl = ttl
+        self.miss_refresh = miss_refresh
+        self.session = session
+
+        self._data: Optional[Dict[str, Any]] = None
+        self._index: Dict[str, Dict[str, str]] = {}
+        self._lock = threading.Lock()
+        self._refreshing = threading.Lock()
+
+    def categories(self, type: ReleaseType = "scene") -> List[dict]:
+        """Returns the scene or P2P categories, as the API returned them."""
+        return self._get()["categories" if type == "scene" else "p2p_categories"]
+
+    def filters(self) -> List[dict]:
+        """Returns the filters for `latest`, as the API returned them."""
+        return self._get()["filters"]
+
+    def category_name(self, name: str) -> str:
+        """Resolves a scene category name, ignoring case."""
+        return self._resolve(name, "category name")
+
+    def category_id(self, id: str) -> str:
+        """Checks a P2P category id."""
+        return self._resolve(id, "P2P category id")
+
+    def filter(self, filter: Union[str, int]) -> str:
+        """Resolves a filter id or name (ignoring case) to its id."""
+        return self._resolve(filter, "filter")
+
+    def refresh(self) -> None:
+        """Fetches the metadata and writes the snapshot."""
+        session = self.session or Session()
+        responses = gather(lambda resource: call(session, resource), _RESOURCES.values(), len(_RESOURCES))
+        for response in responses:
+            if isinstance(response, Exception):
+                raise response
+
+        data = {"fetched_at": time.time(), **dict(zip(_RESOURCES, responses))}
+        with self._lock:
+            self._set(data)
+
+        if self.path:
+            tmp = f"{self.path}.tmp.{os.getpid()}.{threading.get_ident()}"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp, self.path)
+
+    def _get(self) -> Dict[str, Any]:
+        """Returns the metadata, loading or fetching it first if needed."""
+        data = self._data
+        if data is None:
+            with self._lock:
+                if self._data is None:
+                    self._set(self._load())
+                data = self._data
+
+            if data is None:
+                with self._refreshing:
+                    if self._data is None:  # another thread may have fetched it meanwhile
+                        self.refresh()
+                data = self._data
+
+        if data["fetched_at"] + self.ttl < time.time() and not self._refreshing.locked():
+            threading.Thread(target=self._refresh_in_background, daemon=True).start()
+
+        return data
+
+    def _load(self) -> Optional[Dict[str, Any]]:
+        """Reads the snapshot, if there is a complete one."""
+        if not self.path or not os.path.exists(self.path):
+            return None
+
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except ValueError:
+            return None
+
+        return data if "fetched_at" in data and all(key in data for key in _RESOURCES) else None
+
+    def _refresh_in_background(self) -> None:
+        """Replaces a stale snapshot, unless another thread already does."""
+        if not self._refreshing.acquire(blocking=False):
+            return
+
+        try:
+            if self._data is None or self._data["fetched_at"] + self.ttl < time.time():
+                self.refresh()
+        except Exception:
+            pass  # the stale snapshot is still used, the next lookup tries again
+        finally:
+            self._refreshing.release()
+
+    def _set(self, data: Optional[Dict[str, Any]]) -> None:
+        """Replaces the metadata and the lookup tables built from it."""
+        if data is None:
+            return
+
+        filters = {}
+        for item in data["filters"]:
+            filters[item["name"].lower()] = filters[str(item["id"])] = str(item["id"])
+
+        p2p_ids = (str(category["id"]) for category in data["p2p_categories"])
+        self._index = {
+            "category name": {category["name"].lower(): category["name"] for category in data["categories"]},
+            "P2P category id": {id.lower(): id for id in p2p_ids},
+            "filter": filters,
+        }
+        self._data = data
+
+    def _resolve(self, value: Union[str, int], kind: str) -> str:
+        """Looks a value up, refreshing an old snapshot once before rejecting it."""
+        data = self._get()
+        resolved = self._index[kind].get(str(value).lower())
+        if resolved is None and data["fetched_at"] + self.miss_refresh < time.time():
+            with self._refreshing:
+                if self._data["fetched_at"] + self.miss_refresh < time.time():
+                    self.refresh()
+            resolved = self._index[kind].get(str(value).lower())
+
+        if resolved is None:
+            raise InvalidArgumentError(f"Unknown {kind}: {value!r}.")
+
+        return resolved
@@ -0,0 +1,173 @@
+import bisect
+import threading
+import time
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+# Upper bounds of the latency histogram buckets, in seconds
+BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+_endpoint: ContextVar[str] = ContextVar("pyxrel_endpoint", default="unknown")
+
+
+class Sample(NamedTuple):
+    """One measurement, as passed to hooks.
+
+    `kind` is `timing` (seconds of a phase), `counter` (an increment) or `gauge` (a current value).
+    """
+
+    kind: str
+    endpoint: str
+    name: str
+    value: float
+
+
+class Histogram:
+    """A latency histogram with fixed buckets."""
+
+    def __init__(self, buckets: Tuple[float, ...] = BUCKETS) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def percentile(self, percentile: float) -> float:
+        """Returns the upper bound of the bucket holding the percentile (the maximum for the last bucket)."""
+        rank = self.count * percentile / 100
+        seen = 0
+        for bound, count in zip(self.buckets, self.counts):
+            seen += count
+            if seen >= rank and count:
+                return min(bound, self.max)
+
+        return self.max
+
+    def snapshot(self) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "total": self.total,
+            "mean": self.total / self.count if self.count else 0.0,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+            "max": self.max,
+        }
+
+
+class Metrics:
+    """Collects per-endpoint metrics of a session.
+
+    Pass an instance to `Session`/`AsyncSession` (or the clients) as `metrics`. Recorded are latency
+    histograms for the phases of a request (`network`, `parse_error`, `decode` and `validation`),
+    request and response bytes, status codes, the remaining rate limit, retries and cache hits.
+
+    `snapshot()` returns everything collected so far, and every sample is passed to the `hooks`, e.g. to
+    forward it to statsd or Prometheus. Sessions without metrics skip all of this.
+    """
+
+    def __init__(self, hooks: Iterable[Callable[[Sample], Any]] = (), buckets: Tuple[float, ...] = BUCKETS) -> None:
+        self.hooks: List[Callable[[Sample], Any]] = list(hooks)
+        self.buckets = buckets
+
+        self._histograms: Dict[Tuple[str, str], Histogram] = {}
+        self._counters: Dict[Tuple[str, str], float] = {}
+        self._gauges: Dict[Tuple[str, str], float] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def endpoint() -> str:
+        """Returns the endpoint of the request currently being handled in this thread or task."""
+        return _endpoint.get()
+
+    @staticmethod
+    def enter(endpoint: str) -> None:
+        """Marks the endpoint later samples of this thread or task (e.g. validation) are recorded for."""
+        _endpoint.set(endpoint)
+
+    def timing(self, phase: str, seconds: float, endpoint: Optional[str] = None) -> None:
+        endpoint = endpoint or _endpoint.get()
+        with self._lock:
+            histogram = self._histograms.get((endpoint, phase))
+            if histogram is None:
+                histogram = self._histograms[endpoint, phase] = Histogram(self.buckets)
+            histogram.add(seconds)
+
+        self._emit(Sample("timing", endpoint, phase, seconds))
+
+    def count(self, name: str, value: float = 1, endpoint: Optional[str] = None) -> None:
+        endpoint = endpoint or _endpoint.get()
+        with self._lock:
+            self._counters[endpoint, name] = self._counters.get((endpoint, name), 0) + value
+
+        self._emit(Sample("counter", endpoint, name, value))
+
+    def gauge(self, name: str, value: float, endpoint: Optional[str] = None) -> None:
+        endpoint = endpoint or _endpoint.get()
+        with self._lock:
+            self._gauges[endpoint, name] = value
+
+        self._emit(Sample("gauge", endpoint, name, value))
+
+    def measure(self, phase: str, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """Calls `fn`, recording its duration as the given phase of the current endpoint."""
+        start = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            self.timing(phase, time.perf_counter() - start)
+
+    def response(self, response: Any, seconds: float, stream: bool = False) -> None:
+        """Records a response received from the API."""
+        self.timing("network", seconds)
+        self.count(f"status.{response.status_code}")
+
+        request = getattr(response, "request", None)
+        body = getattr(request, "body", None)
+        if body:
+            self.count("bytes_out", len(body))
+
+        if stream:
+            size = response.headers.get("Content-Length")
+            if size and size.isdigit():
+                self.count("bytes_in", int(size))
+        else:
+            self.count("bytes_in", len(response.content))
+
+        remaining = response.headers.get("X-RateLimit-Remaining")
+        if remaining is not None and remaining.isdigit():
+            self.gauge("ratelimit_remaining", int(remaining))
+
+    def _emit(self, sample: Sample) -> None:
+        for hook in self.hooks:
+            hook(sample)
+
+    def snapshot(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """Returns the metrics collected so far, by endpoint."""
+        result: Dict[str, Dict[str, Dict[str, Any]]] = {}
+
+        def section(endpoint: str) -> Dict[str, Dict[str, Any]]:
+            return result.setdefault(endpoint, {"phases": {}, "counters": {}, "gauges": {}})
+
+        with self._lock:
+            for (endpoint, phase), histogram in self._histograms.items():
+                section(endpoint)["phases"][phase] = histogram.snapshot()
+            for (endpoint, name), value in self._counters.items():
+                section(endpoint)["counters"][name] = value
+            for (endpoint, name), value in self._gauges.items():
+                section(endpoint)["gauges"][name] = value
+
+        return result
+
+    def reset(self) -> None:
+        """Discards everything collected so far."""
+        with self._lock:
+            self._histograms.clear()
+            self._counters.clear()
+            self._gauges.clear()
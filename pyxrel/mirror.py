@@ -0,0 +1,226 @@
+import json
+import sqlite3
+import threading
+from typing import Any, Dict, Iterable, List, Optional
+
+from pydantic import BaseModel
+
+from pyxrel.models import ExtInfoInfo, Release, ReleaseP2P, Releases, ReleasesP2P, SearchExtInfo, SearchResult
+from pyxrel.types import ExtInfoType, ReleaseType
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS releases (
+    id TEXT PRIMARY KEY,
+    type TEXT NOT NULL,
+    dirname TEXT NOT NULL,
+    group_name TEXT,
+    time INTEGER,
+    ext_info_id TEXT,
+    title TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS releases_dirname ON releases (dirname);
+CREATE INDEX IF NOT EXISTS releases_group_name ON releases (group_name);
+CREATE INDEX IF NOT EXISTS releases_time ON releases (time);
+CREATE INDEX IF NOT EXISTS releases_ext_info_id ON releases (ext_info_id);
+
+CREATE TABLE IF NOT EXISTS ext_info (
+    id TEXT PRIMARY KEY,
+    type TEXT NOT NULL,
+    title TEXT NOT NULL,
+    alt_title TEXT,
+    data TEXT NOT NULL
+);
+"""
+
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS releases_fts USING fts5(id UNINDEXED, dirname, title);
+CREATE VIRTUAL TABLE IF NOT EXISTS ext_info_fts USING fts5(id UNINDEXED, title, alt_title);
+"""
+
+
+def _dump(obj: Any) -> dict:
+    return obj.model_dump(mode="json") if isinstance(obj, BaseModel) else obj
+
+
+def _fts_query(query: str) -> str:
+    """Turns a free-text query into an FTS5 query matching every word as a prefix."""
+    words = "".join(c if c.isalnum() else " " for c in query).split()
+    return " ".join(f'"{word}"*' for word in words)
+
+
+class Mirror:
+    """A local SQLite copy of the releases and Ext Infos a client has seen.
+
+    Releases are indexed by dirname, group, time and Ext Info id, and full-text indexed on dirname and
+    title, so `Search` can answer queries without a request. Every record is stored as the JSON the API
+    returned, and rebuilt into the same models.
+    """
+
+    def __init__(self, path: str = ":memory:") -> None:
+        self.path = path
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._lock = threading.Lock()
+
+        with self._lock, self._conn:
+            if path != ":memory:":
+                self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+            try:
+                self._conn.executescript(_FTS_SCHEMA)
+                self.fts = True
+            except sqlite3.OperationalError:  # SQLite built without FTS5
+                self.fts = False
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def observe(self, model: type, data: Any) -> None:
+        """Stores the releases and Ext Infos within response data that was built into `model`.
+
+        Runs on every response, so it never raises: the call that returned the data must not fail because
+        the mirror could not store it.
+        """
+        try:
+            if model is Release or model is ReleaseP2P:
+                self.add_releases([data])
+            elif model is Releases or model is ReleasesP2P:
+                self.add_releases(data["list"])
+            elif model is SearchResult:
+                self.add_releases([*data.get("results", []), *data.get("p2p_results", [])])
+            elif model is ExtInfoInfo:
+                self.add_ext_info([data])
+            elif model is SearchExtInfo:
+                self.add_ext_info(data.get("results", []))
+        except Exception:
+            pass  # data of an unexpected shape, or the database failed; the model is built regardless
+
+    def add_releases(self, releases: Iterable[Any]) -> None:
+        """Stores scene and/or P2P releases, as models or raw dicts.
+
+        Releases without an id, dirname or time are skipped.
+        """
+        rows = []
+        for release in map(_dump, releases):
+            try:
+                p2p = "pub_time" in release
+                ext_info = release.get("ext_info") or {}
+                group = release.get("group") or {}
+                rows.append(
+                    (
+                        release["id"],
+                        "p2p" if p2p else "scene",
+                        release["dirname"],
+                        group.get("name") if p2p else release.get("group_name"),
+                        release["pub_time"] if p2p else release["time"],
+                        ext_info.get("id"),
+                        ext_info.get("title"),
+                        json.dumps(release),
+                    )
+                )
+            except (AttributeError, KeyError, TypeError):
+                continue
+
+        with self._lock, self._conn:
+            self._conn.executemany("INSERT OR REPLACE INTO releases VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+            if self.fts:
+                self._conn.executemany("DELETE FROM releases_fts WHERE id = ?", [(row[0],) for row in rows])
+                self._conn.executemany(
+                    "INSERT INTO releases_fts VALUES (?, ?, ?)", [(row[0], row[2], row[6]) for row in rows]
+                )
+
+    def add_ext_info(self, infos: Iterable[Any]) -> None:
+        """Stores Ext Infos, as models or raw dicts.
+
+        Fields missing from an Ext Info, e.g. in search results, are kept from the stored record. Ext Infos
+        that still lack an id, type or title are skipped.
+        """
+        infos = [info for info in map(_dump, infos) if isinstance(info, dict) and info.get("id") is not None]
+        if not infos:
+            return
+
+        with self._lock, self._conn:
+            ids = [info["id"] for info in infos]
+            stored = dict(
+                self._conn.execute(
+                    f"SELECT id, data FROM ext_info WHERE id IN ({', '.join('?' for _ in ids)})", ids
+                ).fetchall()
+            )
+            rows = []
+            for info in infos:
+                if info["id"] in stored:
+                    info = {**json.loads(stored[info["id"]]), **info}
+                if info.get("type") is None or info.get("title") is None:
+                    continue
+                rows.append((info["id"], info["type"], info["title"], info.get("alt_title"), json.dumps(info)))
+
+            self._conn.executemany("INSERT OR REPLACE INTO ext_info VALUES (?, ?, ?, ?, ?)", rows)
+            if self.fts:
+                self._conn.executemany("DELETE FROM ext_info_fts WHERE id = ?", [(row[0],) for row in rows])
+                self._conn.executemany(
+                    "INSERT INTO ext_info_fts VALUES (?, ?, ?)", [(row[0], row[2], row[3]) for row in rows]
+                )
+
+    def _query(self, sql: str, params: Iterable[Any]) -> List[tuple]:
+        with self._lock:
+            return self._conn.execute(sql, list(params)).fetchall()
+
+    def search(self, query: str, limit: int = 25, include: Optional[List[ReleaseType]] = None) -> Dict[str, Any]:
+        """Searches the stored releases, returning data shaped like `SearchResult`."""
+        include = include or ["scene", "p2p"]
+        types = ", ".join("?" for _ in include)
+
+        if self.fts:
+            match = _fts_query(query)
+            if not match:  # nothing to search for, e.g. only punctuation
+                return {"total": 0, "results": [], "p2p_results": []}
+
+            rows = self._query(
+                "SELECT r.type, r.data FROM releases_fts f JOIN releases r ON r.id = f.id "
+                f"WHERE releases_fts MATCH ? AND r.type IN ({types}) ORDER BY r.time DESC LIMIT ?",
+                [match, *include, limit],
+            )
+        else:
+            rows = self._query(
+                f"SELECT type, data FROM releases WHERE (dirname LIKE ? OR title LIKE ?) AND type IN ({types}) "
+                "ORDER BY time DESC LIMIT ?",
+                [f"%{query}%", f"%{query}%", *include, limit],
+            )
+
+        results = [json.loads(data) for type, data in rows if type == "scene"]
+        p2p_results = [json.loads(data) for type, data in rows if type == "p2p"]
+
+        return {"total": len(rows), "results": results, "p2p_results": p2p_results}
+
+    def search_ext_info(self, query: str, limit: int = 25, type: Optional[ExtInfoType] = None) -> Dict[str, Any]:
+        """Searches the stored Ext Infos, returning data shaped like `SearchExtInfo`."""
+        if self.fts:
+            match = _fts_query(query)
+            if not match:
+                return {"total": 0, "results": []}
+
+            sql = "SELECT e.data FROM ext_info_fts f JOIN ext_info e ON e.id = f.id WHERE ext_info_fts MATCH ?"
+            params = [match]
+        else:
+            sql = "SELECT e.data FROM ext_info e WHERE (e.title LIKE ? OR e.alt_title LIKE ?)"
+            params = [f"%{query}%", f"%{query}%"]
+
+        if type:
+            sql += " AND e.type = ?"
+            params.append(type)
+
+        rows = self._query(sql + " LIMIT ?", [*params, limit])
+
+        return {"total": len(rows), "results": [json.loads(data) for data, in rows]}
+
+    def release(self, dirname: Optional[str] = None, id: Optional[str] = None) -> Optional[dict]:
+        """Returns a stored release by dirname or id, as raw data."""
+        column, value = ("dirname", dirname) if dirname else ("id", id)
+        rows = self._query(f"SELECT data FROM releases WHERE {column} = ? LIMIT 1", [value])
+
+        return json.loads(rows[0][0]) if rows else None
+
+    def releases_for(self, ext_info_id: str) -> List[dict]:
+        """Returns the stored releases of an Ext Info, newest first, as raw data."""
+        rows = self._query("SELECT data FROM releases WHERE ext_info_id = ? ORDER BY time DESC", [ext_info_id])
+        return [json.loads(data) for data, in rows]
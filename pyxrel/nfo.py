@@ -0,0 +1,96 @@
+import hashlib
+import os
+import sqlite3
+import tempfile
+import threading
+from typing import Dict, Iterable, Optional
+
+from pyxrel.types import ReleaseType
+
+
+class NFOStore:
+    """A content-addressed store for NFO images.
+
+    Every image is stored once under its SHA-256 hash (`<directory>/<ab>/<abcdef...>`), however many
+    releases share it. A SQLite index maps release ids to hashes, so stored NFOs never need a request.
+    Several processes can share one store.
+    """
+
+    def __init__(self, directory: str) -> None:
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+        self._local = threading.local()
+        with self._connection as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS nfos (id TEXT NOT NULL, type TEXT NOT NULL, hash TEXT NOT NULL, "
+                "PRIMARY KEY (id, type))"
+            )
+
+    @property
+    def _connection(self) -> sqlite3.Connection:
+        """One connection per thread, sqlite3 connections can't be shared between threads."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = sqlite3.connect(os.path.join(self.directory, "index.db"), timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+
+        return conn
+
+    def path(self, hash: str) -> str:
+        """Returns the file path for a content hash."""
+        return os.path.join(self.directory, hash[:2], hash)
+
+    def get(self, id: str, type: ReleaseType = "scene") -> Optional[str]:
+        """Returns the path of a stored NFO, or `None`."""
+        return self.lookup([id], type).get(id)
+
+    def lookup(self, ids: Iterable[str], type: ReleaseType = "scene") -> Dict[str, str]:
+        """Returns the paths of the stored NFOs among the given release ids."""
+        ids = list(ids)
+        paths = {}
+        for start in range(0, len(ids), 500):  # stay below SQLite's variable limit
+            chunk = ids[start : start + 500]
+            rows = self._connection.execute(
+                f"SELECT id, hash FROM nfos WHERE type = ? AND id IN ({', '.join('?' for _ in chunk)})",
+                [type, *chunk],
+            ).fetchall()
+            paths.update((id, self.path(hash)) for id, hash in rows)
+
+        return paths
+
+    def read(self, id: str, type: ReleaseType = "scene") -> Optional[bytes]:
+        """Returns a stored NFO image, or `None`."""
+        path = self.get(id, type)
+        if path is None:
+            return None
+
+        with open(path, "rb") as f:
+            return f.read()
+
+    def write(self, id: str, chunks: Iterable[bytes], type: ReleaseType = "scene") -> str:
+        """Streams an NFO image to disk, indexes it for the release id and returns its path."""
+        digest = hashlib.sha256()
+        fd, tmp = tempfile.mkstemp(dir=self.directory, prefix=".nfo-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                for chunk in chunks:
+                    digest.update(chunk)
+                    f.write(chunk)
+
+            hash = digest.hexdigest()
+            path = self.path(hash)
+            if os.path.exists(path):
+                os.remove(tmp)
+            else:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                os.replace(tmp, path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+
+        with self._connection as conn:
+            conn.execute("INSERT OR REPLACE INTO nfos VALUES (?, ?, ?)", (id, type, hash))
+
+        return path
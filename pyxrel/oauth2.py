@@ -1,17 +1,139 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
 import time
-from typing import Optional
+from abc import ABC, abstractmethod
+from typing import Dict, Optional
 
 from pyxrel.constants import SCOPES
 from pyxrel.exceptions import UnknownScopeError
 from pyxrel.session import Session
 
 
+class TokenStore(ABC):
+    """Where `OAuth2` keeps its access tokens, as `{"access_token", "expires_at", "issued_at"}` data per key."""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[dict]:
+        """Returns the token data stored for a key."""
+
+    @abstractmethod
+    def set(self, key: str, data: dict) -> None:
+        """Stores token data for a key."""
+
+
+class MemoryTokenStore(TokenStore):
+    """Keeps tokens in a dict, by default the one shared by every `OAuth2` instance of the process."""
+
+    def __init__(self, tokens: Optional[Dict[str, dict]] = None) -> None:
+        self.tokens = tokens if tokens is not None else {}
+
+    def get(self, key: str) -> Optional[dict]:
+        return self.tokens.get(key)
+
+    def set(self, key: str, data: dict) -> None:
+        self.tokens[key] = data
+
+
+class FileTokenStore(TokenStore):
+    """Keeps tokens in a JSON file, so they survive restarts.
+
+    The file is only readable by its owner and replaced atomically, so readers never see a partial write.
+    Writes are only serialized within the process, though: processes writing at the same time can drop
+    each other's tokens. Use `SQLiteTokenStore` to share tokens between processes.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+
+    def _read(self) -> Dict[str, dict]:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def get(self, key: str) -> Optional[dict]:
+        return self._read().get(key)
+
+    def set(self, key: str, data: dict) -> None:
+        with self._lock:
+            tokens = self._read()
+            tokens[key] = data
+
+            tmp = f"{self.path}.{os.getpid()}.tmp"
+            fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            os.chmod(tmp, 0o600)  # in case an older temp file with other permissions was left behind
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(tokens, f)
+            os.replace(tmp, self.path)
+
+
+class SQLiteTokenStore(TokenStore):
+    """Keeps tokens in a SQLite database, so they survive restarts and can be shared between processes."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._local = threading.local()
+
+        with self._connection as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS tokens "
+                "(key TEXT PRIMARY KEY, access_token TEXT, expires_at REAL, issued_at REAL)"
+            )
+            try:
+                conn.execute("ALTER TABLE tokens ADD COLUMN issued_at REAL")  # databases of older versions
+            except sqlite3.OperationalError:
+                pass
+
+    @property
+    def _connection(self) -> sqlite3.Connection:
+        """One connection per thread, sqlite3 connections can't be shared between threads."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = sqlite3.connect(self.path, timeout=30)
+
+        return conn
+
+    def get(self, key: str) -> Optional[dict]:
+        row = self._connection.execute(
+            "SELECT access_token, expires_at, issued_at FROM tokens WHERE key = ?", (key,)
+        ).fetchone()
+        return {"access_token": row[0], "expires_at": row[1], "issued_at": row[2]} if row else None
+
+    def set(self, key: str, data: dict) -> None:
+        with self._connection as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO tokens (key, access_token, expires_at, issued_at) VALUES (?, ?, ?, ?)",
+                (key, data["access_token"], data["expires_at"], data.get("issued_at")),
+            )
+
+
 class OAuth2:
-    """Manages OAuth2 authentication and access tokens."""
+    """Manages OAuth2 authentication and access tokens.
+
+    Tokens are fetched once per client and scope, even when many threads ask at the same time, and
+    refreshed in the background `refresh_ahead` seconds (at most half their lifetime) before they expire,
+    by one thread per token. Pass a `FileTokenStore` or
+    `SQLiteTokenStore` to keep them across restarts and share them between processes.
+    """
 
     _cache = {}
+    _locks: Dict[str, threading.Lock] = {}
+    _locks_lock = threading.Lock()
 
-    def __init__(self, client_id: str, client_secret: str, session: Optional[Session] = None, **kwargs) -> None:
+    def __init__(
+        self,
+        client_id: str,
+        client_secret: str,
+        session: Optional[Session] = None,
+        store: Optional[TokenStore] = None,
+        refresh_ahead: float = 60,
+        **kwargs,
+    ) -> None:
         if not client_id:
             raise ValueError("Client ID must be provided.")
         if not isinstance(client_id, str):
@@ -26,19 +148,43 @@ class OAuth2:
         self.client_secret = client_secret
 
         self.session = session or Session(**kwargs)
+        self.store = store or MemoryTokenStore(self._cache)
+        self.refresh_ahead = refresh_ahead
+
+        self._refreshes = set()
+        self._refreshes_lock = threading.Lock()
+
+    def _cache_key(self, scope: str) -> str:
+        """Identifies a client and scope without exposing the secret to persistent stores."""
+        return hashlib.sha256(f"{self.client_id}:{self.client_secret}:{scope}".encode()).hexdigest()
+
+    def _lock(self, key: str) -> threading.Lock:
+        with self._locks_lock:
+            return self._locks.setdefault(key, threading.Lock())
 
     def get_access_token(self, scope: str) -> str:
         """Retrieves an access token for the given scope."""
         if scope not in SCOPES:
             raise UnknownScopeError(scope)
 
-        cache_key = f"{self.client_id}:{self.client_secret}:{scope}"
+        cache_key = self._cache_key(scope)
 
-        data = self._cache.get(cache_key)
+        data = self.store.get(cache_key)
         if data and not self._is_expired(data):
+            if self._needs_refresh(data) and self._begin_refresh(cache_key):
+                threading.Thread(target=self._refresh, args=(scope, cache_key), daemon=True).start()
             return data["access_token"]
 
-        data = self.session.post(
+        with self._lock(cache_key):
+            data = self.store.get(cache_key)  # another thread may have fetched it meanwhile
+            if not data or self._is_expired(data):
+                data = self._fetch(scope, cache_key)
+
+        return data["access_token"]
+
+    def _fetch(self, scope: str, cache_key: str) -> dict:
+        """Requests a new access token and stores it."""
+        response = self.session.post(
             "oauth2/token",
             data={
                 "client_id": self.client_id,
@@ -48,12 +194,59 @@ class OAuth2:
             },
         ).json()
 
-        self._cache[cache_key] = {
-            "access_token": data["access_token"],
-            "expires_at": time.time() + data["expires_in"],
+        data = self._token_data(response)
+        self.store.set(cache_key, data)
+
+        return data
+
+    @staticmethod
+    def _token_data(response: dict) -> dict:
+        """Turns a token response into the data kept in the store."""
+        now = time.time()
+        return {
+            "access_token": response["access_token"],
+            "expires_at": now + response["expires_in"],
+            "issued_at": now,
         }
 
-        return data["access_token"]
+    def _begin_refresh(self, cache_key: str) -> bool:
+        """Marks a token as being refreshed, returns `False` if a refresh is already running."""
+        with self._refreshes_lock:
+            if cache_key in self._refreshes:
+                return False
+
+            self._refreshes.add(cache_key)
+            return True
+
+    def _refresh(self, scope: str, cache_key: str) -> None:
+        """Replaces a token that is about to expire, unless another thread already does."""
+        lock = self._lock(cache_key)
+        if not lock.acquire(blocking=False):
+            with self._refreshes_lock:
+                self._refreshes.discard(cache_key)
+            return
+
+        try:
+            data = self.store.get(cache_key)
+            if not data or self._needs_refresh(data):
+                self._fetch(scope, cache_key)
+        except Exception:
+            pass  # the token is still valid, the next call tries again
+        finally:
+            lock.release()
+            with self._refreshes_lock:
+                self._refreshes.discard(cache_key)
+
+    def _needs_refresh(self, data: dict) -> bool:
+        """Checks if the access token expires within the refresh-ahead window.
+
+        The window is at most half the token's lifetime, so short-lived tokens are not refreshed on every call.
+        """
+        refresh_ahead = self.refresh_ahead
+        if data.get("issued_at") is not None:
+            refresh_ahead = min(refresh_ahead, (data["expires_at"] - data["issued_at"]) / 2)
+
+        return data["expires_at"] - refresh_ahead < time.time()
 
     @staticmethod
     def _is_expired(data: dict) -> bool:
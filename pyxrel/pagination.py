@@ -0,0 +1,62 @@
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Any, Callable, Iterator, Optional
+
+
+def items(page: Any) -> list:
+    """Returns the items of a page, either a model or a raw dict."""
+    return page["list"] if isinstance(page, dict) else page.list
+
+
+def last_page(first: Any, page: int = 1, max_pages: Optional[int] = None) -> int:
+    """Returns the last page number to fetch, given the first fetched page."""
+    if isinstance(first, dict):
+        pagination = first.get("pagination")
+        last = pagination["total_pages"] if pagination else page
+    else:
+        pagination = first.pagination
+        last = pagination.total_pages if pagination else page
+
+    if max_pages is not None:
+        last = min(last, page + max_pages - 1)
+
+    return last
+
+
+def paginate(
+    fetch_page: Callable[[int], Any],
+    page: int = 1,
+    max_workers: int = 4,
+    max_pages: Optional[int] = None,
+) -> Iterator[Any]:
+    """Yields the items of every page, starting at `page`.
+
+    Once the first page reports the total page count, the following pages are fetched in parallel
+    by up to `max_workers` threads. At most `max_workers` pages are held ahead of the consumer.
+    """
+    first = fetch_page(page)
+    yield from items(first)
+
+    pages = iter(range(page + 1, last_page(first, page, max_pages) + 1))
+
+    if max_workers <= 1:
+        for number in pages:
+            yield from items(fetch_page(number))
+        return
+
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="pyxrel-paginate")
+    pending = deque(executor.submit(fetch_page, number) for number in islice(pages, max_workers))
+    try:
+        while pending:
+            result = pending.popleft().result()
+
+            number = next(pages, None)
+            if number is not None:
+                pending.append(executor.submit(fetch_page, number))
+
+            yield from items(result)
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
@@ -0,0 +1,89 @@
+import threading
+import time
+from typing import Callable, Literal, Mapping, Optional
+
+RateLimitMode = Literal["spread", "block"]
+
+
+class RateLimiter:
+    """Paces outgoing requests using the `X-RateLimit-*` headers of previous responses.
+
+    Works like a token bucket refilled by the server: every response reports how many requests
+    are left (`X-RateLimit-Remaining`) until the window resets (`X-RateLimit-Reset`).
+
+    * `spread`: spaces requests evenly so the remaining budget lasts until the reset.
+    * `block`: sends requests immediately and only waits for the reset once the budget is spent.
+
+    `margin` requests of every window are kept in reserve, e.g. for other processes sharing the quota.
+    """
+
+    def __init__(
+        self,
+        mode: RateLimitMode = "spread",
+        margin: int = 0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if mode not in ("spread", "block"):
+            raise ValueError(f"Expected mode to be 'spread' or 'block', not {mode!r}.")
+        if margin < 0:
+            raise ValueError("Margin must not be negative.")
+
+        self.mode = mode
+        self.margin = margin
+        self.clock = clock
+
+        self.remaining: Optional[int] = None
+        self.reset: Optional[float] = None
+
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def update(self, headers: Mapping[str, str]) -> None:
+        """Records the rate limit state reported by a response."""
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset = headers.get("X-RateLimit-Reset")
+        if remaining is None or reset is None:
+            return
+
+        try:
+            remaining, reset = int(remaining), float(reset)
+        except ValueError:
+            return
+
+        with self._lock:
+            if self.reset == reset and self.remaining is not None:
+                # Responses of one window may arrive out of order, the lowest count is the freshest
+                remaining = min(remaining, self.remaining)
+
+            self.remaining = remaining
+            self.reset = reset
+
+    def reserve(self) -> float:
+        """Claims a slot for one request and returns how many seconds to wait before sending it."""
+        with self._lock:
+            now = self.clock()
+
+            if self.remaining is None or self.reset is None or now >= self.reset:
+                # Nothing known about the current window, let the request find out
+                self.remaining = self.reset = None
+                return 0.0
+
+            budget = self.remaining - self.margin
+            if budget <= 0:
+                return self.reset - now
+
+            self.remaining -= 1
+
+            if self.mode == "block":
+                return 0.0
+
+            start = min(max(now, self._next), self.reset)
+            self._next = start + (self.reset - start) / budget
+
+            return start - now
+
+    def acquire(self) -> None:
+        """Blocks until the next request may be sent."""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
@@ -1,6 +1,33 @@
-from .calendar import Calendar
-from .release import Release
-from .search import Search
-from .extinfo import ExtInfo
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .calendar import Calendar
+    from .release import Release
+    from .search import Search
+    from .extinfo import ExtInfo
+
+# Resources (and the models they use) are imported on first access
+_EXPORTS = {
+    "Calendar": "calendar",
+    "Release": "release",
+    "Search": "search",
+    "ExtInfo": "extinfo",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *_EXPORTS})
+
 
 __all__ = ("Calendar", "Release", "Search", "ExtInfo")
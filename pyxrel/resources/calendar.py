@@ -1,18 +1,115 @@
-from typing import Optional
+import threading
+import time
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
 
+from pyxrel.constants import CACHE_TTLS
 from pyxrel.session import Session
 from pyxrel.models import Upcoming
+from pyxrel.mirror import Mirror
+from pyxrel.pagination import items
+from pyxrel.types import ModelMode
 from pyxrel.resources.resource import Resource
-from pyxrel.utils import call
+from pyxrel.utils import call, gather
+
+
+class UpcomingByCountry(NamedTuple):
+    """The merged upcoming movies of several countries.
+
+    Every Ext Info appears once in `upcoming`, `countries` maps its id to the countries it came from and
+    `errors` failed countries to the raised exception.
+    """
+
+    upcoming: Upcoming
+    countries: Dict[str, List[str]]
+    errors: Dict[str, Exception]
+
+
+def _field(item: Any, name: str) -> Any:
+    """Reads a field of a model or a raw dict."""
+    return item.get(name) if isinstance(item, dict) else getattr(item, name, None)
+
+
+def merge_upcoming(
+    calendars: Iterable[Tuple[str, Union[Upcoming, dict, Exception]]], mode: ModelMode = "validate"
+) -> Tuple[Union[Upcoming, dict], Dict[str, List[str]]]:
+    """Merges the calendars of several countries, as built in `mode`, by Ext Info id.
+
+    The releases of an Ext Info listed under several countries are combined. Returns the merged calendar
+    and the countries of every Ext Info id.
+    """
+    merged: Dict[str, Any] = {}
+    countries: Dict[str, List[str]] = {}
+    for country, calendar in calendars:
+        if isinstance(calendar, Exception):
+            continue
+
+        for item in items(calendar):
+            id = _field(item, "id")
+            countries.setdefault(id, []).append(country)
+            if id not in merged:
+                merged[id] = item
+                continue
+
+            existing, update = merged[id], {}
+            for key in ("releases", "p2p_releases"):
+                known = {_field(release, "id") for release in _field(existing, key) or []}
+                extra = [release for release in _field(item, key) or [] if _field(release, "id") not in known]
+                if extra:
+                    update[key] = [*(_field(existing, key) or []), *extra]
+            if update and isinstance(existing, dict):
+                merged[id] = {**existing, **update}
+            elif update:
+                merged[id] = existing.model_copy(update=update)
+
+    if mode == "raw":
+        return {"list": list(merged.values())}, countries
+
+    return Upcoming.model_construct(list=list(merged.values())), countries
 
 
 class Calendar(Resource):
     """Fetches upcoming movies and their releases from the xREL API."""
 
-    def __init__(self, session: Optional[Session] = None) -> None:
-        super().__init__(session)
+    def __init__(
+        self, session: Optional[Session] = None, mode: ModelMode = "validate", mirror: Optional[Mirror] = None
+    ) -> None:
+        super().__init__(session, mode=mode, mirror=mirror)
+        self._merged: Dict[tuple, Tuple[float, UpcomingByCountry]] = {}
+        self._lock = threading.Lock()
 
-    def upcoming(self, country: str = "de") -> Upcoming:
+    def upcoming(self, country: str = "de", mode: Optional[ModelMode] = None) -> Upcoming:
         """Retrieves a list of upcoming movies for a specific country."""
         response = call(self.session, "/calendar/upcoming", params={"country": country})
-        return Upcoming(list=response)
+        return self._build(Upcoming, {"list": response}, mode)
+
+    def upcoming_many(
+        self,
+        countries: Iterable[str],
+        max_workers: int = 8,
+        ttl: Optional[float] = CACHE_TTLS["calendar/upcoming"],
+        mode: Optional[ModelMode] = None,
+    ) -> UpcomingByCountry:
+        """Retrieves the upcoming movies of several countries at once, merged by Ext Info.
+
+        The countries are fetched and built in parallel, then merged. Complete results are kept for `ttl`
+        seconds (the calendar's cache TTL by default, `None` to not keep them).
+        """
+        countries = list(dict.fromkeys(countries))
+        key = (tuple(sorted(countries)), mode or self.mode)
+        with self._lock:
+            cached = self._merged.get(key)
+        if cached and cached[0] > time.time():
+            return cached[1]
+
+        # Built in the workers, so that validation is recorded for the request's endpoint
+        calendars = gather(lambda country: self.upcoming(country, mode), countries, max_workers)
+        calendars = list(zip(countries, calendars))
+        upcoming, by_id = merge_upcoming(calendars, mode or self.mode)
+        errors = {country: calendar for country, calendar in calendars if isinstance(calendar, Exception)}
+        result = UpcomingByCountry(upcoming, by_id, errors)
+
+        if ttl and not errors:
+            with self._lock:
+                self._merged[key] = (time.time() + ttl, result)
+
+        return result
@@ -1,31 +1,106 @@
-from typing import Optional
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
 
-from pyxrel.models import MediaList, ExtInfoInfo, Releases
+from pyxrel.models import MediaList, ExtInfoInfo, Release, Releases
+from pyxrel.mirror import Mirror
+from pyxrel.types import ModelMode
+from pyxrel.pagination import paginate
 from pyxrel.resources.resource import Resource
 from pyxrel.session import Session
-from pyxrel.utils import call
+from pyxrel.utils import call, gather
+
+
+def ext_info_id(release: Any) -> Optional[str]:
+    """Returns the Ext Info id of a release model or raw dict, if it has one."""
+    ext_info = release.get("ext_info") if isinstance(release, dict) else getattr(release, "ext_info", None)
+    if ext_info is None:
+        return None
+    return ext_info.get("id") if isinstance(ext_info, dict) else ext_info.id
+
+
+def ext_info_ids(releases: Iterable[Any]) -> List[str]:
+    """Returns the unique Ext Info ids of releases, in order of appearance."""
+    return list(dict.fromkeys(id for id in map(ext_info_id, releases) if id))
+
+
+class Enrichment(NamedTuple):
+    """The Ext Infos (and media) of a batch of releases, by Ext Info id.
+
+    Failed lookups hold the raised exception instead.
+    """
+
+    ext_info: Dict[str, Union[ExtInfoInfo, Exception]]
+    media: Dict[str, Union[MediaList, Exception]]
+
+    def join(
+        self, releases: Iterable[Any]
+    ) -> List[Tuple[Any, Union[ExtInfoInfo, Exception, None], Union[MediaList, Exception, None]]]:
+        """Pairs every release with its Ext Info and media, `None` for releases without an Ext Info."""
+        joined = []
+        for release in releases:
+            id = ext_info_id(release)
+            joined.append((release, self.ext_info.get(id), self.media.get(id)))
+
+        return joined
 
 
 class ExtInfo(Resource):
     """Performs requests for extended information on releases."""
 
-    def __init__(self, session: Optional[Session] = None) -> None:
-        super().__init__(session)
+    def __init__(
+        self, session: Optional[Session] = None, mode: ModelMode = "validate", mirror: Optional[Mirror] = None
+    ) -> None:
+        super().__init__(session, mode=mode, mirror=mirror)
 
-    def __call__(self, id: str) -> ExtInfoInfo:
+    def __call__(self, id: str, mode: Optional[ModelMode] = None) -> ExtInfoInfo:
         """Retrieves information about an Ext Info."""
-        return ExtInfoInfo(**call(self.session, "/ext_info/info", params={"id": id}))
+        return self._build(ExtInfoInfo, call(self.session, "/ext_info/info", params={"id": id}), mode)
 
-    def media(self, id: str) -> MediaList:
+    def media(self, id: str, mode: Optional[ModelMode] = None) -> MediaList:
         """Retrieves media associated with a given Ext Info."""
-        return MediaList(list=call(self.session, "/ext_info/media", params={"id": id}))
+        return self._build(MediaList, {"list": call(self.session, "/ext_info/media", params={"id": id})}, mode)
+
+    def enrich(
+        self,
+        releases: Iterable[Any],
+        with_media: bool = False,
+        max_workers: int = 8,
+        mode: Optional[ModelMode] = None,
+    ) -> Enrichment:
+        """Retrieves the Ext Infos of many releases at once, and optionally their media.
+
+        Every Ext Info shared by several releases is fetched once, with up to `max_workers` requests in
+        parallel. Use `Enrichment.join` to pair the releases with the results.
+        """
+        ids = ext_info_ids(releases)
+        jobs = [("info", id) for id in ids] + ([("media", id) for id in ids] if with_media else [])
 
-    def releases(self, id: str, pre_page: int = 25, page: int = 1) -> Releases:
+        def fetch(job: Tuple[str, str]) -> Union[ExtInfoInfo, MediaList]:
+            kind, id = job
+            return self(id, mode) if kind == "info" else self.media(id, mode)
+
+        results = gather(fetch, jobs, max_workers)
+        return Enrichment(dict(zip(ids, results)), dict(zip(ids, results[len(ids) :])))
+
+    def releases(self, id: str, pre_page: int = 25, page: int = 1, mode: Optional[ModelMode] = None) -> Releases:
         """Retrieves all releases associated with a given Ext Info."""
-        return Releases(
-            **call(
+        return self._build(
+            Releases,
+            call(
                 self.session,
                 "/release/ext_info",
                 params={"id": id, "per_page": pre_page, "page": page},
-            )
+            ),
+            mode,
         )
+
+    def iter_releases(
+        self,
+        id: str,
+        per_page: int = 25,
+        page: int = 1,
+        max_workers: int = 4,
+        max_pages: Optional[int] = None,
+        mode: Optional[ModelMode] = None,
+    ) -> Iterator[Release]:
+        """Iterates over all releases associated with a given Ext Info, prefetching pages in parallel."""
+        return paginate(lambda page: self.releases(id, per_page, page, mode), page, max_workers, max_pages)
@@ -1,25 +1,35 @@
-from typing import Optional, Union
+from typing import Dict, Iterable, Iterator, List, Optional, Union
 
 from pyxrel.session import Session
 from pyxrel.oauth2 import OAuth2
-from pyxrel.models import Release as ReleaseScene, ReleaseP2P, Comments
-from pyxrel.utils import call, get_rls_type
+from pyxrel.models import Release as ReleaseScene, ReleaseP2P, Comment, Comments
+from pyxrel.pagination import paginate
+from pyxrel.utils import call, gather, get_rls_type, is_release_id, stream
 from pyxrel.resources.resource import Resource
 from pyxrel.exceptions import NotFoundError
-from pyxrel.types import ReleaseType
+from pyxrel.mirror import Mirror
+from pyxrel.nfo import NFOStore
+from pyxrel.types import ModelMode, ReleaseType
 
 
 class Release(Resource):
     """Interacts with release-related resources on the XREL API."""
 
-    def __init__(self, session: Optional[Session] = None, oauth2: Optional[OAuth2] = None) -> None:
-        super().__init__(session, oauth2)
+    def __init__(
+        self,
+        session: Optional[Session] = None,
+        oauth2: Optional[OAuth2] = None,
+        mode: ModelMode = "validate",
+        mirror: Optional[Mirror] = None,
+    ) -> None:
+        super().__init__(session, oauth2, mode, mirror)
 
     def __call__(
         self,
         dirname: Optional[str] = None,
         id: Optional[str] = None,
         type: ReleaseType = "scene",
+        mode: Optional[ModelMode] = None,
     ) -> Union[ReleaseScene, ReleaseP2P]:
         """Retrieves information about a single release."""
         if dirname is not None and id is not None:
@@ -30,14 +40,35 @@ class Release(Resource):
         elif id:
             params = {"id": id}
 
-        endpoint = "/release/info.json" if type == "scene" else "/p2p/rls_info.json"
+        endpoint = "/release/info" if type == "scene" else "/p2p/rls_info"
+
+        resp = call(self.session, endpoint, params=params)
+
+        return self._build(ReleaseScene if type == "scene" else ReleaseP2P, resp, mode)
+
+    def many(
+        self,
+        releases: Iterable[str],
+        type: ReleaseType = "scene",
+        max_workers: int = 8,
+        mode: Optional[ModelMode] = None,
+    ) -> List[Union[ReleaseScene, ReleaseP2P, Exception]]:
+        """Retrieves information about many releases at once.
 
-        resp = self.session.get(endpoint, params=params).json()
+        `releases` may mix dirnames and API release ids. Duplicates are looked up once, up to `max_workers`
+        lookups run in parallel (paced by the session's rate limiter, if any). Results are returned in input
+        order, with the raised exception in place of a release for failed lookups.
+        """
+        releases = list(releases)
+        unique = list(dict.fromkeys(releases))
 
-        if type == "scene":
-            return ReleaseScene(**resp)
+        def lookup(release: str) -> Union[ReleaseScene, ReleaseP2P]:
+            if is_release_id(release):
+                return self(id=release, type=type, mode=mode)
+            return self(dirname=release, type=type, mode=mode)
 
-        return ReleaseP2P(**resp)
+        results = dict(zip(unique, gather(lookup, unique, max_workers)))
+        return [results[release] for release in releases]
 
     def nfo(self, id: str, type: ReleaseType = "scene") -> bytes:
         """Returns an image of a NFO file for a given API release id."""
@@ -50,16 +81,74 @@ class Release(Resource):
             params={"id": id},
         )
 
-    def comments(self, id: str, type: ReleaseType = "scene", page: int = 1) -> Comments:
+    def nfos(
+        self,
+        ids: Iterable[str],
+        store: NFOStore,
+        type: ReleaseType = "scene",
+        max_workers: int = 8,
+    ) -> Dict[str, Union[str, Exception]]:
+        """Downloads the NFO images of many releases into a `NFOStore`.
+
+        NFOs already in the store are not requested again. The others are fetched by up to `max_workers`
+        threads, and streamed straight to disk. The threads share the client's access token, which is
+        refreshed as usual when a long batch outlives it. Returns the file path for every release id, or
+        the raised exception for failed downloads.
+        """
+        if not self.oauth2:
+            raise ValueError("No OAuth2 instance provided.")
+
+        ids = list(dict.fromkeys(ids))
+        paths: Dict[str, Union[str, Exception]] = store.lookup(ids, type)
+
+        missing = [id for id in ids if id not in paths]
+        if not missing:
+            return paths
+
+        def download(id: str) -> str:
+            headers = {"Authorization": f"Bearer {self.oauth2.get_access_token('viewnfo')}"}
+            with self.session.get(
+                f"/nfo/{get_rls_type(type)}.json", params={"id": id}, headers=headers, stream=True
+            ) as response:
+                return store.write(id, response.iter_content(chunk_size=64 * 1024), type)
+
+        paths.update(zip(missing, gather(download, missing, max_workers)))
+        return paths
+
+    def comments(
+        self, id: str, type: ReleaseType = "scene", page: int = 1, mode: Optional[ModelMode] = None
+    ) -> Comments:
         """Returns comments for a given API release id."""
         try:
-            return Comments(
-                **call(
-                    session=self.session,
-                    resource="/comments/get",
-                    format="json",
-                    params={"id": id, "type": get_rls_type(type), "page": page},
-                )
+            response = call(
+                session=self.session,
+                resource="/comments/get",
+                format="json",
+                params={"id": id, "type": get_rls_type(type), "page": page},
             )
         except NotFoundError:
-            return Comments(total_count=0, list=[])
+            response = {"total_count": 0, "list": []}
+
+        return self._build(Comments, response, mode)
+
+    def iter_comments(
+        self,
+        id: str,
+        type: ReleaseType = "scene",
+        page: int = 1,
+        max_workers: int = 4,
+        max_pages: Optional[int] = None,
+        mode: Optional[ModelMode] = None,
+    ) -> Iterator[Comment]:
+        """Iterates over all comments for a given API release id, prefetching pages in parallel."""
+        return paginate(lambda page: self.comments(id, type, page, mode), page, max_workers, max_pages)
+
+    def stream_comments(
+        self, id: str, type: ReleaseType = "scene", page: int = 1, mode: Optional[ModelMode] = None
+    ) -> Iterator[Comment]:
+        """Streams one page of comments for a given API release id, yielding each as soon as it has been downloaded.
+
+        Uses the XML format and parses it incrementally, see `XREL.stream_latest`.
+        """
+        items = stream(self.session, "/comments/get", params={"id": id, "type": get_rls_type(type), "page": page})
+        return (self._build(Comment, item, mode) for item in items)
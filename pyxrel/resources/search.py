@@ -1,19 +1,103 @@
-from typing import Optional, List
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
 
-from pyxrel.models import SearchResult, SearchExtInfo
+from pyxrel.models import Release, ReleaseP2P, SearchResult, SearchExtInfo
 from pyxrel.resources.resource import Resource
 from pyxrel.session import Session
-from pyxrel.utils import call
-from pyxrel.types import ReleaseType, ExtInfoType
+from pyxrel.utils import as_completed, build, call
+from pyxrel.mirror import Mirror
+from pyxrel.types import ModelMode, ReleaseType, ExtInfoType, SearchSource
+
+
+def normalize_query(query: str) -> str:
+    """Normalizes a query so that variants differing only in case or whitespace are searched once."""
+    return " ".join(query.split()).casefold()
+
+
+def group_queries(queries: Iterable[str]) -> Dict[str, List[str]]:
+    """Groups queries by their normalized form, in order of first appearance."""
+    groups: Dict[str, List[str]] = {}
+    for query in queries:
+        groups.setdefault(normalize_query(query), []).append(query)
+
+    return groups
+
+
+class BatchSearchResult(NamedTuple):
+    """The merged results of a batch search.
+
+    Every release appears once in `results`/`p2p_results`, in the order of the queries that found it.
+    `matches` maps release ids to the (original) queries that found them, `errors` failed queries to the
+    raised exception.
+    """
+
+    results: List[Union[Release, dict]]
+    p2p_results: List[Union[ReleaseP2P, dict]]
+    matches: Dict[str, List[str]]
+    errors: Dict[str, Exception]
+
+
+def merge_results(
+    groups: Dict[str, List[str]], results: Iterable[Tuple[str, Union[SearchResult, dict, Exception]]]
+) -> BatchSearchResult:
+    """Merges the results of normalized queries into a `BatchSearchResult`."""
+    merged = BatchSearchResult([], [], {}, {})
+    for normalized, result in results:
+        originals = groups[normalized]
+        if isinstance(result, Exception):
+            merged.errors.update(dict.fromkeys(originals, result))
+            continue
+
+        if isinstance(result, dict):
+            found = ((merged.results, result.get("results", [])), (merged.p2p_results, result.get("p2p_results", [])))
+        else:
+            found = ((merged.results, result.results), (merged.p2p_results, result.p2p_results))
+
+        for target, releases in found:
+            for release in releases:
+                id = release["id"] if isinstance(release, dict) else release.id
+                if id not in merged.matches:
+                    merged.matches[id] = []
+                    target.append(release)
+                merged.matches[id].extend(query for query in originals if query not in merged.matches[id])
+
+    return merged
 
 
 class Search(Resource):
-    """Performs search queries for Scene and P2P releases."""
+    """Performs search queries for Scene and P2P releases.
+
+    With a mirror, queries are answered locally depending on `source`: `local` never asks the API,
+    `local-first` (the default with a mirror) only asks it when the mirror has no results.
+    """
 
-    def __init__(self, session: Optional[Session] = None) -> None:
-        super().__init__(session)
+    def __init__(
+        self,
+        session: Optional[Session] = None,
+        mode: ModelMode = "validate",
+        mirror: Optional[Mirror] = None,
+        source: Optional[SearchSource] = None,
+    ) -> None:
+        super().__init__(session, mode=mode, mirror=mirror)
+        self.source = source or ("local-first" if mirror else "remote")
 
-    def __call__(self, query: str, limit: int = 25, include: List[ReleaseType] = None) -> SearchResult:
+    def _local(self, source: Optional[SearchSource]) -> Optional[SearchSource]:
+        """Returns the effective source if the mirror should be searched, `None` otherwise."""
+        source = source or self.source
+        if source == "remote":
+            return None
+        if self.mirror is None:
+            raise ValueError(f"Searching with source {source!r} requires a mirror.")
+
+        return source
+
+    def __call__(
+        self,
+        query: str,
+        limit: int = 25,
+        include: List[ReleaseType] = None,
+        mode: Optional[ModelMode] = None,
+        source: Optional[SearchSource] = None,
+    ) -> SearchResult:
         """Searches for releases based on the provided query and filters."""
         if include is None:
             include = ["scene", "p2p"]
@@ -29,10 +113,87 @@ class Search(Resource):
 
         params.update({key: 1 for key in include})
 
-        return SearchResult(**call(self.session, "/search/releases", params=params))
+        local = self._local(source)
+        if local:
+            result = self.mirror.search(query, limit, include)
+            if local == "local" or result["total"]:
+                return build(SearchResult, result, mode or self.mode)
+
+        return self._build(SearchResult, call(self.session, "/search/releases", params=params), mode)
+
+    def many(
+        self,
+        queries: Iterable[str],
+        limit: int = 25,
+        include: List[ReleaseType] = None,
+        max_workers: int = 8,
+        mode: Optional[ModelMode] = None,
+        source: Optional[SearchSource] = None,
+    ) -> BatchSearchResult:
+        """Searches for releases with many queries at once, merging the results.
+
+        Queries differing only in case or whitespace are searched once, up to `max_workers` searches run in
+        parallel (paced by the session's rate limiter, if any). See `BatchSearchResult` for the result.
+        """
+        groups = group_queries(queries)
+        results = dict(self.iter_many(groups, limit, include, max_workers, mode, source))
+
+        return merge_results(groups, ((query, results[query]) for query in groups))
+
+    def iter_many(
+        self,
+        queries: Iterable[str],
+        limit: int = 25,
+        include: List[ReleaseType] = None,
+        max_workers: int = 8,
+        mode: Optional[ModelMode] = None,
+        source: Optional[SearchSource] = None,
+    ) -> Iterator[Tuple[str, Union[SearchResult, Exception]]]:
+        """Like `many`, but yields `(normalized query, result)` pairs as the searches complete.
 
-    def ext_info(self, query: str, limit: int = 25, type: Optional[ExtInfoType] = None) -> SearchExtInfo:
+        The result is the raised exception for failed searches. Releases are not merged across queries.
+        """
+        return as_completed(
+            lambda query: self(query, limit, include, mode, source), group_queries(queries), max_workers
+        )
+
+    def ext_info(
+        self,
+        query: str,
+        limit: int = 25,
+        type: Optional[ExtInfoType] = None,
+        mode: Optional[ModelMode] = None,
+        source: Optional[SearchSource] = None,
+    ) -> SearchExtInfo:
         """Searches for Ext Info based on the provided query."""
-        return SearchExtInfo(
-            **call(self.session, "/search/ext_info", params={"q": query, "limit": limit, "type": type})
+        local = self._local(source)
+        if local:
+            result = self.mirror.search_ext_info(query, limit, type)
+            if local == "local" or result["total"]:
+                return build(SearchExtInfo, result, mode or self.mode)
+
+        return self._build(
+            SearchExtInfo,
+            call(self.session, "/search/ext_info", params={"q": query, "limit": limit, "type": type}),
+            mode,
         )
+
+    def ext_info_many(
+        self,
+        queries: Iterable[str],
+        limit: int = 25,
+        type: Optional[ExtInfoType] = None,
+        max_workers: int = 8,
+        mode: Optional[ModelMode] = None,
+        source: Optional[SearchSource] = None,
+    ) -> Dict[str, Union[SearchExtInfo, Exception]]:
+        """Searches for Ext Info with many queries at once, deduplicated like `many`.
+
+        Returns the result for every (original) query, or the raised exception for failed searches.
+        """
+        groups = group_queries(queries)
+        results = dict(
+            as_completed(lambda query: self.ext_info(query, limit, type, mode, source), groups, max_workers)
+        )
+
+        return {query: results[normalized] for normalized, originals in groups.items() for query in originals}
@@ -0,0 +1,139 @@
+import random
+import sys
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Collection, Dict, Optional, Tuple, Type
+
+import requests
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+RETRY_EXCEPTIONS = (requests.ConnectionError, requests.Timeout)
+
+
+def transport_errors() -> Tuple[Type[BaseException], ...]:
+    """Returns the connection and timeout errors of requests and, if in use, aiohttp."""
+    aiohttp = sys.modules.get("aiohttp")  # only loaded by the asyncio client, which can only raise these then
+    if aiohttp is None:
+        return RETRY_EXCEPTIONS
+
+    import asyncio
+
+    return RETRY_EXCEPTIONS + (aiohttp.ClientConnectionError, asyncio.TimeoutError)
+
+
+class RetryPolicy:
+    """Decides whether and when a failed request is sent again.
+
+    A request is retried if its method is in `methods` (idempotent GETs by default) and it either got a
+    response with a status in `statuses` or raised one of `exceptions` (connection errors and timeouts by
+    default). Retries back off exponentially from `backoff` seconds up to `max_backoff`, with full jitter.
+    A 429 waits until `X-RateLimit-Reset` instead.
+
+    `max_retries` caps the retries of one call and `deadline` the seconds it may take overall; a retry
+    that would end past the deadline is not attempted. `budget` caps the retries of all calls within
+    `budget_window` seconds, so a struggling API doesn't get hit by a retry storm.
+
+    `on_retry(method, url, attempt, delay, reason)` is called before every retry.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff: float = 0.5,
+        max_backoff: float = 30,
+        methods: Collection[str] = ("GET",),
+        statuses: Collection[int] = RETRY_STATUSES,
+        exceptions: Optional[Tuple[Type[BaseException], ...]] = None,
+        deadline: Optional[float] = None,
+        budget: Optional[int] = None,
+        budget_window: float = 60,
+        on_retry: Optional[Callable[[str, str, int, float, str], None]] = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if max_retries < 0:
+            raise ValueError("Max retries must not be negative.")
+
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.methods = {method.upper() for method in methods}
+        self.statuses = set(statuses)
+        self.exceptions = tuple(exceptions) if exceptions is not None else None
+        self.deadline = deadline
+        self.budget = budget
+        self.budget_window = budget_window
+        self.on_retry = on_retry
+        self.clock = clock
+
+        self.retries = 0
+        self.exhausted = 0
+        self.by_reason: Dict[str, int] = {}
+
+        self._spent = deque()
+        self._lock = threading.Lock()
+
+    def delay(
+        self,
+        method: str,
+        url: str,
+        attempt: int,
+        started: float,
+        response: Any = None,
+        exception: Optional[BaseException] = None,
+    ) -> Optional[float]:
+        """Returns the seconds to wait before retrying a failed attempt, or `None` if it must not be retried.
+
+        `attempt` counts the retries made so far and `started` is the `clock()` time the call began.
+        """
+        if method.upper() not in self.methods:
+            return None
+
+        if exception is not None:
+            if not isinstance(exception, self.exceptions or transport_errors()):
+                return None
+            reason = type(exception).__name__
+        elif response is not None and response.status_code in self.statuses:
+            reason = str(response.status_code)
+        else:
+            return None
+
+        if attempt >= self.max_retries:
+            return self._give_up()
+
+        now = self.clock()
+        delay = random.uniform(0, min(self.max_backoff, self.backoff * 2**attempt))
+        if response is not None and response.status_code == 429:
+            try:
+                delay = max(float(response.headers["X-RateLimit-Reset"]) - now, 0) + random.uniform(0, self.backoff)
+            except (KeyError, ValueError):
+                pass
+
+        if self.deadline is not None and now + delay - started > self.deadline:
+            return self._give_up()
+
+        with self._lock:
+            if self.budget is not None:
+                while self._spent and self._spent[0] <= now - self.budget_window:
+                    self._spent.popleft()
+                if len(self._spent) >= self.budget:
+                    self.exhausted += 1
+                    return None
+                self._spent.append(now)
+
+            self.retries += 1
+            self.by_reason[reason] = self.by_reason.get(reason, 0) + 1
+
+        if self.on_retry:
+            self.on_retry(method, url, attempt + 1, delay, reason)
+
+        return delay
+
+    def _give_up(self) -> None:
+        with self._lock:
+            self.exhausted += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Returns the retry counters."""
+        with self._lock:
+            return {"retries": self.retries, "exhausted": self.exhausted, "by_reason": dict(self.by_reason)}
@@ -1,8 +1,17 @@
+import contextvars
+import threading
+import time
 from typing import Dict, Optional, Literal
 
 import requests
 
+from pyxrel.cache import Cache, CacheEntry
 from pyxrel.exceptions import parse_error
+from pyxrel.hosts import HostPool
+from pyxrel.metrics import Metrics
+from pyxrel.ratelimit import RateLimiter
+from pyxrel.retry import RetryPolicy
+from pyxrel.singleflight import SingleFlight, request_key
 
 
 class Session(requests.Session):
@@ -11,6 +20,12 @@ class Session(requests.Session):
     def __init__(
         self,
         host: Optional[Literal["https://api.xrel.to/", "https://xrel-api.nfos.to/"]] = "https://api.xrel.to/",
+        rate_limiter: Optional[RateLimiter] = None,
+        cache: Optional[Cache] = None,
+        coalesce: bool = True,
+        host_pool: Optional[HostPool] = None,
+        retry: Optional[RetryPolicy] = None,
+        metrics: Optional[Metrics] = None,
         **kwargs,
     ) -> None:
         super().__init__()
@@ -20,7 +35,13 @@ class Session(requests.Session):
             }
         )
 
-        self.host = host
+        self.host = host_pool.hosts[0] if host_pool else host
+        self.host_pool = host_pool
+        self.retry = retry
+        self.metrics = metrics
+        self.rate_limiter = rate_limiter
+        self.cache = cache
+        self.singleflight = SingleFlight() if coalesce else None
         self.extra = kwargs
 
     def request(
@@ -32,11 +53,15 @@ class Session(requests.Session):
     ) -> requests.Response:
         """Sends an HTTP request to the xREL.to API.
 
-        Handles host prefixing, default headers, and API-specific adjustments.
+        Handles host prefixing, default headers, and API-specific adjustments. Concurrent identical GET
+        requests share one underlying request unless the session was created with `coalesce=False`.
         """
         if not url.startswith(self.host):
             url = requests.compat.urljoin(self.host, "v2/" + url)
 
+        if self.metrics is not None:
+            self.metrics.enter(Cache.endpoint(url))
+
         if headers is None:
             headers = {}
 
@@ -50,6 +75,75 @@ class Session(requests.Session):
         headers.update(self.extra.pop("headers", {}))
         kwargs.update(self.extra)
 
+        if self.singleflight and method == "GET" and not kwargs.get("stream"):
+            key = request_key(url, kwargs.get("params"), headers)
+            return self.singleflight.do(key, lambda: self._fetch(method, url, headers, kwargs))
+
+        return self._fetch(method, url, headers, kwargs)
+
+    def _fetch(self, method: str, url: str, headers: Dict[str, str], kwargs: dict) -> requests.Response:
+        """Gets a response from the cache or the API, raising the API error if any.
+
+        Failed attempts are retried as the retry policy allows.
+        """
+        if self.retry is None:
+            response = self._get(method, url, headers, kwargs)
+            self._parse_error(response)
+
+            return response
+
+        started, attempt = self.retry.clock(), 0
+        while True:
+            try:
+                response = self._get(method, url, headers, kwargs)
+            except Exception as exc:
+                delay = self.retry.delay(method, url, attempt, started, exception=exc)
+                if delay is None:
+                    raise
+            else:
+                delay = self.retry.delay(method, url, attempt, started, response=response)
+                if delay is None:
+                    self._parse_error(response)  # outside the `try`, the attempt was already counted
+
+                    return response
+
+            attempt += 1
+            if self.metrics is not None:
+                self.metrics.count("retries")
+            time.sleep(delay)
+
+    def _parse_error(self, response: requests.Response) -> None:
+        """Raises the API error of a response, if any."""
+        if self.metrics is not None:
+            self.metrics.measure("parse_error", parse_error, response)
+        else:
+            parse_error(response)  # will raise an exception if applicable
+
+    def _get(self, method: str, url: str, headers: Dict[str, str], kwargs: dict) -> requests.Response:
+        """Gets a response from the cache or the API."""
+        ttl = self.cache.ttl(url) if self.cache and method == "GET" and not kwargs.get("stream") else None
+        if ttl:
+            return self._cached(url, ttl, headers, kwargs)
+
+        return self._send(method, url, headers, kwargs)
+
+    def _send(self, method: str, url: str, headers: Dict[str, str], kwargs: dict) -> requests.Response:
+        """Sends a request over the wire, failing over across the hosts of the host pool if any."""
+        if self.host_pool is None or not url.startswith(self.host):
+            return self._send_to(method, url, headers, kwargs)
+
+        path = url[len(self.host) :]
+        return self.host_pool.send(
+            lambda host: self._send_to(method, host + path, headers, kwargs),
+            hedge=method == "GET" and not kwargs.get("stream"),
+        )
+
+    def _send_to(self, method: str, url: str, headers: Dict[str, str], kwargs: dict) -> requests.Response:
+        """Sends a request to one host, paced by the rate limiter."""
+        if self.rate_limiter:
+            self.rate_limiter.acquire()
+
+        start = time.perf_counter()
         response = super().request(
             method,
             url,
@@ -57,6 +151,53 @@ class Session(requests.Session):
             **kwargs,
         )
 
-        parse_error(response)  # will raise an exception if applicable
+        if self.metrics is not None:
+            self.metrics.response(response, time.perf_counter() - start, stream=bool(kwargs.get("stream")))
+
+        if self.rate_limiter:
+            self.rate_limiter.update(response.headers)
+
+        return response
+
+    def _cached(self, url: str, ttl: float, headers: Dict[str, str], kwargs: dict) -> requests.Response:
+        """Serves a GET request from the cache, sending and storing it on a miss."""
+        key = self.cache.key(url, kwargs.get("params"))
+
+        entry, fresh = self.cache.lookup(key)
+        if self.metrics is not None:
+            self.metrics.count("cache.miss" if entry is None else "cache.hit" if fresh else "cache.stale_hit")
+
+        if entry is not None:
+            if not fresh and self.cache.begin_refresh(key):
+                context = contextvars.copy_context()  # keeps the endpoint the refresh's metrics are recorded for
+                threading.Thread(
+                    target=context.run, args=(self._refresh, key, url, ttl, headers, kwargs), daemon=True
+                ).start()
+
+            return self._from_entry(url, entry)
+
+        response = self._send("GET", url, headers, kwargs)
+        self.cache.store(key, ttl, response.status_code, response.headers, response.content)
+
+        return response
+
+    def _refresh(self, key: str, url: str, ttl: float, headers: Dict[str, str], kwargs: dict) -> None:
+        """Replaces a stale cache entry in the background."""
+        try:
+            response = self._send("GET", url, headers, kwargs)
+            self.cache.store(key, ttl, response.status_code, response.headers, response.content)
+        except requests.RequestException:
+            pass  # keep serving the stale entry, the next lookup tries again
+        finally:
+            self.cache.end_refresh(key)
+
+    @staticmethod
+    def _from_entry(url: str, entry: CacheEntry) -> requests.Response:
+        """Rebuilds a response from a cache entry."""
+        response = requests.Response()
+        response.url = url
+        response.status_code = entry.status
+        response.headers = requests.structures.CaseInsensitiveDict(entry.headers)
+        response._content = entry.content
 
         return response
@@ -0,0 +1,48 @@
+import threading
+from concurrent.futures import Future
+from typing import Callable, Dict, Hashable, Mapping, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+def request_key(url: str, params: Optional[Mapping] = None, headers: Optional[Mapping] = None) -> Tuple:
+    """Identifies a GET request by its URL, params and headers."""
+    return (
+        url,
+        tuple(sorted((str(k), str(v)) for k, v in (params or {}).items() if v is not None)),
+        tuple(sorted((headers or {}).items())),
+    )
+
+
+class SingleFlight:
+    """Coalesces concurrent identical calls.
+
+    While a call for a key is running, further calls for the same key wait for it and receive its
+    result, or its exception, instead of running again.
+    """
+
+    def __init__(self) -> None:
+        self._calls: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
@@ -0,0 +1,57 @@
+from typing import TYPE_CHECKING, Any, Collection, Iterable, Iterator
+
+if TYPE_CHECKING:
+    from lxml import etree as ElementTree
+
+# Elements whose children are list items, even if there is only one
+LIST_TAGS = frozenset(
+    {"list", "results", "p2p_results", "uris", "externals", "release_dates", "text_attachments", "filters"}
+)
+
+# Parents of the items yielded while streaming a listing
+ITEM_PARENTS = frozenset({"list", "results", "p2p_results"})
+
+
+def to_data(element: "ElementTree.Element") -> Any:
+    """Turns an XML element into the data the JSON format would hold.
+
+    Values stay strings, which validation coerces to the model's types.
+    """
+    children = list(element)
+    if element.tag in LIST_TAGS:
+        return [to_data(child) for child in children]
+    if not children:
+        return element.text
+
+    return {child.tag: to_data(child) for child in children}
+
+
+def iter_elements(chunks: Iterable[bytes], parents: Collection[str] = ITEM_PARENTS) -> Iterator["ElementTree.Element"]:
+    """Incrementally parses an XML body, yielding the items of its listings as they are complete.
+
+    Every item is cleared once the next one is requested, so only the item being processed is kept in
+    memory, and the first items are available before the whole body has arrived.
+    """
+    from lxml import etree as ElementTree
+
+    parser = ElementTree.XMLPullParser(events=("end",))
+    for chunk in chunks:
+        parser.feed(chunk)
+        for _, element in parser.read_events():
+            parent = element.getparent()
+            if parent is None or parent.tag not in parents:
+                continue
+
+            yield element
+
+            element.clear()
+            while element.getprevious() is not None:
+                del parent[0]
+
+    parser.close()
+
+
+def iter_items(chunks: Iterable[bytes], parents: Collection[str] = ITEM_PARENTS) -> Iterator[Any]:
+    """Like `iter_elements`, but yields the data of every item (see `to_data`)."""
+    for element in iter_elements(chunks, parents):
+        yield to_data(element)
@@ -0,0 +1,436 @@
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Sequence, Union
+
+try:
+    import numpy as np
+except ImportError as e:  # optional dependency
+    raise ImportError("ReleaseTable requires NumPy, install it with `pip install pyxrel[table]`.") from e
+
+from pydantic import BaseModel
+
+from pyxrel.models import Release as ReleaseScene, ReleaseP2P
+from pyxrel.types import ModelMode
+from pyxrel.utils import build
+
+SIZE_UNITS = {"B": 1, "KB": 1024, "MB": 1024**2, "GB": 1024**3, "TB": 1024**4}
+
+# Column name -> NumPy dtype. Optional numbers are NaN when missing, optional strings `None`.
+COLUMNS = {
+    "p2p": np.bool_,
+    "id": object,
+    "dirname": object,
+    "link_href": object,
+    "time": np.int64,  # `time` for scene, `pub_time` for P2P releases
+    "group_name": object,
+    "size": np.int64,  # in bytes
+    "size_unit": object,
+    "video_type": object,
+    "audio_type": object,
+    "num_ratings": np.int32,
+    "comments": np.int32,
+    "tv_season": np.float64,
+    "tv_episode": np.float64,
+    "video_rating": np.float64,
+    "audio_rating": np.float64,
+    "proof_url": object,
+    "english": np.bool_,
+    "fix_rls": np.bool_,
+    "nuke_rls": np.bool_,
+    "top_rls": np.bool_,
+    "ext_info_type": object,
+    "ext_info_id": object,
+    "ext_info_title": object,
+    "ext_info_link_href": object,
+    "ext_info_rating": np.float64,
+    "ext_info_num_ratings": np.float64,
+    "ext_info_uris": object,
+    "main_lang": object,
+    "post_time": np.float64,
+    "group_id": object,
+    "category_id": object,
+    "category_meta_cat": object,
+    "category_sub_cat": object,
+}
+
+# Columns whose values repeat a lot, each distinct value is stored once
+_INTERNED = {
+    "ext_info_uris",
+    "group_name",
+    "size_unit",
+    "video_type",
+    "audio_type",
+    "ext_info_type",
+    "ext_info_id",
+    "ext_info_title",
+    "ext_info_link_href",
+    "main_lang",
+    "group_id",
+    "category_id",
+    "category_meta_cat",
+    "category_sub_cat",
+}
+
+_NAN = float("nan")
+
+
+def _fields(obj: Any) -> dict:
+    """Returns the fields of a model (validated or not) or a raw dict."""
+    if obj is None:
+        return {}
+    if isinstance(obj, BaseModel):
+        return obj.__dict__
+    return obj
+
+
+def _str(value: Any) -> Optional[str]:
+    return None if value is None else str(value)
+
+
+def _num(value: Any) -> float:
+    return _NAN if value is None else value
+
+
+def _row(release: Any) -> tuple:
+    """Flattens a scene or P2P release into a row, in `COLUMNS` order."""
+    fields = _fields(release)
+    p2p = "pub_time" in fields
+
+    ext_info = _fields(fields.get("ext_info"))
+    ext_columns = (
+        ext_info.get("type"),
+        ext_info.get("id"),
+        ext_info.get("title"),
+        _str(ext_info.get("link_href")),
+        _num(ext_info.get("rating")),
+        _num(ext_info.get("num_ratings")),
+        tuple(ext_info.get("uris") or ()),
+    )
+
+    if p2p:
+        group = _fields(fields.get("group"))
+        category = _fields(fields.get("category"))
+        return (
+            True,
+            fields["id"],
+            fields["dirname"],
+            _str(fields["link_href"]),
+            fields["pub_time"],
+            group.get("name"),
+            fields["size_mb"] * SIZE_UNITS["MB"],
+            "MB",
+            None,
+            None,
+            fields["num_ratings"],
+            fields["comments"],
+            _NAN,
+            _NAN,
+            _NAN,
+            _NAN,
+            None,
+            False,
+            False,
+            False,
+            False,
+            *ext_columns,
+            fields["main_lang"],
+            _num(fields.get("post_time")),
+            group.get("id"),
+            category.get("id"),
+            category.get("meta_cat"),
+            category.get("sub_cat"),
+        )
+
+    size = _fields(fields["size"])
+    flags = _fields(fields.get("flags"))
+    return (
+        False,
+        fields["id"],
+        fields["dirname"],
+        _str(fields["link_href"]),
+        fields["time"],
+        fields["group_name"],
+        size["number"] * SIZE_UNITS.get(size["unit"].upper(), 1),
+        size["unit"],
+        fields["video_type"],
+        fields["audio_type"],
+        fields["num_ratings"],
+        fields["comments"],
+        _num(fields.get("tv_season")),
+        _num(fields.get("tv_episode")),
+        _num(fields.get("video_rating")),
+        _num(fields.get("audio_rating")),
+        fields.get("proof_url"),
+        flags.get("english", False),
+        flags.get("fix_rls", False),
+        flags.get("nuke_rls", False),
+        flags.get("top_rls", False),
+        *ext_columns,
+        None,
+        _NAN,
+        None,
+        None,
+        None,
+        None,
+    )
+
+
+def _column(name: str, values: Sequence) -> np.ndarray:
+    dtype = COLUMNS[name]
+    if dtype is object:
+        column = np.empty(len(values), dtype=object)
+        if name in _INTERNED:
+            distinct = {}
+            column[:] = [distinct.setdefault(value, value) for value in values]
+        else:
+            column[:] = list(values)
+
+        return column
+
+    return np.asarray(values, dtype=dtype)
+
+
+def _optional_int(value: float) -> Optional[int]:
+    return None if value != value else int(value)  # NaN != NaN
+
+
+def _present(data: dict) -> dict:
+    """Leaves out missing values, some optional model fields default to `None` but reject it."""
+    return {name: value for name, value in data.items() if value is not None}
+
+
+def _key(value: Any) -> Any:
+    """Turns NumPy scalars into plain Python values."""
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def _missing(column: np.ndarray) -> np.ndarray:
+    """Returns a mask of the missing values of a column, `None` in object and NaN in float columns."""
+    if column.dtype == object:
+        return np.fromiter((value is None for value in column), dtype=bool, count=len(column))
+    if column.dtype.kind == "f":
+        return np.isnan(column)
+
+    return np.zeros(len(column), dtype=bool)
+
+
+class ReleaseTable:
+    """A column-oriented table of scene and/or P2P releases, backed by NumPy arrays.
+
+    Build it from listing pages or any iterable of releases (models or raw dicts), then filter, sort and
+    aggregate whole columns at once. Rows are only turned back into models when accessed.
+
+    Sizes are normalized to bytes in `size`. P2P releases store `pub_time` in `time`, and their group name
+    in `group_name`. See `COLUMNS` for all columns.
+    """
+
+    def __init__(self, columns: Dict[str, np.ndarray]) -> None:
+        lengths = {len(column) for column in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError("All columns must have the same length.")
+
+        self.columns = columns
+
+    @classmethod
+    def from_releases(cls, releases: Iterable[Any]) -> "ReleaseTable":
+        """Builds a table from scene and/or P2P releases, as models or raw dicts."""
+        rows = [_row(release) for release in releases]
+        values = zip(*rows) if rows else ([] for _ in COLUMNS)
+
+        return cls({name: _column(name, column) for name, column in zip(COLUMNS, values)})
+
+    @classmethod
+    def from_pages(cls, pages: Iterable[Any]) -> "ReleaseTable":
+        """Builds a table from `Releases`/`ReleasesP2P` pages, as models or raw dicts."""
+        return cls.from_releases(
+            release for page in pages for release in (page["list"] if isinstance(page, dict) else page.list)
+        )
+
+    @classmethod
+    def concat(cls, tables: Iterable["ReleaseTable"]) -> "ReleaseTable":
+        """Joins several tables into one."""
+        tables = list(tables)
+        if not tables:
+            return cls.from_releases([])
+
+        return cls({name: np.concatenate([table.columns[name] for table in tables]) for name in COLUMNS})
+
+    def __len__(self) -> int:
+        return len(self.columns["id"])
+
+    def __repr__(self) -> str:
+        return f"<ReleaseTable: {len(self)} releases>"
+
+    def __getitem__(self, key: Union[str, int, slice, Sequence[int], np.ndarray]) -> Any:
+        """Returns a column by name, a release by position, or a sub-table for a slice, mask or indices."""
+        if isinstance(key, str):
+            return self.columns[key]
+        if isinstance(key, (int, np.integer)):
+            return self.row(int(key))
+
+        return ReleaseTable({name: column[key] for name, column in self.columns.items()})
+
+    def __iter__(self) -> Iterator[Union[ReleaseScene, ReleaseP2P]]:
+        return self.to_models()
+
+    def where(self, **conditions: Any) -> "ReleaseTable":
+        """Keeps the rows whose columns equal the given values, or are in the given lists/sets."""
+        mask = np.ones(len(self), dtype=bool)
+        for name, value in conditions.items():
+            column = self.columns[name]
+            if isinstance(value, (list, tuple, set, frozenset)):
+                mask &= np.isin(column, list(value))
+            else:
+                mask &= column == value
+
+        return self[mask]
+
+    def sort(self, by: str, descending: bool = False) -> "ReleaseTable":
+        """Returns the table sorted by a column.
+
+        The sort is stable in both directions, rows with equal values keep their order. Missing values
+        come last.
+        """
+        column = self.columns[by]
+        missing = _missing(column)
+        present = np.flatnonzero(~missing)
+
+        values = column[present]
+        if descending:
+            # Sorting the reversed values and reversing the result keeps ties in their original order
+            order = present[::-1][np.argsort(values[::-1], kind="stable")][::-1]
+        else:
+            order = present[np.argsort(values, kind="stable")]
+
+        return self[np.concatenate([order, np.flatnonzero(missing)])]
+
+    def group_by(self, by: str) -> "GroupBy":
+        """Groups the rows by the values of a column."""
+        return GroupBy(self, by)
+
+    def row(self, index: int, mode: ModelMode = "construct") -> Union[ReleaseScene, ReleaseP2P]:
+        """Rebuilds the release at a position as a model (not validated again by default)."""
+        values = {name: column[index] for name, column in self.columns.items()}
+
+        ext_info = _present(
+            {
+                "type": values["ext_info_type"],
+                "id": values["ext_info_id"],
+                "title": values["ext_info_title"],
+                "link_href": values["ext_info_link_href"],
+                "rating": None if np.isnan(values["ext_info_rating"]) else float(values["ext_info_rating"]),
+                "num_ratings": _optional_int(values["ext_info_num_ratings"]),
+                "uris": list(values["ext_info_uris"]),
+            }
+        )
+        common = {
+            "id": values["id"],
+            "dirname": values["dirname"],
+            "link_href": values["link_href"],
+            "num_ratings": int(values["num_ratings"]),
+            "comments": int(values["comments"]),
+            "ext_info": ext_info,
+        }
+
+        if values["p2p"]:
+            data = {
+                **common,
+                "category": {
+                    "id": values["category_id"],
+                    "meta_cat": values["category_meta_cat"],
+                    "sub_cat": values["category_sub_cat"],
+                }
+                if values["category_id"] is not None
+                else None,
+                "main_lang": values["main_lang"],
+                "pub_time": int(values["time"]),
+                "post_time": _optional_int(values["post_time"]),
+                "size_mb": int(values["size"]) // SIZE_UNITS["MB"],
+                "group": {"id": values["group_id"], "name": values["group_name"]}
+                if values["group_id"] is not None
+                else None,
+            }
+            return build(ReleaseP2P, _present(data), mode)
+
+        unit = values["size_unit"]
+        data = {
+            **common,
+            "time": int(values["time"]),
+            "group_name": values["group_name"],
+            "size": {"number": int(values["size"]) // SIZE_UNITS.get(unit.upper(), 1), "unit": unit},
+            "video_type": values["video_type"],
+            "audio_type": values["audio_type"],
+            "tv_season": _optional_int(values["tv_season"]),
+            "tv_episode": _optional_int(values["tv_episode"]),
+            "video_rating": None if np.isnan(values["video_rating"]) else float(values["video_rating"]),
+            "audio_rating": None if np.isnan(values["audio_rating"]) else float(values["audio_rating"]),
+            "proof_url": values["proof_url"],
+            "flags": {flag: bool(values[flag]) for flag in ("english", "fix_rls", "nuke_rls", "top_rls")},
+        }
+        return build(ReleaseScene, _present(data), mode)
+
+    def to_models(self, mode: ModelMode = "construct") -> Iterator[Union[ReleaseScene, ReleaseP2P]]:
+        """Lazily rebuilds every row as a model."""
+        return (self.row(index, mode) for index in range(len(self)))
+
+
+class GroupBy:
+    """Aggregations over the groups of a `ReleaseTable`, returned as `{group key: value}`."""
+
+    def __init__(self, table: ReleaseTable, by: str) -> None:
+        self.table = table
+
+        column = table.columns[by]
+        missing = _missing(column) if column.dtype == object else np.zeros(len(column), dtype=bool)
+        keys, inverse = np.unique(column[~missing], return_inverse=True)
+
+        # Rows without a value form their own group, with the key `None`
+        self.inverse = np.full(len(column), len(keys), dtype=np.intp)
+        self.inverse[~missing] = inverse.ravel()
+        if missing.any():
+            keys = np.append(keys.astype(object), None)
+        self.keys = keys
+
+    def _result(self, values: np.ndarray) -> Dict[Any, Any]:
+        return {_key(key): value.item() for key, value in zip(self.keys, values)}
+
+    def count(self) -> Dict[Any, int]:
+        """Number of releases per group."""
+        return self._result(np.bincount(self.inverse, minlength=len(self.keys)))
+
+    def sum(self, column: str) -> Dict[Any, Any]:
+        """Sum of a numeric column per group, as integers for integer and boolean columns."""
+        values = self.table.columns[column]
+        if values.dtype.kind in "iub":
+            totals = np.zeros(len(self.keys), dtype=np.uint64 if values.dtype.kind == "u" else np.int64)
+            np.add.at(totals, self.inverse, values)
+            return self._result(totals)
+
+        return self._result(np.bincount(self.inverse, values, minlength=len(self.keys)))
+
+    def mean(self, column: str) -> Dict[Any, float]:
+        """Mean of a numeric column per group."""
+        totals = np.bincount(self.inverse, self.table.columns[column], minlength=len(self.keys))
+        return self._result(totals / np.bincount(self.inverse, minlength=len(self.keys)))
+
+    def min(self, column: str) -> Dict[Any, Any]:
+        """Smallest value of a numeric column per group."""
+        return self._reduce(column, np.minimum)
+
+    def max(self, column: str) -> Dict[Any, Any]:
+        """Largest value of a numeric column per group."""
+        return self._reduce(column, np.maximum)
+
+    def agg(self, column: str, fn: Callable[[np.ndarray], Any]) -> Dict[Any, Any]:
+        """Applies any function to the values of a column, group by group."""
+        values = self.table.columns[column]
+        order = np.argsort(self.inverse, kind="stable")
+        bounds = np.cumsum(np.bincount(self.inverse, minlength=len(self.keys)))[:-1]
+
+        return {_key(key): fn(group) for key, group in zip(self.keys, np.split(values[order], bounds))}
+
+    def _reduce(self, column: str, ufunc: np.ufunc) -> Dict[Any, Any]:
+        values = self.table.columns[column]
+        initial = values[np.unique(self.inverse, return_index=True)[1]]
+        result = initial.copy()
+        ufunc.at(result, self.inverse, values)
+
+        return self._result(result)
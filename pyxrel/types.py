@@ -3,3 +3,9 @@ from typing import Literal
 ExtInfoType = Literal["movie", "tv", "game", "console", "software", "xxx"]
 
 ReleaseType = Literal["scene", "p2p"]
+
+# How responses are turned into models: validated pydantic models, models built without validation, or raw dicts
+ModelMode = Literal["validate", "construct", "raw"]
+
+# Where `Search` looks: only the local mirror, the mirror with the API as fallback, or only the API
+SearchSource = Literal["local", "local-first", "remote"]
@@ -1,9 +1,42 @@
-from typing import Optional, Union
-from lxml import etree as ElementTree
+import copy
+import re
+from concurrent.futures import ThreadPoolExecutor, as_completed as futures_completed
+from functools import lru_cache, partial
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+)
+from pydantic import BaseModel
 
 from pyxrel.session import Session
 from pyxrel.oauth2 import OAuth2
 from pyxrel.constants import TYPE_MAP
+from pyxrel.decoder import decode as decode_json
+from pyxrel.streaming import iter_items
+from pyxrel.types import ModelMode
+
+if TYPE_CHECKING:
+    from lxml import etree as ElementTree
+
+    from pyxrel.metrics import Metrics
+    from pyxrel.mirror import Mirror
+
+T = TypeVar("T")
+R = TypeVar("R")
+M = TypeVar("M", bound=BaseModel)
+
+_RELEASE_ID = re.compile(r"^[0-9a-f]+$")
 
 
 def get_rls_type(type: str, short: bool = False) -> str:
@@ -16,15 +49,157 @@ def get_rls_type(type: str, short: bool = False) -> str:
     return type
 
 
-def call(
-    session: Session,
-    resource: str,
-    format: Optional[str] = "json",
-    scope: Optional[str] = None,
-    oauth2: OAuth2 = None,
-    **kwargs,
-) -> Union[dict, ElementTree.Element, bytes]:
-    """Makes a request to the xREL.to API."""
+def _model_of(annotation: Any) -> Tuple[Optional[Type[BaseModel]], bool]:
+    """Returns the model class within a field annotation, and whether the field holds a list of them."""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation, False
+
+    origin = get_origin(annotation)
+    if origin in (list, List):
+        return _model_of(get_args(annotation)[0])[0], True
+    if origin is Union:
+        for arg in get_args(annotation):
+            model, many = _model_of(arg)
+            if model:
+                return model, many
+
+    return None, False
+
+
+@lru_cache(maxsize=None)
+def _construct_plan(model: Type[BaseModel]) -> Tuple[tuple, tuple]:
+    """Returns the fields of a model holding nested models, and the defaults of optional fields."""
+    nested, defaults = [], []
+    for name, field in model.model_fields.items():
+        target, many = _model_of(field.annotation)
+        if target:
+            nested.append((name, target, many))
+        if not field.is_required():
+            defaults.append((name, field.default, isinstance(field.default, (list, dict, set))))
+
+    return tuple(nested), tuple(defaults)
+
+
+def construct(model: Type[M], data: dict) -> M:
+    """Builds a model and its nested models from trusted data, skipping validation.
+
+    Does what `BaseModel.model_construct` does, minus its generic bookkeeping (aliases, extras, private
+    attributes), none of which the xREL models use. `model_construct` itself is slower than validating.
+    """
+    nested, defaults = _construct_plan(model)
+
+    values = dict(data)
+    fields_set = set(values)
+
+    for name, target, many in nested:
+        value = values.get(name)
+        if many and isinstance(value, list):
+            values[name] = [construct(target, item) if isinstance(item, dict) else item for item in value]
+        elif isinstance(value, dict):
+            values[name] = construct(target, value)
+
+    for name, default, mutable in defaults:
+        if name not in values:
+            values[name] = copy.copy(default) if mutable else default
+
+    instance = model.__new__(model)
+    object.__setattr__(instance, "__dict__", values)
+    object.__setattr__(instance, "__pydantic_fields_set__", fields_set)
+    object.__setattr__(instance, "__pydantic_extra__", None)
+    object.__setattr__(instance, "__pydantic_private__", None)
+
+    return instance
+
+
+def build(
+    model: Type[M],
+    data: dict,
+    mode: ModelMode = "validate",
+    mirror: Optional["Mirror"] = None,
+    metrics: Optional["Metrics"] = None,
+) -> M:
+    """Turns response data into a model according to the given mode.
+
+    * `validate`: a validated pydantic model.
+    * `construct`: a model built without validation (see `construct`), for trusted data.
+    * `raw`: the data itself, shaped like the model.
+
+    Releases and Ext Infos within the data are stored in the `mirror`, and the time taken is recorded as
+    the `validation` phase of `metrics`, if given.
+    """
+    if mirror is not None:
+        mirror.observe(model, data)
+    if metrics is not None:
+        return metrics.measure("validation", build, model, data, mode)
+
+    if mode == "validate":
+        return model(**data)
+    if mode == "construct":
+        return construct(model, data)
+    if mode == "raw":
+        return data
+
+    raise ValueError(f"Expected mode to be 'validate', 'construct' or 'raw', not {mode!r}.")
+
+
+def is_release_id(value: str) -> bool:
+    """Tells API release ids (hexadecimal) apart from release dirnames."""
+    return bool(_RELEASE_ID.match(value))
+
+
+def gather(fn: Callable[[T], R], items: Iterable[T], max_workers: int = 8) -> List[Union[R, Exception]]:
+    """Calls `fn` for every item on a thread pool.
+
+    Returns the results in input order, with the raised exception in place of a result for failed items.
+    """
+
+    def run(item: T) -> Union[R, Exception]:
+        try:
+            return fn(item)
+        except Exception as e:
+            return e
+
+    items = list(items)
+    if max_workers <= 1 or len(items) <= 1:
+        return [run(item) for item in items]
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items)), thread_name_prefix="pyxrel-gather") as executor:
+        return list(executor.map(run, items))
+
+
+def as_completed(
+    fn: Callable[[T], R], items: Iterable[T], max_workers: int = 8
+) -> Iterator[Tuple[T, Union[R, Exception]]]:
+    """Calls `fn` for every item on a thread pool like `gather`, but yields `(item, result)` pairs as they complete.
+
+    Items not yet started are cancelled when the iterator is closed early.
+    """
+
+    def run(item: T) -> Union[R, Exception]:
+        try:
+            return fn(item)
+        except Exception as e:
+            return e
+
+    items = list(items)
+    if not items:
+        return
+
+    executor = ThreadPoolExecutor(
+        max_workers=max(min(max_workers, len(items)), 1), thread_name_prefix="pyxrel-gather"
+    )
+    try:
+        futures = {executor.submit(run, item): item for item in items}
+        for future in futures_completed(futures):
+            yield futures[future], future.result()
+    finally:
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+def _authorize(kwargs: dict, scope: Optional[str], oauth2: Optional[OAuth2]) -> None:
+    """Adds the access token for a scope to the request headers, if a scope is required."""
     if scope:
         if not oauth2:
             raise ValueError("No OAuth2 instance provided.")
@@ -34,6 +209,18 @@ def call(
             "Authorization": f"Bearer {oauth2.get_access_token(scope)}",
         }
 
+
+def call(
+    session: Session,
+    resource: str,
+    format: Optional[str] = "json",
+    scope: Optional[str] = None,
+    oauth2: OAuth2 = None,
+    **kwargs,
+) -> Union[dict, "ElementTree.Element", bytes]:
+    """Makes a request to the xREL.to API."""
+    _authorize(kwargs, scope, oauth2)
+
     resource += (
         f".{format}" if format else ".json"
     )  # Errors will be JSON even if the successful response is another format, kinda dirty. TODO: fix this
@@ -41,8 +228,33 @@ def call(
     resp = session.get(resource, **kwargs)
 
     if format == "json":
-        return resp.json()
-    if format == "xml":
-        return ElementTree.fromstring(resp.content)
+        decode = partial(decode_json, resp)
+    elif format == "xml":
+        from lxml import etree as ElementTree  # XML is rarely used, don't load lxml up front
+
+        decode = partial(ElementTree.fromstring, resp.content)
+    else:
+        return resp.content
+
+    if session.metrics is not None:
+        return session.metrics.measure("decode", decode)
+
+    return decode()
+
+
+def stream(
+    session: Session,
+    resource: str,
+    scope: Optional[str] = None,
+    oauth2: OAuth2 = None,
+    chunk_size: int = 64 * 1024,
+    **kwargs,
+) -> Iterator[Any]:
+    """Requests the XML format of a listing and yields the data of its items while the body downloads.
+
+    See `pyxrel.streaming` for how the items are found and turned into data.
+    """
+    _authorize(kwargs, scope, oauth2)
 
-    return resp.content
+    with session.get(f"{resource}.xml", stream=True, **kwargs) as resp:
+        yield from iter_items(resp.iter_content(chunk_size=chunk_size))
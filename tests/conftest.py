@@ -0,0 +1,72 @@
+import json
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+
+class Clock:
+    """A manually advanced clock for time-dependent logic."""
+
+    def __init__(self, now: float = 1_000_000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def clock() -> Clock:
+    return Clock()
+
+
+def release(i: int, time: int = None, **fields) -> dict:
+    """Raw data of a scene release, as `release/latest` returns it."""
+    return {
+        "id": f"{i:010x}",
+        "dirname": f"Some.Movie.{i}.2023.1080p.WEB.h264-GRP{i % 3}",
+        "link_href": f"https://www.xrel.to/release/{i}.html",
+        "time": 1_700_000_000 - i * 60 if time is None else time,
+        "group_name": f"GRP{i % 3}",
+        "size": {"number": 1000 + i, "unit": "MB"},
+        "video_type": "WEB",
+        "audio_type": "AC3",
+        "num_ratings": 0,
+        "ext_info": {
+            "type": "movie",
+            "id": f"e{i % 4}",
+            "title": f"Movie {i % 4}",
+            "link_href": f"https://www.xrel.to/movie/{i % 4}.html",
+        },
+        "comments": 0,
+        "flags": {"nuke_rls": i % 2 == 0},
+        **fields,
+    }
+
+
+class APISession:
+    """A fake `Session` answering every request with `handler(resource, params)`, which returns data or raises."""
+
+    def __init__(self, handler, metrics=None) -> None:
+        self.handler = handler
+        self.metrics = metrics
+        self.requests = []
+        self._lock = threading.Lock()
+
+    def get(self, resource: str, params: dict = None, **kwargs) -> SimpleNamespace:
+        params = dict(params or {})
+        with self._lock:
+            self.requests.append((resource, params))
+        if self.metrics is not None:
+            self.metrics.enter(resource.strip("/").rsplit(".", 1)[0])
+        return SimpleNamespace(content=json.dumps(self.handler(resource, params)).encode())
+
+
+class AsyncAPISession(APISession):
+    """`APISession` for the async resources."""
+
+    async def get(self, resource: str, params: dict = None, **kwargs) -> SimpleNamespace:
+        return super().get(resource, params, **kwargs)
@@ -0,0 +1,70 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from benchmarks import payloads, server  # noqa: E402
+from pyxrel.aio import AsyncXREL  # noqa: E402
+from pyxrel.exceptions import CloudflareError, IDNotFoundError, NotFoundError, RateLimitError  # noqa: E402
+
+DIRNAME = payloads.release(1)["dirname"]
+
+
+@pytest.fixture(scope="module")
+def host():
+    httpd, host = server.start()
+    yield host
+    httpd.shutdown()
+
+
+def run(host, fn):
+    """Runs `fn(client)` with a fresh `AsyncXREL` against the mock server."""
+
+    async def main():
+        async with AsyncXREL(host) as client:
+            return await fn(client)
+
+    return asyncio.run(main())
+
+
+def test_release(host):
+    release = run(host, lambda client: client.release(dirname=DIRNAME))
+    assert release.dirname == DIRNAME
+    assert release.ext_info.id == payloads.release(1)["ext_info"]["id"]
+
+
+def test_latest(host):
+    page = run(host, lambda client: client.latest(per_page=5))
+    assert len(page.list) == 5
+    assert page.pagination.total_pages == 100
+
+
+@pytest.mark.parametrize(
+    "resource, error",
+    [("bench/not_found", NotFoundError), ("bench/ratelimited", RateLimitError), ("bench/cloudflare", CloudflareError)],
+)
+def test_errors(host, resource, error):
+    with pytest.raises(error):
+        run(host, lambda client: client.call(resource))
+
+
+def test_many_looks_up_duplicates_once(host):
+    results = run(host, lambda client: client.release.many([DIRNAME, "0000000001", DIRNAME]))
+    assert [release.dirname for release in results] == [DIRNAME] * 3
+    assert results[0] is results[2]
+
+
+def test_many_returns_errors_in_place(host):
+    results = run(host, lambda client: client.release.many([DIRNAME, server.MISSING_ID]))
+    assert results[0].dirname == DIRNAME
+    assert isinstance(results[1], IDNotFoundError)
+
+
+def test_iter_latest(host):
+    async def collect(client):
+        return [release async for release in client.iter_latest(per_page=5, max_pages=3)]
+
+    releases = run(host, collect)
+    assert len(releases) == 15
+    assert [release.dirname for release in releases[:5]] == [payloads.release(i)["dirname"] for i in range(5)]
@@ -0,0 +1,14 @@
+import inspect
+
+import pytest
+
+from pyxrel.api import XREL
+
+
+@pytest.mark.parametrize("name", ["latest", "scene_releases", "p2p_releases"])
+def test_iterators_take_the_same_positional_arguments(name):
+    """Positional calls copied from a listing method must mean the same for its `iter_*` counterpart."""
+    listing = [p for p in inspect.signature(getattr(XREL, name)).parameters if p != "mode"]
+    iterator = list(inspect.signature(getattr(XREL, f"iter_{name}")).parameters)
+
+    assert iterator[: len(listing)] == listing
@@ -0,0 +1,82 @@
+import time
+
+from pyxrel.cache import Cache, MemoryCache, SQLiteCache
+
+
+def test_endpoint_strips_host_version_and_format():
+    assert Cache.endpoint("https://api.xrel.to/v2/release/info.json") == "release/info"
+    assert Cache.endpoint("https://api.xrel.to/v2/release/latest.xml") == "release/latest"
+
+
+def test_key_normalizes_params():
+    url = "https://api.xrel.to/v2/release/latest.json"
+    assert Cache.key(url, {"per_page": 5, "page": 1}) == Cache.key(url, {"page": "1", "per_page": "5", "x": None})
+    assert Cache.key(url, {"page": 1}) != Cache.key(url, {"page": 2})
+
+
+def test_key_keeps_the_format():
+    params = {"per_page": 5}
+    json_key = Cache.key("https://api.xrel.to/v2/release/latest.json", params)
+    xml_key = Cache.key("https://api.xrel.to/v2/release/latest.xml", params)
+
+    assert json_key != xml_key
+    assert Cache.endpoint("https://api.xrel.to/v2/release/latest.xml") == "release/latest"
+
+
+def test_ttl_per_endpoint():
+    cache = MemoryCache(ttls={"release/latest": 10, "release/info": None})
+    assert cache.ttl("https://api.xrel.to/v2/release/latest.json") == 10
+    assert cache.ttl("https://api.xrel.to/v2/release/info.json") is None
+    assert cache.ttl("https://api.xrel.to/v2/unknown/endpoint.json") is None
+
+
+def test_lookup_fresh_stale_and_expired():
+    cache = MemoryCache(stale_ttl=60)
+    cache.store("k", 10, 200, {}, b"{}")
+    assert cache.lookup("k")[1] is True
+
+    entry = cache.get("k")
+    cache.set("k", entry._replace(expires_at=time.time() - 1))
+    found, fresh = cache.lookup("k")
+    assert found is not None and not fresh
+
+    cache.set("k", entry._replace(expires_at=time.time() - 61))
+    assert cache.lookup("k") == (None, False)
+    assert cache.stats() == {"hits": 1, "stale_hits": 1, "misses": 1}
+
+
+def test_store_only_ok_and_capped_not_found():
+    cache = MemoryCache(negative_ttl=5)
+    cache.store("ok", 3600, 200, {}, b"")
+    cache.store("error", 3600, 500, {}, b"")
+    cache.store("missing", 3600, 404, {}, b"")
+
+    assert cache.get("error") is None
+    assert cache.get("ok").expires_at > time.time() + 3000
+    assert cache.get("missing").expires_at <= time.time() + 5
+
+
+def test_memory_cache_evicts_least_recently_used():
+    cache = MemoryCache(max_size=2)
+    for key in ("a", "b"):
+        cache.store(key, 60, 200, {}, b"")
+    cache.get("a")
+    cache.store("c", 60, 200, {}, b"")
+
+    assert cache.get("a") is not None and cache.get("b") is None and cache.get("c") is not None
+
+
+def test_begin_refresh_once_per_key():
+    cache = MemoryCache()
+    assert cache.begin_refresh("k")
+    assert not cache.begin_refresh("k")
+    cache.end_refresh("k")
+    assert cache.begin_refresh("k")
+
+
+def test_sqlite_cache_roundtrip(tmp_path):
+    cache = SQLiteCache(str(tmp_path / "cache.db"))
+    cache.store("k", 60, 200, {"X-Test": "1"}, b"body")
+
+    entry = SQLiteCache(str(tmp_path / "cache.db")).get("k")
+    assert (entry.status, entry.headers, entry.content) == (200, {"X-Test": "1"}, b"body")
@@ -0,0 +1,100 @@
+import asyncio
+import json
+
+import pytest
+
+from pyxrel.metrics import Metrics
+from pyxrel.models import Upcoming
+from pyxrel.resources import Calendar
+from pyxrel.resources.calendar import merge_upcoming
+
+from tests.conftest import APISession, AsyncAPISession
+
+
+def movie(id, *releases):
+    return {
+        "type": "movie",
+        "id": id,
+        "title": f"Movie {id}",
+        "link_href": f"https://www.xrel.to/movie/{id}.html",
+        "releases": [
+            {
+                "id": release,
+                "dirname": f"Movie.{release}-GRP",
+                "link_href": f"https://www.xrel.to/release/{release}.html",
+                "time": 1_700_000_000,
+                "flags": {},
+            }
+            for release in releases
+        ],
+    }
+
+
+CALENDARS = {"de": [movie("e1", "r1"), movie("e2")], "us": [movie("e1", "r1", "r2"), movie("e3", "r3")]}
+
+
+def upcoming(resource, params):
+    if params["country"] not in CALENDARS:
+        raise ConnectionError(params["country"])
+    return CALENDARS[params["country"]]
+
+
+def releases(item):
+    return [release.id for release in item.releases]
+
+
+def test_upcoming_many_merges_countries():
+    session = APISession(upcoming)
+
+    merged = Calendar(session).upcoming_many(["de", "us", "de", "xx"], ttl=None)
+
+    assert sorted(params["country"] for _, params in session.requests) == ["de", "us", "xx"]
+    assert [item.id for item in merged.upcoming.list] == ["e1", "e2", "e3"]
+    assert [releases(item) for item in merged.upcoming.list] == [["r1", "r2"], [], ["r3"]]
+    assert merged.countries == {"e1": ["de", "us"], "e2": ["de"], "e3": ["us"]}
+    assert list(merged.errors) == ["xx"] and isinstance(merged.errors["xx"], ConnectionError)
+
+
+def test_upcoming_many_keeps_complete_results():
+    session = APISession(upcoming)
+    calendar = Calendar(session)
+
+    assert calendar.upcoming_many(["de", "us"]) is calendar.upcoming_many(["us", "de"])
+    assert len(session.requests) == 2
+
+    calendar.upcoming_many(["de", "xx"])
+    calendar.upcoming_many(["de", "xx"])
+    assert len(session.requests) == 6  # not kept with errors
+
+
+def test_upcoming_many_validates_for_the_endpoint():
+    metrics = Metrics()
+
+    Calendar(APISession(upcoming, metrics)).upcoming_many(["de", "us"], ttl=None)
+
+    snapshot = metrics.snapshot()
+    assert list(snapshot) == ["calendar/upcoming"]
+    assert snapshot["calendar/upcoming"]["phases"]["validation"]["count"] == 2
+
+
+def test_merge_raw_calendars():
+    raw = json.loads(json.dumps(CALENDARS))
+    merged, countries = merge_upcoming([("us", {"list": raw["us"]}), ("de", {"list": raw["de"]})], "raw")
+
+    assert [item["id"] for item in merged["list"]] == ["e1", "e3", "e2"]
+    assert [release["id"] for release in merged["list"][0]["releases"]] == ["r1", "r2"]
+    assert countries["e1"] == ["us", "de"]
+
+
+def test_async_upcoming_many_merges_countries():
+    pytest.importorskip("aiohttp")
+    from pyxrel.aio.resources.calendar import AsyncCalendar
+
+    metrics = Metrics()
+    session = AsyncAPISession(upcoming, metrics)
+    merged = asyncio.run(AsyncCalendar(session).upcoming_many(["de", "us", "xx"], ttl=None))
+
+    assert isinstance(merged.upcoming, Upcoming)
+    assert [releases(item) for item in merged.upcoming.list] == [["r1", "r2"], [], ["r3"]]
+    assert list(merged.errors) == ["xx"]
+    assert list(metrics.snapshot()) == ["calendar/upcoming"]
@@ -0,0 +1,124 @@
+import time
+
+import pytest
+
+from pyxrel.comments import CommentSync
+from pyxrel.resources import Release
+
+from tests.conftest import APISession
+
+NOW = int(time.time())
+
+
+def comment(i, time, edit=None):
+    return {
+        "id": f"c{i}",
+        "time": time,
+        "author": {"id": "u1", "name": "someone"},
+        "link_href": f"https://www.xrel.to/comments/{i}.html",
+        "text": f"Comment {i}",
+        "text_preview_html": None,
+        "text_attachments": None,
+        "rating": {},
+        "votes": {},
+        "edits": {"count": 1, "last": edit} if edit else {"count": 0},
+    }
+
+
+class Thread:
+    """Fake `comments/get` pages of one release, `per_page` comments each, newest- or oldest-first."""
+
+    def __init__(self, comments, per_page=3, oldest_first=False):
+        self.comments = comments
+        self.per_page = per_page
+        self.oldest_first = oldest_first
+
+    def __call__(self, resource, params):
+        ordered = sorted(self.comments, key=lambda comment: comment["time"] * (1 if self.oldest_first else -1))
+        total_pages = max(1, -(-len(ordered) // self.per_page))
+        start = (params["page"] - 1) * self.per_page
+        return {
+            "total_count": len(ordered),
+            "pagination": {"current_page": params["page"], "per_page": self.per_page, "total_pages": total_pages},
+            "list": ordered[start : start + self.per_page],
+        }
+
+
+def sync(thread, **kwargs):
+    session = APISession(thread)
+    return CommentSync(Release(session), **kwargs), session
+
+
+def ids(comments):
+    return [comment.id for comment in comments]
+
+
+@pytest.fixture
+def thread():
+    return Thread([comment(i, NOW - 1000 + i * 10) for i in range(8)])
+
+
+def test_first_sync_reports_every_comment(thread, tmp_path):
+    state = str(tmp_path / "comments.json")
+    comments, session = sync(thread, state=state)
+
+    delta = comments.poll(["r1"])["r1"]
+
+    assert ids(delta.new) == [f"c{i}" for i in range(8)] and delta.edited == []
+    assert delta.total_count == 8 and len(session.requests) == 3
+    assert CommentSync(Release(session), state=state).watermarks["r1"]["ids"] == ["c7"]
+
+
+def test_unchanged_thread_costs_one_request(thread):
+    comments, session = sync(thread)
+    comments.poll(["r1"])
+    session.requests.clear()
+
+    delta = comments.poll_one("r1")
+
+    assert delta.new == [] and delta.edited == []
+    assert [params["page"] for _, params in session.requests] == [1]
+
+
+def test_new_comment_at_the_watermark_time(thread):
+    comments, _ = sync(thread)
+    comments.poll_one("r1")
+    thread.comments.append(comment(8, thread.comments[-1]["time"]))
+
+    assert ids(comments.poll_one("r1").new) == ["c8"]
+    assert ids(comments.poll_one("r1").new) == []
+
+
+def test_edit_inside_the_edit_window(thread):
+    comments, _ = sync(thread, edit_window=3600)
+    comments.poll_one("r1")
+    thread.comments[1] = comment(1, thread.comments[1]["time"], edit=NOW)
+
+    delta = comments.poll_one("r1")
+    assert delta.new == [] and ids(delta.edited) == ["c1"]
+
+    comments, _ = sync(thread)  # without a window, only the newest page is read
+    comments.poll_one("r1")
+    thread.comments[1] = comment(1, thread.comments[1]["time"], edit=NOW + 1)
+    assert comments.poll_one("r1").edited == []
+
+
+def test_oldest_first_thread_is_read_from_its_last_page():
+    thread = Thread([comment(i, NOW - 1000 + i * 10) for i in range(8)], oldest_first=True)
+    comments, session = sync(thread)
+    comments.poll_one("r1")
+    thread.comments.append(comment(8, NOW))
+    session.requests.clear()
+
+    assert ids(comments.poll_one("r1").new) == ["c8"]
+    assert [params["page"] for _, params in session.requests] == [1, 3]
+
+
+def test_oldest_first_thread_starting_with_one_second():
+    same_second = [comment(i, NOW - 1000) for i in range(3)]
+    thread = Thread(same_second + [comment(3, NOW - 500)], per_page=2, oldest_first=True)
+    comments, _ = sync(thread)
+    assert ids(comments.poll_one("r1").new) == ["c0", "c1", "c2", "c3"]
+
+    thread.comments.append(comment(4, NOW))
+    assert ids(comments.poll_one("r1").new) == ["c4"]
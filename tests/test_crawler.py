@@ -0,0 +1,104 @@
+import json
+import threading
+
+import pytest
+
+from pyxrel.crawler import ArchiveCrawler, month_range
+
+
+class Archive:
+    """A fake client whose `latest(archive=...)` serves `pages[month]` pages per month."""
+
+    def __init__(self, pages, fail=()):
+        self.pages = pages
+        self.fail = set(fail)
+        self.requests = []
+        self._lock = threading.Lock()
+
+    def latest(self, archive=None, per_page=25, page=1, filter=None, mode=None):
+        with self._lock:
+            self.requests.append((archive, page))
+        if (archive, page) in self.fail:
+            raise ConnectionError(f"{archive} page {page}")
+
+        return {
+            "total_count": self.pages[archive] * per_page,
+            "pagination": {"current_page": page, "per_page": per_page, "total_pages": self.pages[archive]},
+            "list": [],
+        }
+
+
+def crawl(client, state, **kwargs):
+    sunk = []
+    crawler = ArchiveCrawler(client, ["2024-01", "2024-02"], lambda *unit: sunk.append(unit[:2]), state, **kwargs)
+    crawler.run()
+    return crawler, sunk
+
+
+def test_month_range():
+    assert month_range("2023-11", "2024-02") == ["2023-11", "2023-12", "2024-01", "2024-02"]
+
+
+def test_crawls_every_page(tmp_path):
+    client = Archive({"2024-01": 3, "2024-02": 2})
+    crawler, sunk = crawl(client, str(tmp_path / "crawl.json"))
+
+    assert sorted(sunk) == [("2024-01", 1), ("2024-01", 2), ("2024-01", 3), ("2024-02", 1), ("2024-02", 2)]
+    assert crawler.finished
+
+
+def test_resumes_from_a_partial_state_file(tmp_path):
+    state = tmp_path / "crawl.json"
+    state.write_text(
+        json.dumps(
+            {
+                "per_page": 100,
+                "filter": None,
+                "months": {"2024-01": {"total_pages": 3, "done": [1, 3]}},
+            }
+        )
+    )
+    client = Archive({"2024-01": 3, "2024-02": 2})
+    _, sunk = crawl(client, str(state))
+
+    assert sorted(client.requests) == [("2024-01", 2), ("2024-02", 1), ("2024-02", 2)]
+    assert json.loads(state.read_text())["months"] == {
+        "2024-01": {"total_pages": 3, "done": [1, 2, 3]},
+        "2024-02": {"total_pages": 2, "done": [1, 2]},
+    }
+
+
+def test_rejects_a_state_file_of_another_crawl(tmp_path):
+    state = tmp_path / "crawl.json"
+    state.write_text(json.dumps({"per_page": 100, "filter": None, "months": {}}))
+
+    with pytest.raises(ValueError):
+        ArchiveCrawler(Archive({}), ["2024-01"], print, str(state), per_page=50)
+    with pytest.raises(ValueError):
+        ArchiveCrawler(Archive({}), ["2024-01"], print, str(state), filter="6")
+
+
+def test_error_keeps_finished_units_checkpointed(tmp_path):
+    state = tmp_path / "crawl.json"
+    client = Archive({"2024-01": 3, "2024-02": 2}, fail=[("2024-01", 2)])
+
+    with pytest.raises(ConnectionError):
+        crawl(client, str(state), max_workers=1, checkpoint_every=1000)
+
+    done = {month: progress["done"] for month, progress in json.loads(state.read_text())["months"].items()}
+    assert 2 not in done["2024-01"] and 1 in done["2024-01"] and done["2024-02"]
+
+    client.fail.clear()
+    client.requests.clear()
+    crawl(client, str(state))
+    assert ("2024-01", 2) in client.requests and ("2024-01", 1) not in client.requests
+
+
+def test_checkpoints_every_n_pages(tmp_path, monkeypatch):
+    saves = []
+    monkeypatch.setattr(ArchiveCrawler, "_save", lambda self: saves.append(len(self.pending())))
+    client = Archive({"2024-01": 5, "2024-02": 5})
+
+    crawl(client, str(tmp_path / "crawl.json"), max_workers=1, checkpoint_every=4, checkpoint_interval=3600)
+
+    assert len(saves) == 3  # after pages 4 and 8, and when the crawl stops
@@ -0,0 +1,73 @@
+import json
+
+import pytest
+import requests
+
+from pyxrel.decoder import decode
+from pyxrel.exceptions import (
+    CloudflareError,
+    IDNotFoundError,
+    InternalServerError,
+    NotFoundError,
+    PermissionDeniedError,
+    RateLimitError,
+    XrelToError,
+    parse_error,
+)
+
+
+def response(status, content=b"", content_type="application/json", headers=None):
+    response = requests.Response()
+    response.status_code = status
+    response.headers.update({"Content-Type": content_type, **(headers or {})})
+    response._content = content
+    return response
+
+
+def test_success_is_not_parsed():
+    ok = response(200, b"not json")
+    parse_error(ok)
+    assert not hasattr(ok, "_pyxrel_json")
+
+
+def test_not_found_html_page():
+    with pytest.raises(NotFoundError):
+        parse_error(response(404, b"<html><center>nginx</center></html>", "text/html"))
+
+
+def test_rate_limited():
+    headers = {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1700000000"}
+    with pytest.raises(RateLimitError, match="0 requests remaining"):
+        parse_error(response(429, b'{"error": "rate_limit_exceeded"}', headers=headers))
+
+
+def test_cloudflare_challenge():
+    page = b"<!DOCTYPE html><html><head><title>Just a moment...</title></head><body>Checking...</body></html>"
+    with pytest.raises(CloudflareError):
+        parse_error(response(403, page, "text/html; charset=UTF-8"))
+
+    with pytest.raises(PermissionDeniedError):  # a 403 of the API itself
+        parse_error(response(403, b'{"error": "permission_denied", "error_description": "Not allowed."}'))
+
+
+def test_internal_server_error():
+    with pytest.raises(InternalServerError):
+        parse_error(response(500, b"oops", "text/html"))
+
+
+def test_api_error_body_is_decoded_once():
+    error = response(404, json.dumps({"error": "id_not_found", "error_description": "Unknown id."}).encode())
+    with pytest.raises(IDNotFoundError, match="Unknown id."):
+        parse_error(error)
+
+    assert decode(error) is error._pyxrel_json
+
+
+def test_unknown_api_error():
+    with pytest.raises(XrelToError, match="Something new."):
+        parse_error(response(400, b'{"error": "new_error", "error_description": "Something new."}'))
+
+
+def test_malformed_json_error_body():
+    with pytest.raises(XrelToError, match="unknown error"):
+        parse_error(response(400, b'{"error": "invalid_client", "error_desc'))
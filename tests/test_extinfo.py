@@ -0,0 +1,90 @@
+import asyncio
+
+import pytest
+
+from pyxrel.models import ExtInfoInfo, MediaList, Release
+from pyxrel.resources import ExtInfo
+from pyxrel.resources.extinfo import ext_info_ids
+
+from tests.conftest import APISession, AsyncAPISession, release
+
+
+def ext_info(resource, params):
+    if params["id"] == "e2":
+        raise ConnectionError(params["id"])
+
+    if resource == "/ext_info/media.json":
+        return [{"type": "image", "time": 1_700_000_000, "url_full": f"https://img.xrel.to/{params['id']}.jpg"}]
+
+    return {
+        "type": "movie",
+        "id": params["id"],
+        "title": f"Movie {params['id']}",
+        "link_href": f"https://www.xrel.to/movie/{params['id']}.html",
+        "genre": "Drama",
+        "cover_url": f"https://img.xrel.to/{params['id']}.jpg",
+        "uris": [],
+        "rating": 7.5,
+        "num_ratings": 10,
+        "externals": [],
+    }
+
+
+@pytest.fixture
+def releases():
+    # e0, e1, e2, e0 and a release without Ext Info, as models and raw data
+    return [Release(**release(0)), release(1), release(2), Release(**release(4)), release(5, ext_info=None)]
+
+
+def test_ext_info_ids_are_unique_and_in_order(releases):
+    assert ext_info_ids(releases) == ["e0", "e1", "e2"]
+
+
+def test_enrich_fetches_every_ext_info_once(releases):
+    session = APISession(ext_info)
+
+    enrichment = ExtInfo(session).enrich(releases, with_media=True, max_workers=3)
+
+    assert sorted((resource, params["id"]) for resource, params in session.requests) == [
+        ("/ext_info/info.json", "e0"),
+        ("/ext_info/info.json", "e1"),
+        ("/ext_info/info.json", "e2"),
+        ("/ext_info/media.json", "e0"),
+        ("/ext_info/media.json", "e1"),
+        ("/ext_info/media.json", "e2"),
+    ]
+    assert list(enrichment.ext_info) == list(enrichment.media) == ["e0", "e1", "e2"]
+    assert isinstance(enrichment.ext_info["e2"], ConnectionError)
+    assert isinstance(enrichment.media["e2"], ConnectionError)
+    assert enrichment.ext_info["e1"].title == "Movie e1" and isinstance(enrichment.media["e1"], MediaList)
+
+
+def test_enrich_without_media(releases):
+    session = APISession(ext_info)
+
+    enrichment = ExtInfo(session).enrich(releases)
+
+    assert len(session.requests) == 3 and enrichment.media == {}
+
+
+def test_join_pairs_releases_with_their_results(releases):
+    enrichment = ExtInfo(APISession(ext_info)).enrich(releases, with_media=True)
+
+    joined = enrichment.join(releases)
+
+    assert [item[0] for item in joined] == releases
+    assert [info.id for _, info, _ in joined[:2]] == ["e0", "e1"] and isinstance(joined[0][1], ExtInfoInfo)
+    assert joined[0][1] is joined[3][1] and joined[0][2] is joined[3][2]
+    assert isinstance(joined[2][1], ConnectionError)
+    assert joined[4][1:] == (None, None)
+
+
+def test_async_enrich(releases):
+    pytest.importorskip("aiohttp")
+    from pyxrel.aio.resources.extinfo import AsyncExtInfo
+
+    session = AsyncAPISession(ext_info)
+    enrichment = asyncio.run(AsyncExtInfo(session).enrich(releases, with_media=True))
+
+    assert len(session.requests) == 6
+    assert enrichment.ext_info["e0"].id == "e0" and isinstance(enrichment.media["e2"], ConnectionError)
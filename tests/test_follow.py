@@ -0,0 +1,87 @@
+from types import SimpleNamespace
+
+from pyxrel.follow import Follower
+
+from tests.conftest import release
+
+
+class Feed:
+    """A fake client whose `latest` pages through a list of raw releases, newest first."""
+
+    def __init__(self, releases):
+        self.releases = releases
+        self.requests = 0
+        self.session = SimpleNamespace(rate_limiter=None)
+
+    def latest(self, archive=None, per_page=25, page=1, filter=None, mode=None):
+        self.requests += 1
+        start = (page - 1) * per_page
+        total_pages = max((len(self.releases) + per_page - 1) // per_page, 1)
+        return {
+            "total_count": len(self.releases),
+            "pagination": {"current_page": page, "per_page": per_page, "total_pages": total_pages},
+            "list": self.releases[start : start + per_page],
+        }
+
+
+def ids(releases):
+    return [item["id"] for item in releases]
+
+
+def test_first_poll_returns_first_page_oldest_first():
+    feed = Feed([release(i) for i in range(10)])
+    follower = Follower(feed, per_page=5)
+
+    assert ids(follower.poll()) == ids([release(i) for i in range(4, -1, -1)])
+    assert follower.since == release(0)["time"]
+
+
+def test_next_poll_walks_back_to_the_watermark():
+    feed = Feed([release(i) for i in range(10)])
+    follower = Follower(feed, per_page=5)
+    follower.poll()
+
+    feed.releases = [release(i, time=1_700_000_000 + i) for i in range(106, 99, -1)] + feed.releases
+    feed.requests = 0
+
+    assert ids(follower.poll()) == ids([release(i) for i in range(100, 107)])
+    assert feed.requests == 2
+    assert follower.poll() == []
+
+
+def test_resume_from_seen_ids_and_since():
+    feed = Feed([release(i) for i in range(3)])
+    follower = Follower(feed, since=release(1)["time"], seen=[release(1)["id"]])
+
+    assert ids(follower.poll()) == [release(0)["id"]]
+
+
+def test_interval_stays_within_bounds():
+    feed = Feed([])
+    follower = Follower(feed, min_interval=5, max_interval=20)
+    for _ in range(10):
+        follower.poll()
+
+    assert 5 <= follower.interval <= 20
+
+
+def test_releases_shifted_onto_the_next_page_are_returned_once():
+    feed = Feed([release(i) for i in range(10)])
+    follower = Follower(feed, per_page=5)
+    follower.poll()
+
+    newer = [release(i, time=1_700_000_000 + i) for i in range(106, 99, -1)]
+    feed.releases = newer[2:] + feed.releases
+    latest = feed.latest
+
+    def shifting_latest(*args, **kwargs):
+        response = latest(*args, **kwargs)
+        if feed.latest is shifting_latest:
+            feed.latest = latest
+            feed.releases = newer[:2] + feed.releases  # two more releases arrive after the first page
+        return response
+
+    feed.latest = shifting_latest
+
+    assert ids(follower.poll()) == ids(newer[2:][::-1])
+    assert ids(follower.poll()) == ids(newer[:2][::-1])
@@ -0,0 +1,144 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import wait as real_wait
+from types import SimpleNamespace
+
+import pytest
+
+from pyxrel import hosts as hosts_module
+from pyxrel.hosts import HostPool
+
+
+def ok(host):
+    return SimpleNamespace(status_code=200, text="", host=host)
+
+
+def error(host):
+    return SimpleNamespace(status_code=502, text="", host=host)
+
+
+def succeeded(future):
+    return future.exception() is None and future.result().status_code < 500
+
+
+def pool(*hosts, hedge_percentile=None, latency=0.001):
+    """A pool ranking `hosts` in the given order, with enough history to hedge after about `latency`."""
+    pool = HostPool(hosts, hedge_percentile=hedge_percentile)
+    for _ in range(10):
+        for rank, host in enumerate(hosts):
+            pool.record(host, latency * (rank + 1), True)
+    return pool
+
+
+class Hosts:
+    """A fake `send(host)`, answering per host after an optional delay."""
+
+    def __init__(self, **answers):
+        self.answers = answers  # host -> (delay, response factory or exception)
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def __call__(self, host):
+        with self._lock:
+            self.calls.append(host)
+        delay, answer = self.answers[host]
+        time.sleep(delay)
+        if isinstance(answer, Exception):
+            raise answer
+        return answer(host)
+
+    async def asend(self, host):
+        with self._lock:
+            self.calls.append(host)
+        delay, answer = self.answers[host]
+        await asyncio.sleep(delay)
+        if isinstance(answer, Exception):
+            raise answer
+        return answer(host)
+
+
+def test_fails_over_on_errors_and_5xx():
+    send = Hosts(a=(0, ConnectionError("a")), b=(0, error), c=(0, ok))
+    assert pool("a", "b", "c").send(send).host == "c"
+    assert send.calls == ["a", "b", "c"]
+
+
+def test_last_failure_is_returned_or_raised():
+    assert pool("a", "b").send(Hosts(a=(0, ok), b=(0, error))).host == "a"
+    assert pool("a", "b").send(Hosts(a=(0, ConnectionError("a")), b=(0, error))).status_code == 502
+    with pytest.raises(ConnectionError):
+        pool("a", "b").send(Hosts(a=(0, error), b=(0, ConnectionError("b"))))
+
+
+def test_failed_host_goes_last():
+    hosts = pool("a", "b")
+    hosts.send(Hosts(a=(0, error), b=(0, ok)))
+    assert hosts.order() == ["b", "a"]
+
+
+def test_hedge_answers_from_the_faster_host():
+    send = Hosts(a=(0.2, ok), b=(0, ok))
+    assert pool("a", "b", hedge_percentile=50).send(send, hedge=True).host == "b"
+
+
+def test_no_hedge_when_the_host_answers_in_time():
+    send = Hosts(a=(0, error), b=(0, ok))
+    assert pool("a", "b", hedge_percentile=50, latency=1).send(send, hedge=True).host == "b"
+    assert send.calls == ["a", "b"]
+
+
+def test_failed_hedge_moves_past_both_hosts():
+    send = Hosts(a=(0.05, error), b=(0, error), c=(0, ok))
+    assert pool("a", "b", "c", hedge_percentile=50).send(send, hedge=True).host == "c"
+    assert sorted(send.calls) == ["a", "b", "c"]
+
+
+def test_hedge_prefers_a_success_finishing_with_a_failure(monkeypatch):
+    def wait(futures, timeout=None, return_when=None):
+        if timeout is not None:
+            return real_wait(futures, timeout=timeout)
+        futures = list(futures)
+        real_wait(futures)
+        return sorted(futures, key=succeeded), set()  # both done at once, the failure first
+
+    monkeypatch.setattr(hosts_module, "wait", wait)
+    send = Hosts(a=(0.05, ok), b=(0, error), c=(0, ok))
+
+    assert pool("a", "b", "c", hedge_percentile=50).send(send, hedge=True).host == "a"
+    assert "c" not in send.calls
+
+
+def test_async_failover_and_hedge():
+    async def main():
+        send = Hosts(a=(0, ConnectionError("a")), b=(0, error), c=(0, ok))
+        assert (await pool("a", "b", "c").asend(send.asend)).host == "c"
+
+        send = Hosts(a=(0.2, ok), b=(0, ok))
+        assert (await pool("a", "b", hedge_percentile=50).asend(send.asend, hedge=True)).host == "b"
+
+        send = Hosts(a=(0.05, error), b=(0, error), c=(0, ok))
+        assert (await pool("a", "b", "c", hedge_percentile=50).asend(send.asend, hedge=True)).host == "c"
+        assert sorted(send.calls) == ["a", "b", "c"]
+
+    asyncio.run(main())
+
+
+def test_async_hedge_prefers_a_success_finishing_with_a_failure(monkeypatch):
+    real_async_wait = asyncio.wait
+
+    async def wait(tasks, timeout=None, return_when=None):
+        if timeout is not None:
+            return await real_async_wait(tasks, timeout=timeout)
+        tasks = list(tasks)
+        await real_async_wait(tasks)
+        return sorted(tasks, key=succeeded), set()
+
+    monkeypatch.setattr(asyncio, "wait", wait)
+
+    async def main():
+        send = Hosts(a=(0.05, ok), b=(0, error), c=(0, ok))
+        assert (await pool("a", "b", "c", hedge_percentile=50).asend(send.asend, hedge=True)).host == "a"
+        assert "c" not in send.calls
+
+    asyncio.run(main())
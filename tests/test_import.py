@@ -0,0 +1,21 @@
+import subprocess
+import sys
+
+import pytest
+
+HEAVY = ("requests", "pydantic", "lxml", "aiohttp", "numpy")
+
+
+def loaded(script: str) -> list:
+    """Runs a script in a fresh interpreter and returns the heavy dependencies it loaded."""
+    script += f"; import sys; print(' '.join(m for m in {HEAVY!r} if m in sys.modules))"
+    return subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True).stdout.split()
+
+
+@pytest.mark.parametrize("module", ["pyxrel", "pyxrel.aio"])
+def test_import_is_lazy(module):
+    assert loaded(f"import {module}") == []
+
+
+def test_attributes_load_on_first_use():
+    assert "requests" in loaded("import pyxrel; pyxrel.XREL")
@@ -0,0 +1,89 @@
+import json
+import time
+
+import pytest
+
+from pyxrel.exceptions import InvalidArgumentError
+from pyxrel.metadata import MetadataRegistry
+
+from tests.conftest import APISession
+
+METADATA = {
+    "release/categories.json": [{"name": "MOVIES", "parent_cat": ""}, {"name": "TV", "parent_cat": ""}],
+    "p2p/categories.json": [{"id": "1a2b", "meta_cat": "movies", "sub_cat": "hd"}],
+    "release/filters.json": [{"id": 7, "name": "Movies HD"}],
+}
+
+
+def metadata(resource, params):
+    return METADATA[resource]
+
+
+def snapshot(path, age, **changes):
+    data = {
+        "fetched_at": time.time() - age,
+        "categories": METADATA["release/categories.json"],
+        "p2p_categories": METADATA["p2p/categories.json"],
+        "filters": METADATA["release/filters.json"],
+        **changes,
+    }
+    path.write_text(json.dumps(data))
+
+
+@pytest.fixture
+def session():
+    return APISession(metadata)
+
+
+def test_fetches_once_and_writes_the_snapshot(session, tmp_path):
+    path = tmp_path / "metadata.json"
+    path.write_text('{"fetched_at": 1')  # torn
+
+    registry = MetadataRegistry(str(path), session=session)
+    assert registry.category_name("movies") == "MOVIES"
+    assert registry.category_id("1A2B") == "1a2b"
+    assert registry.filter("movies hd") == registry.filter(7) == "7"
+    assert sorted(resource for resource, _ in session.requests) == sorted(METADATA)
+
+    loaded = APISession(metadata)
+    assert MetadataRegistry(str(path), session=loaded).categories() == METADATA["release/categories.json"]
+    assert loaded.requests == []
+
+
+def test_unknown_values_are_rejected_without_a_request(session, tmp_path):
+    snapshot(tmp_path / "metadata.json", age=60)
+    registry = MetadataRegistry(str(tmp_path / "metadata.json"), session=session)
+
+    with pytest.raises(InvalidArgumentError, match="Unknown filter: 'nope'"):
+        registry.filter("nope")
+    with pytest.raises(InvalidArgumentError):
+        registry.category_name("GAMES")
+
+    assert session.requests == []
+
+
+def test_unknown_value_refreshes_an_old_snapshot_once(session, tmp_path):
+    snapshot(tmp_path / "metadata.json", age=7200, categories=[{"name": "MOVIES", "parent_cat": ""}])
+    registry = MetadataRegistry(str(tmp_path / "metadata.json"), miss_refresh=3600, session=session)
+
+    assert registry.category_name("tv") == "TV"  # added since the snapshot
+    assert len(session.requests) == 3
+
+    with pytest.raises(InvalidArgumentError):
+        registry.category_name("GAMES")
+    assert len(session.requests) == 3
+
+
+def test_stale_snapshot_is_used_while_refreshed_in_the_background(session, tmp_path):
+    path = tmp_path / "metadata.json"
+    snapshot(path, age=7200, filters=[{"id": 1, "name": "Old"}])
+    registry = MetadataRegistry(str(path), ttl=3600, session=session)
+
+    assert registry.filters() == [{"id": 1, "name": "Old"}]
+
+    deadline = time.time() + 5
+    while json.loads(path.read_text())["filters"] != METADATA["release/filters.json"] and time.time() < deadline:
+        time.sleep(0.01)  # the snapshot is written after the registry was updated
+
+    assert registry.filters() == METADATA["release/filters.json"]
+    assert len(session.requests) == 3
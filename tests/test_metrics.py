@@ -0,0 +1,62 @@
+import threading
+import time
+from types import SimpleNamespace
+
+from pyxrel.cache import MemoryCache
+from pyxrel.hosts import HostPool
+from pyxrel.metrics import Metrics
+from pyxrel.session import Session
+
+
+def test_hedged_requests_keep_the_endpoint():
+    pool = HostPool(["a", "b"], hedge_percentile=50)
+    for _ in range(10):
+        pool.record("a", 0.001, True)
+        pool.record("b", 0.002, True)
+
+    endpoints = []
+
+    def send(host):
+        endpoints.append(Metrics.endpoint())
+        if host == "a":
+            time.sleep(0.05)
+        return SimpleNamespace(status_code=200, headers={}, text="")
+
+    def request():
+        Metrics.enter("release/latest")
+        pool.send(send, hedge=True)
+
+    thread = threading.Thread(target=request)
+    thread.start()
+    thread.join()
+
+    assert endpoints == ["release/latest", "release/latest"]
+
+
+def test_stale_refresh_keeps_the_endpoint():
+    cache = MemoryCache(stale_ttl=60)
+    session = Session(cache=cache, metrics=Metrics())
+    url = "https://api.xrel.to/v2/release/latest.json"
+    key = cache.key(url, None)
+    cache.store(key, 10, 200, {}, b"{}")
+    cache.set(key, cache.get(key)._replace(expires_at=time.time() - 1))
+
+    refreshed = threading.Event()
+    endpoints = []
+
+    def send(method, url, headers, kwargs):
+        endpoints.append(Metrics.endpoint())
+        refreshed.set()
+        return SimpleNamespace(status_code=200, headers={}, content=b"{}")
+
+    def request():
+        session.metrics.enter("release/latest")
+        session._cached(url, 10, {}, {})
+
+    session._send = send
+    thread = threading.Thread(target=request)
+    thread.start()
+    thread.join()
+
+    assert refreshed.wait(5)
+    assert endpoints == ["release/latest"]
@@ -0,0 +1,95 @@
+import pytest
+
+from pyxrel.mirror import Mirror, _fts_query
+from pyxrel.models import ExtInfoInfo, Release, Releases, SearchExtInfo
+
+from tests.conftest import release
+
+
+def ext_info(id, title, alt_title=None):
+    return {
+        "type": "movie",
+        "id": id,
+        "title": title,
+        "alt_title": alt_title,
+        "link_href": "https://www.xrel.to/movie/1.html",
+    }
+
+
+@pytest.fixture
+def mirror():
+    mirror = Mirror()
+    yield mirror
+    mirror.close()
+
+
+def test_fts_query_matches_words_as_prefixes():
+    assert _fts_query("Some.Movie-GRP") == '"Some"* "Movie"* "GRP"*'
+
+
+def test_observe_stores_releases(mirror):
+    mirror.observe(Releases, {"list": [release(1), release(2)]})
+    mirror.observe(Release, release(3))
+
+    assert mirror.release(dirname=release(1)["dirname"])["id"] == release(1)["id"]
+    assert mirror.release(id=release(3)["id"]) == release(3)
+    assert [item["id"] for item in mirror.releases_for("e1")] == [release(1)["id"]]
+
+
+def test_search_releases_newest_first(mirror):
+    mirror.add_releases([release(1), release(2), release(5)])
+
+    result = mirror.search("some movie GRP2")
+    assert [item["id"] for item in result["results"]] == [release(2)["id"], release(5)["id"]]
+    assert result["total"] == 2 and result["p2p_results"] == []
+    assert mirror.search("some movie", limit=1)["total"] == 1
+    assert mirror.search("some movie", include=["p2p"])["total"] == 0
+
+
+def test_replacing_a_release_updates_the_index(mirror):
+    mirror.add_releases([release(1)])
+    mirror.add_releases([release(1, dirname="Other.Name-GRP")])
+
+    assert mirror.search("some movie")["total"] == 0
+    assert mirror.search("other name")["total"] == 1
+
+
+def test_search_ext_info(mirror):
+    mirror.add_ext_info([ext_info("a", "The Matrix"), ext_info("b", "Reloaded", alt_title="Matrix Reloaded")])
+
+    assert {item["id"] for item in mirror.search_ext_info("matrix")["results"]} == {"a", "b"}
+    assert mirror.search_ext_info("reload")["results"][0]["id"] == "b"
+    assert mirror.search_ext_info("matrix", type="tv")["total"] == 0
+
+
+@pytest.mark.parametrize("query", ["", "-", "..."])
+def test_queries_without_words_find_nothing(mirror, query):
+    mirror.add_releases([release(1)])
+    mirror.add_ext_info([ext_info("a", "The Matrix")])
+
+    assert mirror.search(query) == {"total": 0, "results": [], "p2p_results": []}
+    assert mirror.search_ext_info(query) == {"total": 0, "results": []}
+
+
+def test_observe_stores_ext_info_search_results(mirror):
+    full = {**ext_info("a", "The Matrix"), "uris": ["imdb:tt0133093"], "rating": 8.7}
+    mirror.observe(ExtInfoInfo, full)
+    mirror.observe(SearchExtInfo, {"total": 2, "results": [ext_info("a", "The Matrix"), ext_info("b", "Matrix 2")]})
+
+    results = {item["id"]: item for item in mirror.search_ext_info("matrix")["results"]}
+    assert set(results) == {"a", "b"}
+    assert results["a"]["uris"] == ["imdb:tt0133093"]
+
+
+def test_observe_skips_items_of_unexpected_shape(mirror):
+    broken = release(2)
+    del broken["time"]
+    mirror.observe(Releases, {"list": [release(1), broken, "not a release"]})
+    mirror.observe(SearchExtInfo, {"total": 2, "results": [{"id": "x1"}, ext_info("e1", "Movie One")]})
+    mirror.observe(ExtInfoInfo, {"id": "x2", "title": "No Type"})
+    mirror.observe(Releases, None)
+
+    assert mirror.release(id=release(1)["id"]) is not None
+    assert mirror.release(id=release(2)["id"]) is None
+    assert [item["id"] for item in mirror.search_ext_info("Movie")["results"]] == ["e1"]
+    assert mirror.search_ext_info("Type")["results"] == []
@@ -0,0 +1,102 @@
+import os
+import threading
+from contextlib import contextmanager
+
+import pytest
+
+from pyxrel.exceptions import AccessDeniedError
+from pyxrel.nfo import NFOStore
+from pyxrel.resources import Release
+
+IMAGES = {"a1": [b"PNG", b"one"], "b2": [b"PNG", b"one"], "c3": [b"PNG", b"two"]}
+
+
+class Tokens:
+    """A fake `OAuth2` whose tokens expire after `lifetime` requests, and are refreshed when asked for then."""
+
+    def __init__(self, lifetime=1000):
+        self.lifetime = lifetime
+        self.version = 0
+        self.uses = 0
+        self._lock = threading.Lock()
+
+    def get_access_token(self, scope):
+        with self._lock:
+            if self.uses >= self.lifetime:
+                self.version, self.uses = self.version + 1, 0
+            return f"token-{self.version}"
+
+    def use(self, token):
+        with self._lock:
+            if token != f"token-{self.version}" or self.uses >= self.lifetime:
+                raise AccessDeniedError("The access token expired.")
+            self.uses += 1
+
+
+class NFOSession:
+    """A fake session serving `IMAGES`, rejecting requests with an outdated token."""
+
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.requested = []
+
+    @contextmanager
+    def get(self, url, params=None, headers=None, stream=False):
+        self.requested.append(params["id"])
+        self.tokens.use(headers["Authorization"].split()[1])
+        if params["id"] not in IMAGES:
+            raise ConnectionError(params["id"])
+
+        class Response:
+            def iter_content(self, chunk_size):
+                return iter(IMAGES[params["id"]])
+
+        yield Response()
+
+
+@pytest.fixture
+def store(tmp_path):
+    return NFOStore(str(tmp_path / "nfos"))
+
+
+def test_write_streams_and_dedups_by_content(store):
+    one = store.write("a1", iter(IMAGES["a1"]))
+    same = store.write("b2", iter(IMAGES["b2"]))
+    two = store.write("c3", iter(IMAGES["c3"]))
+
+    assert one == same != two
+    assert store.read("b2") == b"PNGone"
+    assert store.lookup(["a1", "c3", "zz"]) == {"a1": one, "c3": two}
+    assert store.get("a1", "p2p") is None
+    assert not [name for name in os.listdir(store.directory) if name.startswith(".nfo-")]
+
+
+def test_nfos_downloads_missing_images_once(store):
+    store.write("a1", iter(IMAGES["a1"]))
+    tokens = Tokens()
+    session = NFOSession(tokens)
+
+    paths = Release(session, tokens).nfos(["a1", "b2", "c3", "b2"], store, max_workers=2)
+
+    assert sorted(session.requested) == ["b2", "c3"]
+    assert paths["a1"] == paths["b2"] != paths["c3"]
+
+
+def test_nfos_returns_errors_per_item(store):
+    tokens = Tokens()
+    paths = Release(NFOSession(tokens), tokens).nfos(["a1", "missing", "c3"], store)
+
+    assert isinstance(paths["missing"], ConnectionError)
+    assert store.read("a1") == b"PNGone" and store.read("c3") == b"PNGtwo"
+
+
+def test_nfos_asks_for_the_token_per_request(store):
+    tokens = Tokens(lifetime=1)  # outlived by the batch
+    paths = Release(NFOSession(tokens), tokens).nfos(["a1", "b2", "c3"], store, max_workers=1)
+
+    assert not [path for path in paths.values() if isinstance(path, Exception)]
+
+
+def test_nfos_needs_oauth2(store):
+    with pytest.raises(ValueError):
+        Release(NFOSession(None)).nfos(["a1"], store)
@@ -0,0 +1,88 @@
+import os
+import stat
+import threading
+import time
+
+import pytest
+
+from pyxrel.oauth2 import FileTokenStore, MemoryTokenStore, OAuth2, SQLiteTokenStore
+
+
+class TokenServer:
+    """Stands in for the session, answering `oauth2/token` with tokens living `expires_in` seconds."""
+
+    def __init__(self, expires_in: float, delay: float = 0) -> None:
+        self.expires_in = expires_in
+        self.delay = delay
+        self.requests = 0
+        self._lock = threading.Lock()
+
+    def post(self, url, data):
+        with self._lock:
+            self.requests += 1
+            token = f"token-{self.requests}"
+        time.sleep(self.delay)
+        return type("Response", (), {"json": lambda _: {"access_token": token, "expires_in": self.expires_in}})()
+
+
+def client(server, **kwargs):
+    return OAuth2("id", "secret", session=server, store=MemoryTokenStore(), **kwargs)
+
+
+def test_token_is_fetched_once():
+    server = TokenServer(3600)
+    oauth2 = client(server)
+
+    assert oauth2.get_access_token("viewnfo") == oauth2.get_access_token("viewnfo") == "token-1"
+    assert server.requests == 1
+
+
+def test_one_background_refresh_per_token():
+    server = TokenServer(3600, delay=0.2)
+    oauth2 = client(server, refresh_ahead=600)
+    oauth2.get_access_token("viewnfo")
+    key = oauth2._cache_key("viewnfo")
+    now = time.time()
+    oauth2.store.set(key, {"access_token": "token-1", "expires_at": now + 300, "issued_at": now - 3300})
+
+    for _ in range(200):
+        oauth2.get_access_token("viewnfo")
+    time.sleep(0.4)
+
+    assert server.requests == 2
+
+
+def test_short_lived_tokens_are_not_always_due():
+    server = TokenServer(60)
+    oauth2 = client(server, refresh_ahead=600)
+
+    for _ in range(50):
+        oauth2.get_access_token("viewnfo")
+    time.sleep(0.1)
+
+    assert server.requests == 1
+
+
+def test_file_store_is_private_and_atomic(tmp_path):
+    path = str(tmp_path / "tokens.json")
+    store = FileTokenStore(path)
+    store.set("a", {"access_token": "x", "expires_at": 1, "issued_at": 0})
+    store.set("b", {"access_token": "y", "expires_at": 2, "issued_at": 0})
+
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+    assert FileTokenStore(path).get("a")["access_token"] == "x"
+    assert os.listdir(tmp_path) == ["tokens.json"]
+
+
+def test_sqlite_store_roundtrip(tmp_path):
+    path = str(tmp_path / "tokens.db")
+    SQLiteTokenStore(path).set("a", {"access_token": "x", "expires_at": 2.0, "issued_at": 1.0})
+
+    assert SQLiteTokenStore(path).get("a") == {"access_token": "x", "expires_at": 2.0, "issued_at": 1.0}
+
+
+def test_invalid_credentials():
+    with pytest.raises(ValueError):
+        OAuth2("", "secret")
+    with pytest.raises(TypeError):
+        OAuth2("id", 1)
@@ -0,0 +1,60 @@
+import pytest
+
+from pyxrel.ratelimit import RateLimiter
+
+
+def headers(remaining, reset):
+    return {"X-RateLimit-Remaining": str(remaining), "X-RateLimit-Reset": str(reset)}
+
+
+def test_unknown_window_does_not_wait(clock):
+    assert RateLimiter(clock=clock).reserve() == 0
+
+
+def test_spread_spaces_requests_over_the_window(clock):
+    limiter = RateLimiter("spread", clock=clock)
+    limiter.update(headers(10, clock.now + 10))
+
+    delays = [limiter.reserve() for _ in range(3)]
+    assert delays == pytest.approx([0, 1, 2])
+
+
+def test_block_waits_for_reset_once_spent(clock):
+    limiter = RateLimiter("block", margin=1, clock=clock)
+    limiter.update(headers(3, clock.now + 30))
+
+    assert [limiter.reserve() for _ in range(2)] == [0, 0]
+    assert limiter.reserve() == pytest.approx(30)
+
+
+def test_update_keeps_lowest_count_of_a_window(clock):
+    limiter = RateLimiter(clock=clock)
+    limiter.update(headers(5, clock.now + 10))
+    limiter.update(headers(8, clock.now + 10))
+    assert limiter.remaining == 5
+
+    limiter.update(headers(100, clock.now + 70))
+    assert limiter.remaining == 100
+
+
+def test_update_ignores_missing_or_invalid_headers(clock):
+    limiter = RateLimiter(clock=clock)
+    limiter.update({"X-RateLimit-Remaining": "5"})
+    limiter.update(headers("x", clock.now))
+    assert limiter.remaining is None
+
+
+def test_window_is_forgotten_after_reset(clock):
+    limiter = RateLimiter(clock=clock)
+    limiter.update(headers(0, clock.now + 5))
+    clock.advance(6)
+
+    assert limiter.reserve() == 0
+    assert limiter.remaining is None
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        RateLimiter("burst")
+    with pytest.raises(ValueError):
+        RateLimiter(margin=-1)
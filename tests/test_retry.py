@@ -0,0 +1,82 @@
+from types import SimpleNamespace
+
+import pytest
+import requests
+
+from pyxrel.exceptions import RateLimitError
+from pyxrel.retry import RetryPolicy
+from pyxrel.session import Session
+
+
+def response(status, headers=None):
+    return SimpleNamespace(status_code=status, headers=headers or {})
+
+
+def test_retries_retryable_statuses_and_errors(clock):
+    policy = RetryPolicy(clock=clock)
+    assert policy.delay("GET", "u", 0, clock.now, response=response(503)) is not None
+    assert policy.delay("GET", "u", 0, clock.now, exception=requests.ConnectionError()) is not None
+
+    assert policy.delay("GET", "u", 0, clock.now, response=response(404)) is None
+    assert policy.delay("GET", "u", 0, clock.now, exception=ValueError()) is None
+    assert policy.delay("POST", "u", 0, clock.now, response=response(503)) is None
+
+
+def test_backoff_is_capped_full_jitter(clock):
+    policy = RetryPolicy(max_retries=10, backoff=1, max_backoff=4, clock=clock)
+    for attempt in range(6):
+        assert 0 <= policy.delay("GET", "u", attempt, clock.now, response=response(500)) <= min(4, 2**attempt)
+
+
+def test_rate_limited_waits_for_reset(clock):
+    policy = RetryPolicy(backoff=0.5, clock=clock)
+    delay = policy.delay("GET", "u", 0, clock.now, response=response(429, {"X-RateLimit-Reset": clock.now + 20}))
+    assert 20 <= delay <= 20.5
+
+
+def test_max_retries_and_deadline(clock):
+    policy = RetryPolicy(max_retries=2, deadline=10, backoff=100, max_backoff=100, clock=clock)
+    assert policy.delay("GET", "u", 2, clock.now, response=response(500)) is None
+
+    started = clock.now
+    clock.advance(9.99)
+    assert policy.delay("GET", "u", 0, started, response=response(429, {"X-RateLimit-Reset": clock.now + 5})) is None
+    assert policy.stats()["exhausted"] == 2
+
+
+def test_budget_limits_retries_per_window(clock):
+    policy = RetryPolicy(budget=2, budget_window=60, clock=clock)
+    delays = [policy.delay("GET", "u", 0, clock.now, response=response(500)) for _ in range(3)]
+    assert [delay is not None for delay in delays] == [True, True, False]
+
+    clock.advance(61)
+    assert policy.delay("GET", "u", 0, clock.now, response=response(500)) is not None
+    assert policy.stats() == {"retries": 3, "exhausted": 1, "by_reason": {"500": 3}}
+
+
+def test_on_retry_hook(clock):
+    seen = []
+    policy = RetryPolicy(on_retry=lambda *args: seen.append(args), clock=clock)
+    policy.delay("GET", "u", 1, clock.now, response=response(502))
+
+    assert seen[0][:3] == ("GET", "u", 2) and seen[0][4] == "502"
+
+
+def test_negative_max_retries():
+    with pytest.raises(ValueError):
+        RetryPolicy(max_retries=-1)
+
+
+def test_session_counts_an_unretried_response_once(clock):
+    limited = requests.Response()
+    limited.status_code = 429
+    limited.headers.update({"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(int(clock.now) + 60)})
+    limited._content = b'{"error": "rate_limit_exceeded"}'
+
+    policy = RetryPolicy(max_retries=0, exceptions=(RateLimitError,), clock=clock)
+    session = Session(retry=policy)
+    session._get = lambda *args: limited
+
+    with pytest.raises(RateLimitError):
+        session._fetch("GET", "https://api.xrel.to/v2/release/latest.json", {}, {})
+    assert policy.stats()["exhausted"] == 1
@@ -0,0 +1,73 @@
+import pytest
+
+from pyxrel.models import SearchExtInfo
+from pyxrel.resources import Search
+from pyxrel.resources.search import group_queries
+
+from tests.conftest import APISession, release
+
+RELEASES = {"some movie": [1, 2], "other": [2, 3], "nothing": []}
+
+
+def search(resource, params):
+    query = params["q"].casefold()
+    if query == "broken":
+        raise ConnectionError(query)
+
+    if resource == "/search/ext_info.json":
+        found = [release(i)["ext_info"] for i in RELEASES[query]]
+        return {"total": len(found), "results": found}
+
+    found = [release(i) for i in RELEASES[query]]
+    return {"total": len(found), "results": found, "p2p_results": []}
+
+
+@pytest.fixture
+def session():
+    return APISession(search)
+
+
+def test_group_queries_by_normalized_form():
+    assert group_queries(["Some Movie", " some  MOVIE ", "Other"]) == {
+        "some movie": ["Some Movie", " some  MOVIE "],
+        "other": ["Other"],
+    }
+
+
+def test_many_searches_duplicates_once_and_merges(session):
+    merged = Search(session).many(["Some Movie", "some  movie", "Other", "Broken"], max_workers=2)
+
+    assert sorted(params["q"] for _, params in session.requests) == ["broken", "other", "some movie"]
+    assert [result.id for result in merged.results] == [release(i)["id"] for i in (1, 2, 3)]
+    assert merged.p2p_results == []
+    assert merged.matches == {
+        release(1)["id"]: ["Some Movie", "some  movie"],
+        release(2)["id"]: ["Some Movie", "some  movie", "Other"],
+        release(3)["id"]: ["Other"],
+    }
+    assert list(merged.errors) == ["Broken"] and isinstance(merged.errors["Broken"], ConnectionError)
+
+
+def test_many_merges_raw_results(session):
+    merged = Search(session, mode="raw").many(["Other", "Some Movie"])
+
+    assert [result["id"] for result in merged.results] == [release(i)["id"] for i in (2, 3, 1)]
+
+
+def test_iter_many_yields_every_normalized_query(session):
+    results = dict(Search(session).iter_many(["Other", "OTHER", "Broken", "Nothing"]))
+
+    assert sorted(results) == ["broken", "nothing", "other"]
+    assert isinstance(results["broken"], ConnectionError)
+    assert results["nothing"].total == 0 and results["other"].total == 2
+    assert len(session.requests) == 3
+
+
+def test_ext_info_many_answers_every_original_query(session):
+    results = Search(session).ext_info_many(["Other", "other ", "Broken"])
+
+    assert len(session.requests) == 2
+    assert list(results) == ["Other", "other ", "Broken"]
+    assert isinstance(results["Other"], SearchExtInfo) and results["Other"] is results["other "]
+    assert [item.id for item in results["Other"].results] == ["e2", "e3"]
+    assert isinstance(results["Broken"], ConnectionError)
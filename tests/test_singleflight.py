@@ -0,0 +1,45 @@
+import threading
+
+import pytest
+
+from pyxrel.singleflight import SingleFlight, request_key
+
+
+def test_request_key_ignores_order_and_none():
+    assert request_key("u", {"a": 1, "b": None}, {"h": "1"}) == request_key("u", {"a": "1"}, {"h": "1"})
+    assert request_key("u", {"a": 1}) != request_key("u", {"a": 2})
+
+
+def test_concurrent_calls_share_one_result():
+    flight, started, release = SingleFlight(), threading.Event(), threading.Event()
+    calls, results = [], []
+
+    def fn():
+        calls.append(1)
+        started.set()
+        release.wait()
+        return "result"
+
+    leader = threading.Thread(target=lambda: results.append(flight.do("k", fn)))
+    leader.start()
+    started.wait()
+    followers = [threading.Thread(target=lambda: results.append(flight.do("k", fn))) for _ in range(4)]
+    for thread in followers:
+        thread.start()
+    release.set()
+    for thread in (leader, *followers):
+        thread.join()
+
+    assert len(calls) == 1
+    assert results == ["result"] * 5
+
+
+def test_exception_is_raised_and_key_released():
+    flight = SingleFlight()
+
+    def fail():
+        raise KeyError("boom")
+
+    with pytest.raises(KeyError):
+        flight.do("k", fail)
+    assert flight.do("k", lambda: 1) == 1
@@ -0,0 +1,100 @@
+import pytest
+
+pytest.importorskip("lxml")
+
+from lxml import etree as ElementTree  # noqa: E402
+
+from pyxrel.models import Release  # noqa: E402
+from pyxrel.streaming import iter_elements, iter_items, to_data  # noqa: E402
+
+RELEASE = """
+<release>
+    <id>{id}</id>
+    <dirname>Some.Movie.{id}.2023.1080p.WEB.h264-GRP</dirname>
+    <link_href>https://www.xrel.to/release/{id}.html</link_href>
+    <time>1700000000</time>
+    <group_name>GRP</group_name>
+    <size><number>1000</number><unit>MB</unit></size>
+    <video_type>WEB</video_type>
+    <audio_type>AC3</audio_type>
+    <num_ratings>0</num_ratings>
+    <ext_info>
+        <type>movie</type>
+        <id>e{id}</id>
+        <title>Movie {id}</title>
+        <link_href>https://www.xrel.to/movie/{id}.html</link_href>
+        <uris>{uris}</uris>
+    </ext_info>
+    <comments>3</comments>
+    <flags><english>1</english></flags>
+</release>
+"""
+
+LISTING = """<?xml version="1.0" encoding="utf-8"?>
+<release_list>
+    <total_count>3</total_count>
+    <pagination><current_page>1</current_page><per_page>3</per_page><total_pages>1</total_pages></pagination>
+    <list>{releases}</list>
+</release_list>
+"""
+
+
+def listing(*uris):
+    """A `release/latest` XML body with one release per list of Ext Info URIs."""
+    releases = "".join(
+        RELEASE.format(id=i, uris="".join(f"<uri>{uri}</uri>" for uri in release_uris))
+        for i, release_uris in enumerate(uris)
+    )
+    return LISTING.format(releases=releases).encode()
+
+
+def chunks(body, size=16):
+    return (body[start : start + size] for start in range(0, len(body), size))
+
+
+def test_to_data_lists_and_nested_dicts():
+    data = to_data(ElementTree.fromstring(listing(["imdb:tt1"], ["imdb:tt2", "tmdb:2"])))
+
+    assert data["total_count"] == "3"
+    assert data["pagination"] == {"current_page": "1", "per_page": "3", "total_pages": "1"}
+    assert [release["id"] for release in data["list"]] == ["0", "1"]
+    assert data["list"][0]["size"] == {"number": "1000", "unit": "MB"}
+    assert data["list"][0]["ext_info"]["uris"] == ["imdb:tt1"]  # one child is still a list
+    assert data["list"][1]["ext_info"]["uris"] == ["imdb:tt2", "tmdb:2"]
+
+
+def test_to_data_empty_list():
+    assert to_data(ElementTree.fromstring(listing()))["list"] == []
+
+
+def test_iter_elements_yields_items_before_the_body_ends():
+    body = listing([], [], [])
+    first = body.index(b"</release>") + len(b"</release>")
+    seen = []
+
+    def feed():
+        for chunk in chunks(body):
+            seen.append(len(chunk))
+            yield chunk
+
+    elements = iter_elements(feed())
+    assert next(elements).findtext("id") == "0"
+    assert sum(seen) < len(body) and sum(seen) >= first
+    assert [element.findtext("id") for element in elements] == ["1", "2"]
+
+
+def test_iter_elements_clears_finished_items():
+    before = []
+    for element in iter_elements(chunks(listing([], [], []))):
+        before.append([len(sibling) for sibling in element.itersiblings(preceding=True)])
+
+    assert before == [[], [0], [0]]  # only the previous item is kept, and it is empty
+
+
+def test_items_build_into_models():
+    releases = [Release.model_validate(item) for item in iter_items(chunks(listing(["imdb:tt1"], [])))]
+
+    assert [release.id for release in releases] == ["0", "1"]
+    assert releases[0].size.number == 1000 and releases[0].time == 1700000000
+    assert releases[0].flags.english is True and releases[0].flags.nuke_rls is False
+    assert releases[0].ext_info.uris == ["imdb:tt1"] and releases[1].ext_info.uris == []
@@ -0,0 +1,92 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from pyxrel.models import Release, ReleaseP2P  # noqa: E402
+from pyxrel.table import ReleaseTable  # noqa: E402
+
+from tests.conftest import release  # noqa: E402
+
+
+@pytest.fixture
+def table():
+    return ReleaseTable.from_releases([release(i) for i in range(6)])
+
+
+def test_columns(table):
+    assert len(table) == 6
+    assert table["size"][0] == 1000 * 1024**2
+    assert table["time"].dtype == np.int64
+    assert list(table["nuke_rls"]) == [True, False] * 3
+
+
+def test_where(table):
+    assert len(table.where(group_name="GRP0")) == 2
+    assert len(table.where(group_name=["GRP0", "GRP1"], nuke_rls=True)) == 2
+
+
+def test_sort(table):
+    assert list(table.sort("time")["id"]) == [release(i)["id"] for i in range(5, -1, -1)]
+    assert list(table.sort("time", descending=True)["id"]) == [release(i)["id"] for i in range(6)]
+
+
+def test_group_by(table):
+    groups = table.group_by("group_name")
+    assert groups.count() == {"GRP0": 2, "GRP1": 2, "GRP2": 2}
+    assert groups.mean("num_ratings") == {"GRP0": 0.0, "GRP1": 0.0, "GRP2": 0.0}
+    assert groups.max("size") == {"GRP0": 1003 * 1024**2, "GRP1": 1004 * 1024**2, "GRP2": 1005 * 1024**2}
+    assert groups.min("time") == {"GRP0": release(3)["time"], "GRP1": release(4)["time"], "GRP2": release(5)["time"]}
+    assert groups.agg("id", len) == {"GRP0": 2, "GRP1": 2, "GRP2": 2}
+
+
+def test_rows_round_trip(table):
+    row = table[2]
+    assert row.id == release(2)["id"]
+    assert row.size.number == 1002 and row.size.unit == "MB"
+    assert row.ext_info.id == "e2"
+
+
+def test_concat_and_empty(table):
+    assert len(ReleaseTable.concat([table, table[:2]])) == 8
+    assert len(ReleaseTable.from_releases([])) == 0
+
+
+def test_sort_descending_keeps_ties_in_order():
+    table = ReleaseTable.from_releases([release(i, time=100 + i % 2) for i in range(6)])
+
+    assert list(table.sort("time", descending=True)["id"]) == [release(i)["id"] for i in (1, 3, 5, 0, 2, 4)]
+    assert list(table.sort("time")["id"]) == [release(i)["id"] for i in (0, 2, 4, 1, 3, 5)]
+
+
+def test_missing_values_sort_last_and_group_under_none():
+    releases = [release(i, proof_url=None if i % 3 == 0 else f"https://x/{i % 2}") for i in range(6)]
+    table = ReleaseTable.from_releases(releases)
+
+    for descending in (False, True):
+        assert list(table.sort("proof_url", descending)["proof_url"][-2:]) == [None, None]
+    assert list(table.sort("proof_url")["id"][:2]) == [release(2)["id"], release(4)["id"]]
+    assert table.group_by("proof_url").count() == {"https://x/0": 2, "https://x/1": 2, None: 2}
+    assert list(table.sort("tv_season")["id"]) == [release(i)["id"] for i in range(6)]
+
+
+def test_group_sum_keeps_integers(table):
+    sums = table.group_by("group_name").sum("size")
+    assert sums["GRP0"] == (1000 + 1003) * 1024**2 and isinstance(sums["GRP0"], int)
+    assert table.group_by("group_name").sum("nuke_rls") == {"GRP0": 1, "GRP1": 1, "GRP2": 1}
+
+
+def test_rows_validate_without_optional_fields():
+    p2p = {
+        "id": "p2p0",
+        "dirname": "Some.Movie.2023.1080p.WEB.h264-P2P",
+        "link_href": "https://www.xrel.to/p2p/0.html",
+        "main_lang": "English",
+        "pub_time": 1_700_000_000,
+        "size_mb": 2048,
+        "num_ratings": 0,
+        "ext_info": {"type": "movie", "id": "e0", "title": "Movie 0", "link_href": "https://www.xrel.to/movie/0.html"},
+        "comments": 0,
+    }
+    table = ReleaseTable.from_releases([release(0), p2p])
+
+    assert list(table.to_models("validate")) == [Release.model_validate(release(0)), ReleaseP2P.model_validate(p2p)]